@@ -2,35 +2,153 @@
 Auto-Dev Web Interface
 
 A simple web UI to control the Self-Healing Agent System.
-Just run: python app.py
+Just run: python app.py  (or: uvicorn app:app --port 5000)
 Then open: http://localhost:5000
+
+Served by Quart on Uvicorn, so requests and log streams are multiplexed
+on a single asyncio event loop instead of one thread per request. Agent
+runs execute in a process pool, so they never compete with the web tier
+for the GIL.
 """
 
-from flask import Flask, render_template_string, request, jsonify, Response
-import threading
-import queue
+from quart import Quart, request, jsonify, Response
+from quart.json.provider import DefaultJSONProvider
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field
+from itertools import islice
+from functools import lru_cache
+from typing import Optional
+import asyncio
+import atexit
+import gzip
+import hashlib
+import jinja2
+import multiprocessing
+import orjson
 import sys
+import threading
+import time
+import uuid
 from pathlib import Path
 
 # Add project root to path
-sys.path.insert(0, str(Path(__file__).parent))
+_ROOT = str(Path(__file__).parent)
+if _ROOT not in sys.path:  # Guard against duplicate entries
+    sys.path.insert(0, _ROOT)
 
 from config import config
 from state.schema import create_initial_state, state_summary
 from graph.workflow import run_workflow
+from tools.github_tools import parse_github_url
+from logging_config import flush_logs
 
-app = Flask(__name__)
 
-# Queue for real-time logs
-log_queue = queue.Queue()
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson, which is much faster for str-heavy payloads."""
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
-# Store for current job status
-current_job = {
-    "running": False,
-    "status": "idle",
-    "result": None,
-    "pr_url": None
+app = Quart(__name__)
+app.json = OrjsonProvider(app)
+app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 86400  # Static assets are versioned
+
+STATIC_DIR = Path(__file__).parent / "static"
+
+# Content hash of the static assets, appended as ?v=... for cache-busting
+ASSET_VERSION = hashlib.sha1(
+    b"".join(p.read_bytes() for p in sorted(STATIC_DIR.iterdir()))
+).hexdigest()[:10]
+
+# Responses worth gzipping (SSE streams are deliberately excluded)
+COMPRESSIBLE_MIMETYPES = {
+    "text/html",
+    "text/css",
+    "text/javascript",
+    "application/javascript",
+    "application/json",
 }
+MIN_COMPRESS_SIZE = 500  # bytes
+
+# Lines kept per job, in a ring buffer shared by /status and every SSE
+# subscriber (each tracks its own cursor), so a job's memory stays bounded
+# however long it runs and whether or not anyone is reading
+LOG_BUFFER_LINES = 1000
+STATUS_LOG_LINES = 100  # Most recent lines returned by /status
+MAX_FINISHED_JOBS = 20  # Finished jobs kept around for /status
+FINISHED_JOB_TTL = 600  # Seconds a finished job is kept before it's dropped
+MAX_CONCURRENT_JOBS = 2  # Worker processes running agent jobs
+
+
+@dataclass
+class JobState:
+    """Status and log stream of a single agent run."""
+    status: str = "starting"
+    pr_url: Optional[str] = None
+    history: deque = field(default_factory=lambda: deque(maxlen=LOG_BUFFER_LINES))  # Recent lines
+    log_count: int = 0  # Lines ever emitted; doubles as the client's log cursor
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+    new_lines: asyncio.Event = field(default_factory=asyncio.Event)  # Replaced after each wakeup
+    
+    @property
+    def running(self) -> bool:
+        return not self.done.is_set()
+    
+    def add_logs(self, lines):
+        """Record lines and wake every subscriber waiting for them."""
+        self.history.extend(lines)
+        self.log_count += len(lines)
+        self.wake()
+    
+    def wake(self):
+        """Wake all waiting subscribers (new lines, or the job finished)."""
+        self.new_lines.set()
+        self.new_lines = asyncio.Event()
+    
+    def lines_since(self, cursor: int):
+        """
+        Lines after `cursor` that are still buffered.
+        
+        Returns:
+            (cursor of the line before the first one returned, lines)
+        """
+        oldest = self.log_count - len(self.history)
+        start = max(cursor, oldest)
+        return start, tuple(islice(self.history, start - oldest, None))
+
+
+# All jobs started by this process, keyed by job id
+jobs: dict[str, JobState] = {}
+latest_job_id: Optional[str] = None
+
+# Keep references to running jobs so they aren't garbage collected
+background_tasks = set()
+
+# Jobs for the same repository run one after another, since they share
+# its workspace clone (WORK_DIR/<repo name>)
+repo_locks = defaultdict(asyncio.Lock)
+
+
+def _workspace_key(repo: str) -> str:
+    """The workspace directory a repo URL is cloned into (the URL itself if unparseable)."""
+    try:
+        return parse_github_url(repo)[1].lower()
+    except ValueError:
+        return repo
+
+# Agent jobs run in separate interpreters. "spawn" avoids forking a process
+# that already has an event loop and threads running.
+_mp_context = multiprocessing.get_context("spawn")
+EXECUTOR = ProcessPoolExecutor(max_workers=MAX_CONCURRENT_JOBS, mp_context=_mp_context)
+# Held while a job occupies a worker: a queued job gets no log queue or
+# pump (whose blocking get() ties up a default-executor thread) until then
+JOB_SLOTS = asyncio.Semaphore(MAX_CONCURRENT_JOBS)
+_log_manager = None  # Serves the cross-process log queues (started with the app)
 
 HTML_TEMPLATE = """
 <!DOCTYPE html>
@@ -39,219 +157,7 @@ HTML_TEMPLATE = """
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>🤖 Auto-Dev Agent</title>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        
-        body {
-            font-family: 'Segoe UI', system-ui, -apple-system, sans-serif;
-            background: linear-gradient(135deg, #1a1a2e 0%, #16213e 50%, #0f3460 100%);
-            min-height: 100vh;
-            color: #e4e4e4;
-        }
-        
-        .container {
-            max-width: 900px;
-            margin: 0 auto;
-            padding: 40px 20px;
-        }
-        
-        header {
-            text-align: center;
-            margin-bottom: 40px;
-        }
-        
-        h1 {
-            font-size: 2.5rem;
-            background: linear-gradient(90deg, #00d9ff, #00ff88);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            margin-bottom: 10px;
-        }
-        
-        .subtitle {
-            color: #888;
-            font-size: 1.1rem;
-        }
-        
-        .card {
-            background: rgba(255, 255, 255, 0.05);
-            border-radius: 16px;
-            padding: 30px;
-            margin-bottom: 20px;
-            border: 1px solid rgba(255, 255, 255, 0.1);
-            backdrop-filter: blur(10px);
-        }
-        
-        .form-group {
-            margin-bottom: 20px;
-        }
-        
-        label {
-            display: block;
-            margin-bottom: 8px;
-            font-weight: 500;
-            color: #00d9ff;
-        }
-        
-        input[type="text"], textarea {
-            width: 100%;
-            padding: 14px 16px;
-            border: 2px solid rgba(255, 255, 255, 0.1);
-            border-radius: 10px;
-            background: rgba(0, 0, 0, 0.3);
-            color: #fff;
-            font-size: 1rem;
-            transition: all 0.3s ease;
-        }
-        
-        input[type="text"]:focus, textarea:focus {
-            outline: none;
-            border-color: #00d9ff;
-            box-shadow: 0 0 20px rgba(0, 217, 255, 0.2);
-        }
-        
-        textarea {
-            min-height: 100px;
-            resize: vertical;
-        }
-        
-        .btn {
-            padding: 14px 32px;
-            border: none;
-            border-radius: 10px;
-            font-size: 1.1rem;
-            font-weight: 600;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            width: 100%;
-        }
-        
-        .btn-primary {
-            background: linear-gradient(90deg, #00d9ff, #00ff88);
-            color: #1a1a2e;
-        }
-        
-        .btn-primary:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 10px 30px rgba(0, 217, 255, 0.3);
-        }
-        
-        .btn-primary:disabled {
-            background: #555;
-            color: #999;
-            cursor: not-allowed;
-            transform: none;
-            box-shadow: none;
-        }
-        
-        .status-bar {
-            display: flex;
-            align-items: center;
-            gap: 10px;
-            padding: 15px;
-            border-radius: 10px;
-            margin-bottom: 20px;
-        }
-        
-        .status-idle { background: rgba(100, 100, 100, 0.3); }
-        .status-running { background: rgba(0, 217, 255, 0.2); }
-        .status-success { background: rgba(0, 255, 136, 0.2); }
-        .status-error { background: rgba(255, 100, 100, 0.2); }
-        
-        .spinner {
-            width: 20px;
-            height: 20px;
-            border: 3px solid rgba(255,255,255,0.3);
-            border-top-color: #00d9ff;
-            border-radius: 50%;
-            animation: spin 1s linear infinite;
-        }
-        
-        @keyframes spin {
-            to { transform: rotate(360deg); }
-        }
-        
-        .log-container {
-            background: #0a0a15;
-            border-radius: 10px;
-            padding: 20px;
-            font-family: 'Consolas', 'Monaco', monospace;
-            font-size: 0.9rem;
-            max-height: 400px;
-            overflow-y: auto;
-            line-height: 1.6;
-        }
-        
-        .log-container::-webkit-scrollbar {
-            width: 8px;
-        }
-        
-        .log-container::-webkit-scrollbar-thumb {
-            background: #333;
-            border-radius: 4px;
-        }
-        
-        .pr-link {
-            display: inline-block;
-            padding: 12px 24px;
-            background: linear-gradient(90deg, #00ff88, #00d9ff);
-            color: #1a1a2e;
-            text-decoration: none;
-            border-radius: 10px;
-            font-weight: 600;
-            margin-top: 15px;
-            transition: all 0.3s ease;
-        }
-        
-        .pr-link:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 10px 30px rgba(0, 255, 136, 0.3);
-        }
-        
-        .config-status {
-            display: flex;
-            gap: 20px;
-            flex-wrap: wrap;
-            margin-bottom: 20px;
-        }
-        
-        .config-item {
-            display: flex;
-            align-items: center;
-            gap: 8px;
-            font-size: 0.9rem;
-        }
-        
-        .config-ok { color: #00ff88; }
-        .config-missing { color: #ff6b6b; }
-        
-        .examples {
-            margin-top: 20px;
-            padding-top: 20px;
-            border-top: 1px solid rgba(255,255,255,0.1);
-        }
-        
-        .example-btn {
-            padding: 8px 16px;
-            background: rgba(255,255,255,0.1);
-            border: 1px solid rgba(255,255,255,0.2);
-            border-radius: 20px;
-            color: #ddd;
-            cursor: pointer;
-            font-size: 0.85rem;
-            margin: 5px;
-            transition: all 0.2s;
-        }
-        
-        .example-btn:hover {
-            background: rgba(0, 217, 255, 0.2);
-            border-color: #00d9ff;
-        }
-    </style>
+    <link rel="stylesheet" href="/static/app.css?v={{ asset_version }}">
 </head>
 <body>
     <div class="container">
@@ -325,216 +231,342 @@ HTML_TEMPLATE = """
         </div>
     </div>
     
-    <script>
-        function setExample(text) {
-            document.getElementById('request').value = text;
-        }
-        
-        document.getElementById('agentForm').addEventListener('submit', async (e) => {
-            e.preventDefault();
-            
-            const repo = document.getElementById('repo').value;
-            const request = document.getElementById('request').value;
-            const branch = document.getElementById('branch').value;
-            
-            if (!repo || !request) {
-                alert('Please fill in the repository URL and task description');
-                return;
-            }
-            
-            // Update UI
-            document.getElementById('submitBtn').disabled = true;
-            document.getElementById('submitBtn').textContent = '⏳ Running...';
-            document.getElementById('statusBar').className = 'status-bar status-running';
-            document.getElementById('statusIcon').innerHTML = '<div class="spinner"></div>';
-            document.getElementById('statusText').textContent = 'Agent is working...';
-            document.getElementById('logContainer').innerHTML = '';
-            document.getElementById('prResult').style.display = 'none';
-            
-            try {
-                const response = await fetch('/run', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({repo, request, branch})
-                });
-                
-                const result = await response.json();
-                
-                // Start polling for logs
-                pollLogs();
-                
-            } catch (error) {
-                showError('Failed to start agent: ' + error.message);
-            }
-        });
-        
-        async function pollLogs() {
-            try {
-                const response = await fetch('/status');
-                const data = await response.json();
-                
-                // Update logs
-                if (data.logs && data.logs.length > 0) {
-                    const logContainer = document.getElementById('logContainer');
-                    logContainer.innerHTML = data.logs.map(log => 
-                        `<div>${log}</div>`
-                    ).join('');
-                    logContainer.scrollTop = logContainer.scrollHeight;
-                }
-                
-                // Check if still running
-                if (data.running) {
-                    setTimeout(pollLogs, 500);
-                } else {
-                    // Finished
-                    document.getElementById('submitBtn').disabled = false;
-                    document.getElementById('submitBtn').textContent = '🚀 Run Agent';
-                    
-                    if (data.pr_url) {
-                        document.getElementById('statusBar').className = 'status-bar status-success';
-                        document.getElementById('statusIcon').textContent = '✅';
-                        document.getElementById('statusText').textContent = 'Success! PR created.';
-                        document.getElementById('prLink').href = data.pr_url;
-                        document.getElementById('prResult').style.display = 'block';
-                    } else if (data.status === 'failed') {
-                        document.getElementById('statusBar').className = 'status-bar status-error';
-                        document.getElementById('statusIcon').textContent = '❌';
-                        document.getElementById('statusText').textContent = 'Failed. Check logs below.';
-                    } else {
-                        document.getElementById('statusBar').className = 'status-bar status-idle';
-                        document.getElementById('statusIcon').textContent = '⏸️';
-                        document.getElementById('statusText').textContent = 'Ready';
-                    }
-                }
-            } catch (error) {
-                console.error('Poll error:', error);
-                setTimeout(pollLogs, 1000);
-            }
-        }
-        
-        function showError(message) {
-            document.getElementById('submitBtn').disabled = false;
-            document.getElementById('submitBtn').textContent = '🚀 Run Agent';
-            document.getElementById('statusBar').className = 'status-bar status-error';
-            document.getElementById('statusIcon').textContent = '❌';
-            document.getElementById('statusText').textContent = message;
-        }
-    </script>
+    <script src="/static/app.js?v={{ asset_version }}"></script>
 </body>
 </html>
 """
 
-# Store logs for the web UI
-logs = []
+# Compile the page template once instead of re-parsing it on every request
+_TEMPLATE = jinja2.Environment(autoescape=True).from_string(HTML_TEMPLATE)
+
+# How long a Docker availability probe result is reused (seconds)
+DOCKER_PROBE_TTL = 60
+_docker_probe = (float("-inf"), False)  # (checked_at, docker_ok)
+_docker_sandbox = None  # Shared by all probes, created on first use
+
 
 class WebLogger:
-    """Custom logger that captures output for the web UI."""
-    def __init__(self):
-        self.logs = []
+    """
+    Custom logger that captures a job's output for the web UI stream.
+    
+    Writes are buffered until a newline arrives, so a print() that emits
+    its text and "\n" separately costs one hand-off per line. Complete
+    lines are passed in batches to `publish`.
+    
+    Writes come from both the job's own thread and the logging listener
+    thread, so the buffer is guarded by a lock.
+    """
+    def __init__(self, publish):
+        self._publish_lines = publish
+        self._buf = []
+        self._lock = threading.Lock()
         
     def write(self, message):
-        if message.strip():
-            self.logs.append(message.strip())
-            # Also print to console
-            sys.__stdout__.write(message)
+        with self._lock:
+            self._buf.append(message)
+            if "\n" not in message:
+                return
+            
+            text = "".join(self._buf)
+            complete, _, partial = text.rpartition("\n")
+            self._buf = [partial] if partial else []
+            self._publish(complete + "\n")
+    
+    def _publish(self, text):
+        lines = [line.rstrip() for line in text.split("\n") if line.strip()]
+        if lines:
+            self._publish_lines(lines)
+        # Also print to console
+        sys.__stdout__.write(text)
             
     def flush(self):
-        pass
+        """Publish any buffered partial line."""
+        with self._lock:
+            if self._buf:
+                text = "".join(self._buf)
+                self._buf = []
+                self._publish(text)
 
-web_logger = WebLogger()
 
-@app.route('/')
-def index():
-    """Main page."""
-    groq_ok = bool(config.GROQ_API_KEY)
-    github_ok = bool(config.GITHUB_TOKEN)
+def _run_job_in_worker(log_queue, repo: str, task: str, branch: str) -> dict:
+    """
+    Run one workflow inside a worker process.
     
-    # Check Docker
-    docker_ok = False
-    try:
-        from tools.docker_sandbox import DockerSandbox
-        sandbox = DockerSandbox()
-        docker_ok, _ = sandbox.check_docker_available()
-        sandbox.cleanup()
-    except:
-        pass
+    Output is streamed to the parent through `log_queue`. A worker runs a
+    single job at a time, so redirecting its stdout is safe.
+    """
+    web_logger = WebLogger(log_queue.put)
+    with redirect_stdout(web_logger):
+        try:
+            result = run_workflow(
+                repo_url=repo,
+                user_request=task,
+                branch_name=branch,
+                verbose=True
+            )
+        finally:
+            flush_logs()  # Drain queued log records into web_logger first
+            web_logger.flush()
     
-    return render_template_string(
-        HTML_TEMPLATE,
+    return {"status": result.get("status", "unknown"), "pr_url": result.get("pr_url")}
+
+
+async def _pump_logs(job: JobState, log_queue):
+    """Move a worker's log lines into the job until the None sentinel arrives."""
+    loop = asyncio.get_running_loop()
+    while True:
+        lines = await loop.run_in_executor(None, log_queue.get)
+        if lines is None:
+            return
+        job.add_logs(lines)
+
+def _get_docker_sandbox():
+    """Return the shared sandbox used for readiness probes."""
+    global _docker_sandbox
+    if _docker_sandbox is None:
+        from tools.docker_sandbox import DockerSandbox
+        _docker_sandbox = DockerSandbox()
+        atexit.register(_docker_sandbox.cleanup)
+    return _docker_sandbox
+
+def _check_docker() -> bool:
+    """Probe the Docker daemon (blocking)."""
+    try:
+        docker_ok, _ = _get_docker_sandbox().check_docker_available()
+        return docker_ok
+    except ImportError:
+        # Docker SDK not installed
+        return False
+
+async def _docker_available() -> bool:
+    """Docker availability, re-probed at most once per DOCKER_PROBE_TTL seconds."""
+    global _docker_probe
+    checked_at, docker_ok = _docker_probe
+    if time.monotonic() - checked_at > DOCKER_PROBE_TTL:
+        # Probe without blocking the event loop
+        docker_ok = await asyncio.to_thread(_check_docker)
+        _docker_probe = (time.monotonic(), docker_ok)
+    return docker_ok
+
+@lru_cache(maxsize=8)
+def _render_index(groq_ok: bool, github_ok: bool, docker_ok: bool) -> str:
+    """Render the main page; the output only depends on the three flags."""
+    return _TEMPLATE.render(
         groq_ok=groq_ok,
         github_ok=github_ok,
         docker_ok=docker_ok,
-        default_repo=""
+        default_repo="",
+        asset_version=ASSET_VERSION
     )
 
-@app.route('/run', methods=['POST'])
-def run_agent():
-    """Start the agent."""
-    global current_job
+@app.after_request
+async def add_caching_and_compression(response):
+    """Long-cache static assets and gzip text responses."""
+    if request.path.startswith("/static/"):
+        response.headers["Cache-Control"] = "public, max-age=86400, immutable"
+    
+    if (
+        response.status_code != 200
+        or response.mimetype not in COMPRESSIBLE_MIMETYPES
+        or "Content-Encoding" in response.headers
+        or "gzip" not in request.headers.get("Accept-Encoding", "")
+    ):
+        return response
     
-    if current_job["running"]:
-        return jsonify({"error": "Agent is already running"}), 400
+    data = await response.get_data()
+    if len(data) < MIN_COMPRESS_SIZE:
+        return response
     
-    data = request.json
+    response.set_data(gzip.compress(data))
+    response.headers["Content-Encoding"] = "gzip"
+    response.vary.add("Accept-Encoding")
+    return response
+
+@app.before_serving
+async def start_log_manager():
+    """Start the process that hosts cross-process log queues."""
+    global _log_manager
+    _log_manager = await asyncio.to_thread(_mp_context.Manager)
+
+@app.after_serving
+async def shutdown_workers():
+    """Stop the worker pool and the log queue manager."""
+    await asyncio.to_thread(EXECUTOR.shutdown, cancel_futures=True)
+    if _log_manager is not None:
+        _log_manager.shutdown()
+
+@app.route('/')
+async def index():
+    """Main page."""
+    groq_ok = bool(config.GROQ_API_KEY)
+    github_ok = bool(config.GITHUB_TOKEN)
+    docker_ok = await _docker_available()
+    
+    return _render_index(groq_ok, github_ok, docker_ok)
+
+@app.route('/run', methods=['POST'])
+async def run_agent():
+    """Start the agent as a new job."""
+    global latest_job_id
+    
+    data = await request.get_json()
     repo = data.get('repo')
     task = data.get('request')
     branch = data.get('branch', 'auto-dev-feature')
     
-    # Reset state
-    current_job = {
-        "running": True,
-        "status": "starting",
-        "result": None,
-        "pr_url": None
-    }
-    web_logger.logs = []
+    _prune_finished_jobs()
     
-    # Run in background thread
-    def run_task():
-        global current_job
-        try:
-            # Redirect stdout to capture logs
-            old_stdout = sys.stdout
-            sys.stdout = web_logger
-            
-            result = run_workflow(
-                repo_url=repo,
-                user_request=task,
-                branch_name=branch,
-                verbose=True
-            )
-            
-            sys.stdout = old_stdout
-            
-            current_job["result"] = result
-            current_job["status"] = result.get("status", "unknown")
-            current_job["pr_url"] = result.get("pr_url")
+    job_id = uuid.uuid4().hex
+    job = JobState()
+    jobs[job_id] = job
+    latest_job_id = job_id
+    
+    # Run as a background task; the workflow itself runs in a worker process
+    async def run_task():
+        loop = asyncio.get_running_loop()
+        # Wait for any other job on this repo to finish, then for a free worker
+        async with repo_locks[_workspace_key(repo)], JOB_SLOTS:
+            log_queue = pump = None
+            error_line = None
+            try:
+                # Inside the try: if the manager is gone, the job still finishes
+                # (as failed) and its /stream clients aren't left waiting
+                log_queue = await loop.run_in_executor(None, _log_manager.Queue)
+                pump = asyncio.create_task(_pump_logs(job, log_queue))
+                outcome = await asyncio.wrap_future(
+                    EXECUTOR.submit(_run_job_in_worker, log_queue, repo, task, branch)
+                )
+                job.status = outcome["status"]
+                job.pr_url = outcome["pr_url"]
             
-        except Exception as e:
-            current_job["status"] = "failed"
-            web_logger.logs.append(f"❌ Error: {str(e)}")
-        finally:
-            current_job["running"] = False
+            except Exception as e:
+                job.status = "failed"
+                error_line = f"❌ Error: {str(e)}"
+            finally:
+                # The worker has finished writing; end the pump after its last line
+                if pump is not None:
+                    try:
+                        await loop.run_in_executor(None, log_queue.put, None)
+                        await pump
+                    except Exception as e:
+                        pump.cancel()
+                        error_line = error_line or f"❌ Error: {str(e)}"
+                if error_line:
+                    job.add_logs([error_line])
+                job.done.set()
+                job.wake()
+                # Keep the finished job around briefly for /status, then drop it
+                loop.call_later(FINISHED_JOB_TTL, _drop_job, job_id, job)
+    
+    worker = asyncio.create_task(run_task())
+    background_tasks.add(worker)
+    worker.add_done_callback(background_tasks.discard)
+    
+    return jsonify({"status": "started", "job_id": job_id})
+
+def _drop_job(job_id: str, job: JobState):
+    """Forget a finished job (unless its id was reused)."""
+    if jobs.get(job_id) is job:
+        del jobs[job_id]
+
+def _prune_finished_jobs():
+    """Forget the oldest finished jobs so memory stays bounded."""
+    finished = [job_id for job_id, job in jobs.items() if not job.running]
+    for job_id in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+        del jobs[job_id]
+
+def _sse(data: str, event: str = None, event_id: int = None) -> str:
+    """Format a Server-Sent Events frame (multi-line data is split per the spec)."""
+    frame = f"id: {event_id}\n" if event_id is not None else ""
+    frame += f"event: {event}\n" if event else ""
+    frame += "".join(f"data: {line}\n" for line in data.split("\n"))
+    return frame + "\n"
+
+@app.route('/stream/<job_id>')
+async def stream_logs(job_id):
+    """
+    Stream a job's logs to the browser as Server-Sent Events until it finishes.
+    
+    Every subscriber reads the job's ring buffer from its own cursor, so
+    several clients each get every line. A reconnecting EventSource
+    resumes after its Last-Event-ID.
+    """
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown job"}), 404
     
-    thread = threading.Thread(target=run_task)
-    thread.start()
+    cursor = request.headers.get("Last-Event-ID", default=0, type=int)
     
-    return jsonify({"status": "started"})
+    async def generate():
+        nonlocal cursor
+        while True:
+            finished = not job.running
+            wakeup = job.new_lines  # Taken before reading, so no line is missed
+            start, lines = job.lines_since(cursor)
+            for event_id, line in enumerate(lines, start + 1):
+                yield _sse(line, event_id=event_id)
+            cursor = start + len(lines)
+            if finished:
+                break
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=1)
+            except asyncio.TimeoutError:
+                pass
+        
+        yield _sse(
+            orjson.dumps({"status": job.status, "pr_url": job.pr_url}).decode(),
+            event="done"
+        )
+    
+    response = Response(
+        generate(),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache'}
+    )
+    response.timeout = None  # The stream lives as long as the job
+    return response
 
-@app.route('/status')
-def get_status():
-    """Get current status and logs."""
+@app.route('/status', defaults={'job_id': None})
+@app.route('/status/<job_id>')
+async def get_status(job_id):
+    """
+    Get a job's status and logs (the most recent job if no id is given).
+    
+    Pass ?since=<cursor> to receive only lines after a previous response's
+    cursor (at most the last STATUS_LOG_LINES); otherwise the whole window.
+    """
+    job_id = job_id or latest_job_id
+    job = jobs.get(job_id) if job_id else None
+    if job is None:
+        return jsonify({
+            "job_id": None,
+            "running": False,
+            "status": "idle",
+            "pr_url": None,
+            "logs": [],
+            "cursor": 0
+        })
+    
+    # Cursor just before the /status window (the last STATUS_LOG_LINES lines)
+    window = job.log_count - min(len(job.history), STATUS_LOG_LINES)
+    since = request.args.get("since", default=window, type=int)
+    _, logs = job.lines_since(max(since, window))
+    
     return jsonify({
-        "running": current_job["running"],
-        "status": current_job["status"],
-        "pr_url": current_job["pr_url"],
-        "logs": web_logger.logs[-100:]  # Last 100 lines
+        "job_id": job_id,
+        "running": job.running,
+        "status": job.status,
+        "pr_url": job.pr_url,
+        "logs": logs,
+        "cursor": job.log_count
     })
 
 
 if __name__ == '__main__':
+    import uvicorn
+    
     print("\n" + "=" * 50)
     print("🤖 Auto-Dev Web Interface")
     print("=" * 50)
     print("\n🌐 Open in your browser: http://localhost:5000\n")
-    app.run(debug=False, port=5000, threaded=True)
+    uvicorn.run(app, host="127.0.0.1", port=5000, workers=1)
@@ -6,59 +6,107 @@ Uses Groq API for fast, free LLM access with LLaMA 3 models.
 """
 
 import os
+from dataclasses import dataclass, field
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
 
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Central configuration class."""
+    """Central configuration, read from the environment once at import."""
     
     # Groq Configuration (Free LLM API)
-    GROQ_API_KEY: str = os.getenv("GROQ_API_KEY", "")
+    GROQ_API_KEY: str = field(default="", repr=False)
     
     # Available Groq Models (as of 2024):
     # - llama-3.3-70b-versatile (best for coding, 128k context)
     # - llama-3.1-8b-instant (faster, good for simple tasks)
     # - mixtral-8x7b-32768 (good balance)
     # - gemma2-9b-it (Google's model)
-    GROQ_MODEL: str = os.getenv("GROQ_MODEL", "llama-3.3-70b-versatile")
+    GROQ_MODEL: str = "llama-3.3-70b-versatile"
     
     # GitHub Configuration
-    GITHUB_TOKEN: str = os.getenv("GITHUB_TOKEN", "")
+    GITHUB_TOKEN: str = field(default="", repr=False)
     
     # Docker Configuration
-    DOCKER_IMAGE: str = os.getenv("DOCKER_IMAGE", "python:3.10-slim")
-    DOCKER_TIMEOUT: int = int(os.getenv("DOCKER_TIMEOUT", "60"))
+    DOCKER_IMAGE: str = "python:3.10-slim"
+    DOCKER_TIMEOUT: int = 60
     
     # Agent Configuration
-    MAX_RETRY_ATTEMPTS: int = int(os.getenv("MAX_RETRY_ATTEMPTS", "3"))
-    WORK_DIR: str = os.getenv("WORK_DIR", "./workspace")
+    MAX_RETRY_ATTEMPTS: int = 3
+    WORK_DIR: str = "./workspace"
     
-    @classmethod
-    def validate(cls) -> list[str]:
+    # Also clone git submodules (runs on the host, outside the sandbox,
+    # and fetches URLs chosen by the target repo - off unless trusted)
+    CLONE_SUBMODULES: bool = False
+    
+    def __post_init__(self):
+        """Reject invalid numeric settings at startup rather than on first use."""
+        if self.DOCKER_TIMEOUT <= 0:
+            raise ValueError(f"DOCKER_TIMEOUT must be positive, got {self.DOCKER_TIMEOUT}")
+        if self.MAX_RETRY_ATTEMPTS < 1:
+            raise ValueError(f"MAX_RETRY_ATTEMPTS must be at least 1, got {self.MAX_RETRY_ATTEMPTS}")
+    
+    def validate(self) -> list[str]:
         """Validate required configuration. Returns list of missing keys."""
         missing = []
-        if not cls.GROQ_API_KEY:
+        if not self.GROQ_API_KEY:
             missing.append("GROQ_API_KEY")
-        if not cls.GITHUB_TOKEN:
+        if not self.GITHUB_TOKEN:
             missing.append("GITHUB_TOKEN")
         return missing
     
-    @classmethod
-    def print_status(cls):
+    def print_status(self):
         """Print configuration status (without revealing secrets)."""
         print("=== Configuration Status ===")
-        print(f"Groq API Key: {'✓ Set' if cls.GROQ_API_KEY else '✗ Missing'}")
-        print(f"Groq Model: {cls.GROQ_MODEL}")
-        print(f"GitHub Token: {'✓ Set' if cls.GITHUB_TOKEN else '✗ Missing'}")
-        print(f"Docker Image: {cls.DOCKER_IMAGE}")
-        print(f"Docker Timeout: {cls.DOCKER_TIMEOUT}s")
-        print(f"Max Retry Attempts: {cls.MAX_RETRY_ATTEMPTS}")
-        print(f"Work Directory: {cls.WORK_DIR}")
+        print(f"Groq API Key: {'✓ Set' if self.GROQ_API_KEY else '✗ Missing'}")
+        print(f"Groq Model: {self.GROQ_MODEL}")
+        print(f"GitHub Token: {'✓ Set' if self.GITHUB_TOKEN else '✗ Missing'}")
+        print(f"Docker Image: {self.DOCKER_IMAGE}")
+        print(f"Docker Timeout: {self.DOCKER_TIMEOUT}s")
+        print(f"Max Retry Attempts: {self.MAX_RETRY_ATTEMPTS}")
+        print(f"Work Directory: {self.WORK_DIR}")
+        print(f"Clone Submodules: {'Yes' if self.CLONE_SUBMODULES else 'No'}")
         print("============================")
 
 
+def _env_int(name: str, default: int) -> int:
+    """Read an integer environment variable with a readable error."""
+    raw = os.getenv(name, str(default))
+    try:
+        return int(raw)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got {raw!r}") from None
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """Read a boolean environment variable (1/true/yes/on or 0/false/no/off)."""
+    raw = os.getenv(name)
+    if raw is None or not raw.strip():
+        return default
+    value = raw.strip().lower()
+    if value in ("1", "true", "yes", "on"):
+        return True
+    if value in ("0", "false", "no", "off"):
+        return False
+    raise ValueError(f"{name} must be a boolean (true/false), got {raw!r}")
+
+
+def _load_config() -> Config:
+    """Build the configuration from environment variables."""
+    return Config(
+        GROQ_API_KEY=os.getenv("GROQ_API_KEY", ""),
+        GROQ_MODEL=os.getenv("GROQ_MODEL", "llama-3.3-70b-versatile"),
+        GITHUB_TOKEN=os.getenv("GITHUB_TOKEN", ""),
+        DOCKER_IMAGE=os.getenv("DOCKER_IMAGE", "python:3.10-slim"),
+        DOCKER_TIMEOUT=_env_int("DOCKER_TIMEOUT", 60),
+        MAX_RETRY_ATTEMPTS=_env_int("MAX_RETRY_ATTEMPTS", 3),
+        WORK_DIR=os.getenv("WORK_DIR", "./workspace"),
+        CLONE_SUBMODULES=_env_bool("CLONE_SUBMODULES", False),
+    )
+
+
 # Create a singleton instance
-config = Config()
+config = _load_config()
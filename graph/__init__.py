@@ -1,5 +1,5 @@
 """Graph module for the Self-Healing Agent System."""
 
-from graph.workflow import create_workflow, run_workflow
+from graph.workflow import create_workflow, run_workflow, arun_workflow, run_batch
 
-__all__ = ["create_workflow", "run_workflow"]
+__all__ = ["create_workflow", "run_workflow", "arun_workflow", "run_batch"]
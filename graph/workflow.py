@@ -1,7 +1,11 @@
 """
 LangGraph Workflow for the Self-Healing Agent System.
 
-This module assembles the cyclic graph:
+This module assembles the cyclic graph. The Architect phase fans out after
+cloning so the file scan and key-file reads run in parallel:
+
+    clone ──┬──▶ scan ──────────┬──▶ architect
+            └──▶ load_context ──┘
 
     ┌──────────┐     ┌───────────┐     ┌──────────┐     ┌──────────┐
     │ Architect│ ──▶ │ Developer │ ──▶ │ Executor │ ──▶ │ Reviewer │
@@ -21,28 +25,50 @@ This module assembles the cyclic graph:
                      └────────────────────────────────────────┘
 """
 
-from typing import Literal
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from functools import lru_cache
+from typing import List, Literal, Union
 from langgraph.graph import StateGraph, END
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from state.schema import AgentState
-from nodes.architect import architect_node
+from nodes.architect import clone_node, scan_node, load_context_node, architect_node
 from nodes.developer import developer_node
 from nodes.executor import executor_node
 from nodes.reviewer import reviewer_node, get_next_node
 from nodes.publisher import publisher_node
+from tools.docker_sandbox import prefetch_image
+from tools.github_tools import aclose_async_client
 from config import config
+from logging_config import get_logger
+
 
+logger = get_logger(__name__)
 
+
+@lru_cache(maxsize=1)
 def create_workflow() -> StateGraph:
+    """
+    Return the compiled workflow, building it on first use.
+    
+    The compiled graph holds no per-run state (each invocation gets its
+    own), so one instance is shared by every run.
+    
+    Returns:
+        Compiled StateGraph ready to execute
+    """
+    return _build_workflow()
+
+
+def _build_workflow() -> StateGraph:
     """
     Create the LangGraph workflow with all nodes and edges.
     
     The workflow implements a self-healing loop:
-    1. Architect analyzes the repo and creates a plan
+    1. Architect clones the repo, scans it and reads key files in
+       parallel, then creates a plan
     2. Developer implements the changes
     3. Executor runs tests in Docker
     4. Reviewer decides: publish, retry, or fail
@@ -55,6 +81,9 @@ def create_workflow() -> StateGraph:
     workflow = StateGraph(AgentState)
     
     # Add all nodes
+    workflow.add_node("clone", clone_node)
+    workflow.add_node("scan", scan_node)
+    workflow.add_node("load_context", load_context_node)
     workflow.add_node("architect", architect_node)
     workflow.add_node("developer", developer_node)
     workflow.add_node("executor", executor_node)
@@ -62,7 +91,17 @@ def create_workflow() -> StateGraph:
     workflow.add_node("publisher", publisher_node)
     
     # Set the entry point
-    workflow.set_entry_point("architect")
+    workflow.set_entry_point("clone")
+    
+    # Fan out after cloning: scan and load_context run in the same step
+    workflow.add_conditional_edges(
+        "clone",
+        _route_after_clone,
+        ["scan", "load_context", END]
+    )
+    
+    # Join: the Architect waits for both parallel branches
+    workflow.add_edge(["scan", "load_context"], "architect")
     
     # Add edges (linear flow where not conditional)
     workflow.add_edge("architect", "developer")
@@ -87,6 +126,48 @@ def create_workflow() -> StateGraph:
     return workflow.compile()
 
 
+async def _ainvoke(initial_state: AgentState) -> AgentState:
+    """Run the shared compiled workflow on one initial state."""
+    prefetch_image()  # Pull the sandbox image while the agents plan and code
+    
+    return await create_workflow().ainvoke(initial_state)
+
+
+async def _ainvoke_once(initial_state: AgentState) -> AgentState:
+    """
+    Run the workflow as the only work on its event loop (see run_workflow).
+    
+    The loop's shared GitHub HTTP client is closed afterwards, since
+    asyncio.run() ends the loop along with this coroutine.
+    """
+    try:
+        return await _ainvoke(initial_state)
+    finally:
+        await aclose_async_client()
+
+
+def _route_after_clone(state: AgentState) -> Union[List[str], str]:
+    """
+    Routing function for the fan-out after cloning.
+    
+    Args:
+        state: Current agent state
+    
+    Returns:
+        Both parallel analysis nodes, or END if the clone failed
+    """
+    if state.get("status") == "failed":
+        return END
+    return ["scan", "load_context"]
+
+
+# Reviewer status -> next node
+_REVIEW_ROUTES = {
+    "publishing": "publisher",
+    "developing": "developer",
+}
+
+
 def _route_after_review(state: AgentState) -> Literal["developer", "publisher", "end"]:
     """
     Routing function for the conditional edge after Reviewer.
@@ -97,14 +178,8 @@ def _route_after_review(state: AgentState) -> Literal["developer", "publisher",
     Returns:
         Next node name or "end"
     """
-    status = state.get("status", "")
-    
-    if status == "publishing":
-        return "publisher"
-    elif status == "developing":
-        return "developer"
-    else:  # "failed" or unknown
-        return "end"
+    # "failed" or unknown statuses end the run
+    return _REVIEW_ROUTES.get(state.get("status", ""), "end")
 
 
 def run_workflow(
@@ -129,15 +204,15 @@ def run_workflow(
     """
     from state.schema import create_initial_state, state_summary
     
-    if verbose:
-        print("=" * 60)
-        print("🤖 SELF-HEALING AGENT SYSTEM")
-        print("=" * 60)
-        print(f"\n📦 Repository: {repo_url}")
-        print(f"📝 Request: {user_request}")
-        print(f"🌿 Branch: {branch_name}")
-        print(f"🔄 Max Retries: {config.MAX_RETRY_ATTEMPTS}")
-        print("\n" + "=" * 60)
+    if verbose and logger.isEnabledFor(logging.INFO):
+        logger.info("=" * 60)
+        logger.info("🤖 SELF-HEALING AGENT SYSTEM")
+        logger.info("=" * 60)
+        logger.info("\n📦 Repository: %s", repo_url)
+        logger.info("📝 Request: %s", user_request)
+        logger.info("🌿 Branch: %s", branch_name)
+        logger.info("🔄 Max Retries: %s", config.MAX_RETRY_ATTEMPTS)
+        logger.info("\n" + "=" * 60)
     
     # Create initial state
     initial_state = create_initial_state(
@@ -146,44 +221,116 @@ def run_workflow(
         branch_name=branch_name
     )
     
-    # Create and execute the workflow
-    workflow = create_workflow()
-    
     try:
-        # Run the graph
-        final_state = workflow.invoke(initial_state)
+        # Run the (cached) graph (ainvoke, since the Architect node is async)
+        final_state = asyncio.run(_ainvoke_once(initial_state))
         
         if verbose:
-            print("\n" + "=" * 60)
-            print("🏁 WORKFLOW COMPLETE")
-            print("=" * 60)
-            print(state_summary(final_state))
+            logger.info("\n" + "=" * 60)
+            logger.info("🏁 WORKFLOW COMPLETE")
+            logger.info("=" * 60)
+            # Only build the summary if it will actually be written
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(state_summary(final_state))
             
             # Print final result
             status = final_state.get("status", "unknown")
-            if status == "completed":
-                pr_url = final_state.get("pr_url", "N/A")
-                print(f"\n✅ SUCCESS! Pull Request created:")
-                print(f"   🔗 {pr_url}")
+            if status == "completed" and not final_state.get("pr_url"):
+                logger.info("\n✅ SUCCESS! No changes were needed - nothing to publish")
+            elif status == "completed":
+                logger.info("\n✅ SUCCESS! Pull Request created:")
+                logger.info("   🔗 %s", final_state['pr_url'])
             elif status == "failed":
-                print(f"\n❌ FAILED after {final_state.get('attempt_count', 0)} attempts")
+                logger.error("\n❌ FAILED after %s attempts", final_state.get('attempt_count', 0))
                 if final_state.get("error_history"):
-                    print("\nError History:")
+                    logger.info("\nError History:")
                     for error in final_state["error_history"]:
-                        print(f"   • {error}")
+                        logger.info("   • %s", error)
             else:
-                print(f"\n⚠️ Ended with status: {status}")
+                logger.warning("\n⚠️ Ended with status: %s", status)
         
         return final_state
         
     except Exception as e:
         if verbose:
-            print(f"\n💥 CRITICAL ERROR: {e}")
+            logger.error("\n💥 CRITICAL ERROR: %s", e)
+        initial_state["status"] = "failed"
+        initial_state["error_history"] = [f"Critical error: {str(e)}"]
+        return initial_state
+
+
+async def arun_workflow(
+    repo_url: str,
+    user_request: str,
+    branch_name: str = "auto-dev-feature"
+) -> AgentState:
+    """
+    Execute the complete workflow on the running event loop.
+    
+    Unlike run_workflow this prints no summary, so several runs can be
+    awaited together (see run_batch). The loop's shared GitHub HTTP
+    client stays open for them; await tools.github_tools.aclose_async_client()
+    once the last run is done.
+    
+    Args:
+        repo_url: GitHub repository URL
+        user_request: The task to implement
+        branch_name: Name for the feature branch
+    
+    Returns:
+        Final agent state with results
+    """
+    from state.schema import create_initial_state
+    
+    initial_state = create_initial_state(
+        repo_url=repo_url,
+        user_request=user_request,
+        branch_name=branch_name
+    )
+    
+    try:
+        return await _ainvoke(initial_state)
+    except Exception as e:
+        logger.error("\n💥 CRITICAL ERROR (%s): %s", repo_url, e)
         initial_state["status"] = "failed"
         initial_state["error_history"] = [f"Critical error: {str(e)}"]
         return initial_state
 
 
+async def run_batch(path: str, max_concurrency: int = 10) -> List[AgentState]:
+    """
+    Run every task in a JSON Lines file concurrently.
+    
+    Each line holds create_initial_state arguments, e.g.
+    {"repo_url": "...", "user_request": "...", "branch_name": "..."}
+    (branch_name is optional). Tasks for the same repository run one
+    after another, since they share its workspace clone.
+    
+    Args:
+        path: Path to the .jsonl task file
+        max_concurrency: Maximum number of workflows running at once
+    
+    Returns:
+        Final states, in the same order as the tasks in the file
+    """
+    with open(path, encoding="utf-8") as f:
+        tasks = [json.loads(line) for line in f if line.strip()]
+    
+    semaphore = asyncio.Semaphore(max_concurrency)
+    repo_locks = defaultdict(asyncio.Lock)
+    
+    async def run_one(task: dict) -> AgentState:
+        async with repo_locks[task["repo_url"]]:
+            async with semaphore:
+                return await arun_workflow(**task)
+    
+    logger.info("📦 Running %s tasks (max %s at once)", len(tasks), max_concurrency)
+    try:
+        return await asyncio.gather(*(run_one(task) for task in tasks))
+    finally:
+        await aclose_async_client()  # Shared by every run on this loop
+
+
 def run_dry_run(repo_url: str, user_request: str) -> None:
     """
     Run a dry-run of the workflow without LLM calls.
@@ -194,9 +341,9 @@ def run_dry_run(repo_url: str, user_request: str) -> None:
         repo_url: GitHub repository URL
         user_request: The task description
     """
-    print("=" * 60)
-    print("🧪 DRY RUN MODE - No LLM calls, no file changes")
-    print("=" * 60)
+    logger.info("=" * 60)
+    logger.info("🧪 DRY RUN MODE - No LLM calls, no file changes")
+    logger.info("=" * 60)
     
     from state.schema import create_initial_state
     
@@ -216,19 +363,19 @@ def run_dry_run(repo_url: str, user_request: str) -> None:
     ]
     
     for name, msg in nodes:
-        print(f"\n📍 Node: {name.upper()}")
-        print(f"   {msg}")
-        print(f"   State: {state.get('status', 'initialized')}")
+        logger.info("\n📍 Node: %s", name.upper())
+        logger.info("   %s", msg)
+        logger.info("   State: %s", state.get('status', 'initialized'))
     
-    print("\n" + "=" * 60)
-    print("✅ Dry run complete - graph structure is valid")
-    print("=" * 60)
+    logger.info("\n" + "=" * 60)
+    logger.info("✅ Dry run complete - graph structure is valid")
+    logger.info("=" * 60)
 
 
 # Visualization helper
 def visualize_graph():
     """Print a text representation of the graph."""
-    print("""
+    logger.info("""
     ┌──────────────────────────────────────────────────────────────┐
     │                  SELF-HEALING AGENT WORKFLOW                 │
     └──────────────────────────────────────────────────────────────┘
@@ -281,7 +428,7 @@ def visualize_graph():
     """)
 
 
-# For testing
+# For testing (from the repo root: python -m graph.workflow)
 if __name__ == "__main__":
     import argparse
     
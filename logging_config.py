@@ -0,0 +1,90 @@
+"""
+Logging setup for the Self-Healing Agent System.
+
+Log records are handed to a queue and written by a background listener
+thread, so progress logging never blocks on a slow stdout (a pipe under
+`docker logs`, CI, or the web UI stream).
+
+Usage:
+    from logging_config import get_logger
+    logger = get_logger(__name__)
+    logger.info("   ✓ Cloned to: %s", path)
+"""
+
+import atexit
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+
+# Parent logger for all project modules (third-party loggers are left alone)
+ROOT_LOGGER_NAME = "autodev"
+
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_listener: Optional[QueueListener] = None
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """
+    Stream handler that writes to whatever sys.stdout is at emit time.
+    
+    This keeps `redirect_stdout` working (the web UI captures a job's
+    output that way), even though records are written from the
+    listener thread.
+    """
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass  # Always resolved at emit time
+
+
+def setup_logging(quiet: bool = False) -> None:
+    """
+    Install the queue handler and start the listener thread (idempotent).
+    
+    Args:
+        quiet: Only show warnings and errors
+    """
+    global _listener
+    
+    root = logging.getLogger(ROOT_LOGGER_NAME)
+    root.setLevel(logging.WARNING if quiet else logging.INFO)
+    
+    if _listener is not None:
+        return
+    
+    handler = _StdoutHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    
+    root.addHandler(QueueHandler(_log_queue))
+    root.propagate = False
+    
+    _listener = QueueListener(_log_queue, handler)
+    _listener.start()
+    atexit.register(_listener.stop)  # Drains the queue on exit
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Get a project logger, setting up logging on first use.
+    
+    Args:
+        name: Module name (usually __name__)
+    
+    Returns:
+        Logger under the project's parent logger
+    """
+    if _listener is None:
+        setup_logging()
+    return logging.getLogger(f"{ROOT_LOGGER_NAME}.{name}")
+
+
+def flush_logs() -> None:
+    """Block until every queued record has been written."""
+    _log_queue.join()
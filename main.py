@@ -11,20 +11,28 @@ An autonomous coding agent that:
 
 Usage:
     python main.py --repo <github-url> --request "Your task description"
+    python main.py --batch tasks.jsonl  # Run many tasks concurrently
     python main.py --dry-run  # Test without LLM calls
     python main.py --check    # Verify configuration
 """
 
 import argparse
+import asyncio
 import sys
 from pathlib import Path
 
 # Add project root to path
-sys.path.insert(0, str(Path(__file__).parent))
+_ROOT = str(Path(__file__).parent)
+if _ROOT not in sys.path:  # Guard against duplicate entries
+    sys.path.insert(0, _ROOT)
 
 from config import config
+from logging_config import get_logger, setup_logging, flush_logs
 from state.schema import create_initial_state, state_summary
-from graph.workflow import run_workflow, run_dry_run, visualize_graph
+from graph.workflow import run_workflow, run_batch, run_dry_run, visualize_graph
+
+
+logger = get_logger(__name__)
 
 
 def check_configuration() -> bool:
@@ -34,23 +42,25 @@ def check_configuration() -> bool:
     Returns:
         True if configuration is valid, False otherwise
     """
-    print("=" * 60)
-    print("🔧 CONFIGURATION CHECK")
-    print("=" * 60)
+    logger.info("=" * 60)
+    logger.info("🔧 CONFIGURATION CHECK")
+    logger.info("=" * 60)
+    flush_logs()  # print_status() writes to stdout directly
     
     config.print_status()
     
     missing = config.validate()
     if missing:
-        print(f"\n❌ Missing required configuration:")
+        logger.error("\n❌ Missing required configuration:")
         for key in missing:
-            print(f"   • {key}")
-        print("\n💡 Create a .env file with the required values.")
-        print("   See .env.example for reference.")
+            logger.error("   • %s", key)
+        logger.info("\n💡 Create a .env file with the required values.")
+        logger.info("   See .env.example for reference.")
+        flush_logs()
         return False
     
     # Check Docker
-    print("\n--- Docker Check ---")
+    logger.info("\n--- Docker Check ---")
     try:
         from tools.docker_sandbox import DockerSandbox
         sandbox = DockerSandbox()
@@ -58,16 +68,17 @@ def check_configuration() -> bool:
         sandbox.cleanup()
         
         if available:
-            print(f"✓ {message}")
+            logger.info("✓ %s", message)
         else:
-            print(f"⚠ {message}")
-            print("   Docker is recommended but not required.")
+            logger.warning("⚠ %s", message)
+            logger.info("   Docker is recommended but not required.")
     except Exception as e:
-        print(f"⚠ Docker check failed: {e}")
+        logger.warning("⚠ Docker check failed: %s", e)
     
-    print("\n" + "=" * 60)
-    print("✅ Configuration is valid!")
-    print("=" * 60)
+    logger.info("\n" + "=" * 60)
+    logger.info("✅ Configuration is valid!")
+    logger.info("=" * 60)
+    flush_logs()
     return True
 
 
@@ -81,6 +92,9 @@ Examples:
   # Run the agent on a repository
   python main.py --repo https://github.com/owner/repo --request "Add a logging system"
   
+  # Run several tasks concurrently (one JSON object per line)
+  python main.py --batch tasks.jsonl
+  
   # Dry run (test graph without LLM calls)
   python main.py --dry-run
   
@@ -110,6 +124,14 @@ Examples:
         help="Branch name for changes (default: auto-dev-feature)"
     )
     
+    parser.add_argument(
+        "--batch",
+        type=str,
+        metavar="TASKS_JSONL",
+        help="Run the tasks in a JSON Lines file concurrently "
+             '(each line: {"repo_url": ..., "user_request": ..., "branch_name": ...})'
+    )
+    
     # Mode flags
     parser.add_argument(
         "--check",
@@ -135,6 +157,9 @@ Examples:
     
     args = parser.parse_args()
     
+    # --quiet hides progress logs (warnings and errors still show)
+    setup_logging(quiet=args.quiet)
+    
     # Handle mode flags
     if args.visualize:
         visualize_graph()
@@ -150,6 +175,9 @@ Examples:
         run_dry_run(repo, request)
         return 0
     
+    if args.batch:
+        return run_batch_mode(args.batch)
+    
     # Validate required arguments for actual run
     if not args.repo:
         print("❌ Error: --repo is required")
@@ -196,6 +224,42 @@ Examples:
         return 1
 
 
+def run_batch_mode(path: str) -> int:
+    """
+    Run every task in a JSON Lines file and print one result line each.
+    
+    Args:
+        path: Path to the .jsonl task file
+    
+    Returns:
+        0 if every task completed, 1 otherwise
+    """
+    missing = config.validate()
+    if missing:
+        print("❌ Configuration Error:")
+        for key in missing:
+            print(f"   Missing: {key}")
+        return 1
+    
+    try:
+        results = asyncio.run(run_batch(path))
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"❌ Invalid batch file {path}: {e}")
+        return 1
+    
+    flush_logs()
+    print("\n" + "=" * 60)
+    print("📦 BATCH RESULTS")
+    print("=" * 60)
+    for state in results:
+        status = state.get("status", "unknown")
+        icon = "✅" if status == "completed" else "❌"
+        detail = state.get("pr_url") or status
+        print(f"{icon} {state.get('repo_url')}: {detail}")
+    
+    return 0 if all(s.get("status") == "completed" for s in results) else 1
+
+
 def interactive_mode():
     """
     Run in interactive mode, prompting for inputs.
@@ -1,12 +1,15 @@
 """Agent Nodes module for the Self-Healing Agent System."""
 
-from nodes.architect import architect_node
+from nodes.architect import clone_node, scan_node, load_context_node, architect_node
 from nodes.developer import developer_node
 from nodes.executor import executor_node
 from nodes.reviewer import reviewer_node
 from nodes.publisher import publisher_node
 
 __all__ = [
+    "clone_node",
+    "scan_node",
+    "load_context_node",
     "architect_node",
     "developer_node",
     "executor_node",
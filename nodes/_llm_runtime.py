@@ -0,0 +1,154 @@
+"""
+LLM call protection for the agent nodes.
+
+Provides:
+- CircuitBreaker: fast-fails calls after repeated failures, so a provider
+  outage doesn't turn every retry attempt into a long hang
+- with_retry: retries transient errors (429, 5xx, timeouts) with
+  full-jitter exponential backoff
+
+Usage:
+    response = with_retry(lambda: LLM_BREAKER.call(llm.invoke, messages))
+"""
+
+import random
+import threading
+import time
+from typing import Callable, TypeVar
+
+from logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# HTTP statuses worth retrying (rate limited / provider overloaded)
+TRANSIENT_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling the LLM while the circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker (CLOSED -> OPEN -> HALF-OPEN).
+
+    - CLOSED: calls go through; consecutive failures are counted
+    - OPEN: after `failure_threshold` failures, calls fail fast with
+      CircuitOpenError for `recovery_timeout` seconds
+    - HALF-OPEN: after the timeout, one probe call is let through; success
+      closes the circuit, failure opens it again
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> str:
+        """Current state (CLOSED, OPEN or HALF_OPEN)."""
+        with self._lock:
+            return self._state
+
+    def _before_call(self) -> None:
+        with self._lock:
+            if self._state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.recovery_timeout:
+                    raise CircuitOpenError(
+                        f"LLM circuit open after {self._failures} consecutive failures; "
+                        f"retrying after {self.recovery_timeout:.0f}s cooldown"
+                    )
+                self._state = self.HALF_OPEN
+
+            if self._state == self.HALF_OPEN:
+                if self._probe_in_flight:
+                    raise CircuitOpenError("LLM circuit half-open; probe call in progress")
+                self._probe_in_flight = True
+
+    def _on_success(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def _on_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def call(self, fn: Callable[..., T], *args, **kwargs) -> T:
+        """
+        Call `fn` through the breaker.
+
+        Raises:
+            CircuitOpenError: If the circuit is open (fn is not called)
+        """
+        self._before_call()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception:
+            self._on_failure()
+            raise
+        self._on_success()
+        return result
+
+
+def is_transient(error: Exception) -> bool:
+    """Check if an LLM error is worth retrying (rate limits, overload, timeouts)."""
+    if isinstance(error, CircuitOpenError):
+        return False
+    status = getattr(error, "status_code", None)
+    if status is not None:
+        return status in TRANSIENT_STATUS_CODES
+    name = type(error).__name__
+    return any(word in name for word in ("RateLimit", "Timeout", "Connection"))
+
+
+def with_retry(
+    fn: Callable[[], T],
+    max_retries: int = 3,
+    base: float = 1.0,
+    cap: float = 30.0
+) -> T:
+    """
+    Call `fn`, retrying transient errors with full-jitter exponential backoff.
+
+    Each retry waits a random time in [0, min(cap, base * 2**attempt)].
+
+    Args:
+        fn: Zero-argument callable to run
+        max_retries: Retries after the first attempt
+        base: Base delay in seconds
+        cap: Maximum delay in seconds
+
+    Returns:
+        Whatever `fn` returns
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return fn()
+        except Exception as e:
+            if attempt == max_retries or not is_transient(e):
+                raise
+            delay = random.uniform(0, min(cap, base * 2 ** attempt))
+            logger.warning("   ⚠ Transient LLM error (%s), retrying in %.1fs...", type(e).__name__, delay)
+            time.sleep(delay)
+
+
+# Shared by every node that calls the LLM (they all hit the same provider)
+LLM_BREAKER = CircuitBreaker()
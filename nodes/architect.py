@@ -7,24 +7,37 @@ The Architect is responsible for:
 3. Selecting relevant files for the task
 4. Creating an implementation plan
 
+The analysis phase is split into several graph nodes so LangGraph can run
+the independent steps in parallel:
+
+    clone ──┬──▶ scan ──────────┬──▶ architect (LLM plan + file loading)
+            └──▶ load_context ──┘
+
 This node does NOT read every file (to prevent token overflow).
 It reads file names and structure to make intelligent decisions.
 """
 
-import json
+import asyncio
+import os
+import re
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional
 
+import orjson
 from langchain_groq import ChatGroq
 from langchain_core.messages import HumanMessage, SystemMessage
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from state.schema import AgentState
+from state.schema import AgentState, COWState, append_error, with_error
 from tools.file_tools import list_files, read_file
-from tools.github_tools import clone_repo, checkout_branch
+from tools.github_tools import aclone_repo, checkout_branch
 from config import config
+from logging_config import get_logger, flush_logs
+
+
+logger = get_logger(__name__)
 
 
 ARCHITECT_SYSTEM_PROMPT = """You are a Senior Software Architect analyzing a codebase to plan a feature implementation.
@@ -40,7 +53,7 @@ Guidelines:
 - Look for existing patterns in the codebase to follow
 - Plan should include creating/updating tests
 
-Output your response as JSON with this exact structure:
+Output ONLY a JSON object (no markdown, no extra text) with this exact structure:
 {
     "relevant_files": ["path/to/file1.py", "path/to/file2.py"],
     "plan": [
@@ -53,108 +66,275 @@ Output your response as JSON with this exact structure:
 
 Be concise but thorough. The Developer will use your plan to implement changes."""
 
+# Built once and reused for every call
+_SYSTEM_MESSAGE = SystemMessage(content=ARCHITECT_SYSTEM_PROMPT)
+
+# Maximum number of files collected when scanning the repository
+FILE_SCAN_LIMIT = 200
+
+# Repository-root files read as context for the plan (lowercase names)
+KEY_FILES = ("readme.md", "setup.py", "pyproject.toml", "package.json")
+
+# Key files this large or larger are left out of the prompt
+MAX_CONTEXT_FILE_BYTES = 3000
+
+# File types the Architect looks at (lowercase, with the dot)
+SCAN_EXTENSIONS = frozenset({
+    ".py", ".js", ".ts", ".jsx", ".tsx", ".json", ".yaml", ".yml", ".md", ".txt"
+})
+
+
+# Worker threads for file reads (reads are latency-bound, not CPU-bound)
+READ_WORKERS = 8
+_READ_POOL = ThreadPoolExecutor(max_workers=READ_WORKERS, thread_name_prefix="architect-read")
+
+# A complete "relevant_files": [...] array inside a partially streamed response
+_RELEVANT_FILES_RE = re.compile(r'"relevant_files"\s*:\s*(\[[^\]]*\])')
+
+
+def _safe_read(path: str, with_line_numbers: bool) -> Optional[str]:
+    """Read a file, returning None instead of raising so one bad file doesn't fail the batch."""
+    try:
+        return read_file(path, with_line_numbers=with_line_numbers)
+    except Exception as e:
+        logger.warning("   ⚠ Could not read %s: %s", path, e)
+        return None
+
+
+async def _read_files(root: Path, rel_paths: List[str], with_line_numbers: bool) -> Dict[str, str]:
+    """
+    Read several repository files concurrently on the shared read pool.
+    
+    Args:
+        root: Repository root
+        rel_paths: Paths relative to root
+        with_line_numbers: Prefix each line with its number
+    
+    Returns:
+        Dict of relative path -> content for the files that could be read
+    """
+    loop = asyncio.get_running_loop()
+    contents = await asyncio.gather(*(
+        loop.run_in_executor(_READ_POOL, _safe_read, str(root / rel_path), with_line_numbers)
+        for rel_path in rel_paths
+    ))
+    return {
+        rel_path: content
+        for rel_path, content in zip(rel_paths, contents)
+        if content is not None
+    }
 
+
+def _streamed_relevant_files(partial_text: str) -> Optional[List[str]]:
+    """
+    Extract the relevant_files list from a partially streamed LLM response.
+    
+    Returns:
+        The file list once its closing bracket has arrived, else None
+    """
+    match = _RELEVANT_FILES_RE.search(partial_text)
+    if not match:
+        return None
+    try:
+        files = orjson.loads(match.group(1))
+    except orjson.JSONDecodeError:
+        return None
+    return [f for f in files if isinstance(f, str)]
+
+
+def _parse_analysis(response_text: str) -> dict:
+    """
+    Parse the JSON object in the Architect's response.
+    
+    The model is asked for bare JSON but may wrap it in a markdown fence
+    or a sentence, so everything outside the outermost braces is ignored.
+    
+    Raises:
+        ValueError: If the response holds no JSON object
+    """
+    start, end = response_text.find("{"), response_text.rfind("}")
+    if start == -1 or end < start:
+        raise ValueError("No JSON found in response")
+    analysis = orjson.loads(response_text[start:end + 1])  # JSONDecodeError is a ValueError
+    if not isinstance(analysis, dict):
+        raise ValueError("Response JSON is not an object")
+    return analysis
+
+
+@lru_cache(maxsize=1)
 def get_llm():
-    """Get configured Groq LLM instance (LLaMA 3)."""
+    """
+    Get the configured Groq LLM instance (LLaMA 3).
+    
+    The client is created on first use and then shared, so its HTTP
+    connection pool stays warm across runs. It isn't built at import
+    time because ChatGroq rejects a missing API key.
+    """
     return ChatGroq(
         model=config.GROQ_MODEL,
         api_key=config.GROQ_API_KEY,
         temperature=0.1  # Low temperature for more consistent analysis
+        # No JSON mode (response_format): Groq doesn't support it together
+        # with streaming, which the prefetch of relevant files relies on
     )
 
 
-def architect_node(state: AgentState) -> AgentState:
+async def clone_node(state: AgentState) -> dict:
     """
-    The Architect node: Analyzes the repository and creates an implementation plan.
+    Clone the repository and check out the feature branch.
     
     Input state:
         - repo_url: GitHub repository URL
-        - user_request: The task description
         - branch_name: Branch to work on
     
     Output state updates:
         - local_path: Where the repo was cloned
-        - file_map: Complete list of repository files
-        - relevant_files: Files needed for the task
-        - plan: Step-by-step implementation plan
-        - status: "analyzing" -> "developing"
+        - status: "analyzing", or "failed" if the clone or checkout failed
     """
-    print("\n🏗️  ARCHITECT: Starting analysis...")
-    
-    # Update status
-    state = dict(state)  # Make mutable copy
-    state["status"] = "analyzing"
+    logger.info("\n🏗️  ARCHITECT: Starting analysis...")
     
     # Step 1: Clone the repository
-    print(f"   Cloning repository: {state['repo_url']}")
-    clone_result = clone_repo(
+    logger.info("   Cloning repository: %s", state['repo_url'])
+    clone_result = await aclone_repo(
         url=state["repo_url"],
         branch=None,  # Use default branch first
         force=False
     )
     
     if not clone_result.success:
-        state["error_history"] = state.get("error_history", []) + [
-            f"Clone failed: {clone_result.message}"
-        ]
-        state["status"] = "failed"
-        return state
+        return {
+            "status": "failed",
+            "error_history": with_error(
+                state.get("error_history", []),
+                f"Clone failed: {clone_result.message}"
+            )
+        }
     
-    state["local_path"] = clone_result.local_path
-    print(f"   ✓ Cloned to: {clone_result.local_path}")
+    logger.info("   ✓ Cloned to: %s", clone_result.local_path)
     
     # Step 2: Create feature branch
     branch_name = state.get("branch_name", "auto-dev-feature")
-    success, msg = checkout_branch(
-        local_path=state["local_path"],
+    success, msg = await asyncio.to_thread(
+        checkout_branch,
+        local_path=clone_result.local_path,
         branch_name=branch_name,
         create=True
     )
-    print(f"   ✓ Branch: {branch_name}")
+    if not success:
+        logger.error("   ✗ Checkout failed: %s", msg)
+        return {
+            "status": "failed",
+            "error_history": with_error(
+                state.get("error_history", []),
+                f"Checkout of {branch_name} failed: {msg}"
+            )
+        }
+    logger.info("   ✓ Branch: %s", branch_name)
+    
+    return {"status": "analyzing", "local_path": clone_result.local_path}
+
+
+async def scan_node(state: AgentState) -> dict:
+    """
+    List the repository files (runs in parallel with load_context_node).
     
+    Output state updates:
+        - file_map: Repository files, capped at FILE_SCAN_LIMIT
+        - status: "failed" if the scan failed
+    """
     # Step 3: List all files in repository
-    print("   Scanning repository structure...")
+    logger.info("   Scanning repository structure...")
     try:
-        all_files = list_files(
+        all_files = await asyncio.to_thread(
+            list_files,
             state["local_path"],
-            extensions=[".py", ".js", ".ts", ".jsx", ".tsx", ".json", ".yaml", ".yml", ".md", ".txt"],
-            max_depth=5  # Don't go too deep
+            extensions=SCAN_EXTENSIONS,
+            max_depth=5,  # Don't go too deep
+            limit=FILE_SCAN_LIMIT  # Stop walking huge repos early
         )
-        state["file_map"] = all_files
-        print(f"   ✓ Found {len(all_files)} files")
     except Exception as e:
-        state["error_history"] = state.get("error_history", []) + [
-            f"File scan failed: {str(e)}"
-        ]
-        state["status"] = "failed"
-        return state
+        return {
+            "status": "failed",
+            "error_history": with_error(
+                state.get("error_history", []),
+                f"File scan failed: {str(e)}"
+            )
+        }
+    
+    truncated = len(all_files) >= FILE_SCAN_LIMIT
+    logger.info("   ✓ Found %s%s files", len(all_files), '+' if truncated else '')
+    return {"file_map": all_files}
+
+
+async def load_context_node(state: AgentState) -> dict:
+    """
+    Read key files (README, project config) from the repository root
+    concurrently (runs in parallel with scan_node).
+    
+    Output state updates:
+        - context_files: Formatted key file contents for the LLM prompt
+    """
+    root = Path(state["local_path"])
+    
+    # One listing of the root, indexed by lowercase name (README.md == readme.md)
+    with os.scandir(root) as entries:
+        root_files = {entry.name.lower(): entry for entry in entries if entry.is_file()}
+    
+    key_paths = []
+    for key_file in KEY_FILES:
+        entry = root_files.get(key_file)
+        # Size comes from the directory entry, so large files are never read
+        if entry is not None and entry.stat().st_size < MAX_CONTEXT_FILE_BYTES:
+            key_paths.append(entry.name)
+    
+    key_contents = await _read_files(root, key_paths, with_line_numbers=False)
+    context_files = [
+        f"### {key_path}\n```\n{content}\n```"
+        for key_path, content in key_contents.items()
+    ]
+    
+    return {"context_files": context_files}
+
+
+async def architect_node(state: AgentState) -> AgentState:
+    """
+    The Architect node: Creates an implementation plan from the scanned
+    repository and loads the files it selects.
+    
+    This node is async: the LLM response is streamed, and as soon as the
+    "relevant_files" array is complete the files start loading in the
+    background while the model is still writing the plan.
+    
+    Input state:
+        - user_request: The task description
+        - file_map: Repository files (from scan_node)
+        - context_files: Key file contents (from load_context_node)
+    
+    Output state updates:
+        - relevant_files: Files needed for the task
+        - file_contents: Contents of the relevant files
+        - plan: Step-by-step implementation plan
+        - status: "analyzing" -> "developing"
+    """
+    state = COWState(state)  # Copy-on-write view: only written keys are returned
+    if state.get("status") == "failed":
+        flush_logs()  # Keep our lines ahead of the next node's output
+        return state.changes()
+    
+    all_files = state.get("file_map", [])
+    truncated = len(all_files) >= FILE_SCAN_LIMIT
     
     # Step 4: Use LLM to analyze and create plan
-    print("   Analyzing with AI...")
+    logger.info("   Analyzing with AI...")
     
     llm = get_llm()
     
     # Create file tree representation
-    file_tree = "\n".join(f"  - {f}" for f in all_files[:100])  # Limit to 100 files
+    file_tree = "\n".join("  - " + f for f in islice(all_files, 100))  # Limit to 100 files
     if len(all_files) > 100:
-        file_tree += f"\n  ... and {len(all_files) - 100} more files"
-    
-    # Read key files for context (README, main entry points)
-    context_files = []
-    key_files = ["README.md", "readme.md", "setup.py", "pyproject.toml", "package.json"]
-    for key_file in key_files:
-        matching = [f for f in all_files if f.lower().endswith(key_file.lower())]
-        if matching:
-            try:
-                content = read_file(
-                    str(Path(state["local_path"]) / matching[0]),
-                    with_line_numbers=False
-                )
-                if len(content) < 3000:  # Only include if not too large
-                    context_files.append(f"### {matching[0]}\n```\n{content}\n```")
-            except:
-                pass
+        file_tree += f"\n  ... and {len(all_files) - 100}{'+' if truncated else ''} more files"
     
+    context_files = state.get("context_files", [])
     context_str = "\n\n".join(context_files[:3]) if context_files else "No README or config files found."
     
     user_message = f"""
@@ -171,50 +351,39 @@ Analyze this repository and create a plan to implement the user's request.
 Remember to output valid JSON with "relevant_files", "plan", and "reasoning" keys.
 """
     
+    root = Path(state["local_path"])
+    prefetch = None  # (paths, task) once relevant_files has streamed in
+    reasoning = None
+    
     try:
-        response = llm.invoke([
-            SystemMessage(content=ARCHITECT_SYSTEM_PROMPT),
+        response_text = ""
+        async for chunk in llm.astream([
+            _SYSTEM_MESSAGE,
             HumanMessage(content=user_message)
-        ])
+        ]):
+            response_text += chunk.content
+            
+            # Start reading files as soon as the list is complete
+            if prefetch is None:
+                streamed_files = _streamed_relevant_files(response_text)
+                if streamed_files is not None:
+                    paths = streamed_files[:15]
+                    prefetch = (paths, asyncio.create_task(
+                        _read_files(root, paths, with_line_numbers=True)
+                    ))
         
-        # Parse the response
-        response_text = response.content
+        analysis = _parse_analysis(response_text)
         
-        # Try to extract JSON from response
-        try:
-            # Find JSON in response (might be wrapped in markdown)
-            import re
-            json_match = re.search(r'\{[\s\S]*\}', response_text)
-            if json_match:
-                analysis = json.loads(json_match.group())
-            else:
-                raise ValueError("No JSON found in response")
-            
-            state["relevant_files"] = analysis.get("relevant_files", [])
-            state["plan"] = analysis.get("plan", [])
-            
-            print(f"   ✓ Identified {len(state['relevant_files'])} relevant files")
-            print(f"   ✓ Created {len(state['plan'])}-step plan")
-            
-            # Log the reasoning
-            if "reasoning" in analysis:
-                print(f"   Analysis: {analysis['reasoning'][:100]}...")
-                
-        except json.JSONDecodeError as e:
-            # Fallback: use heuristics if LLM didn't return valid JSON
-            print(f"   ⚠ JSON parse failed, using fallback analysis")
-            state["relevant_files"] = [f for f in all_files if f.endswith(".py")][:10]
-            state["plan"] = [
-                f"Analyze the codebase for: {state['user_request']}",
-                "Implement the required changes",
-                "Add or update tests",
-                "Verify the implementation"
-            ]
+        state["relevant_files"] = analysis.get("relevant_files", [])
+        state["plan"] = analysis.get("plan", [])
+        reasoning = analysis.get("reasoning")
+        
+        logger.info("   ✓ Identified %s relevant files", len(state['relevant_files']))
+        logger.info("   ✓ Created %s-step plan", len(state['plan']))
             
     except Exception as e:
-        state["error_history"] = state.get("error_history", []) + [
-            f"LLM analysis failed: {str(e)}"
-        ]
+        logger.warning("   ⚠ LLM analysis failed (%s) - using fallback plan", e)
+        append_error(state, f"LLM analysis failed: {str(e)}")
         # Use fallback
         state["relevant_files"] = [f for f in all_files if f.endswith(".py")][:10]
         state["plan"] = [
@@ -223,26 +392,31 @@ Remember to output valid JSON with "relevant_files", "plan", and "reasoning" key
             "Verify"
         ]
     
-    # Step 5: Read content of relevant files
-    print("   Loading relevant file contents...")
-    file_contents = {}
-    for rel_path in state["relevant_files"][:15]:  # Limit to 15 files
-        full_path = Path(state["local_path"]) / rel_path
-        try:
-            content = read_file(str(full_path), with_line_numbers=True)
-            file_contents[rel_path] = content
-        except Exception as e:
-            print(f"   ⚠ Could not read {rel_path}: {e}")
-    
-    state["file_contents"] = file_contents
+    # Log the reasoning (outside the try: an odd value mustn't discard the plan)
+    if isinstance(reasoning, str):
+        logger.info("   Analysis: %s...", reasoning[:100])
+    
+    # Step 5: Read content of relevant files concurrently
+    logger.info("   Loading relevant file contents...")
+    rel_paths = state["relevant_files"][:15]  # Limit to 15 files
+    prefetched_paths, prefetched = set(), {}
+    if prefetch is not None:
+        prefetched_paths = set(prefetch[0])
+        prefetched = await prefetch[1]
+    
+    # Only read what the prefetch didn't cover (e.g. fallback file lists)
+    remaining = [p for p in rel_paths if p not in prefetched_paths]
+    loaded = {**prefetched, **await _read_files(root, remaining, with_line_numbers=True)}
+    state["file_contents"] = {p: loaded[p] for p in rel_paths if p in loaded}
     state["current_step"] = 0
     state["status"] = "developing"
     
-    print("   ✓ Architecture phase complete!")
-    return state
+    logger.info("   ✓ Architecture phase complete!")
+    flush_logs()  # Keep our lines ahead of the next node's output
+    return state.changes()
 
 
-# For testing the node directly
+# For testing the node directly (from the repo root: python -m nodes.architect)
 if __name__ == "__main__":
     from state.schema import create_initial_state, state_summary
     
@@ -258,8 +432,15 @@ if __name__ == "__main__":
     print("Initial State:")
     print(state_summary(test_state))
     
-    # Run the architect
-    result_state = architect_node(test_state)
+    # Run the analysis nodes in graph order
+    async def run_analysis(state):
+        state = {**state, **await clone_node(state)}
+        if state["status"] == "failed":
+            return state
+        state = {**state, **await scan_node(state), **await load_context_node(state)}
+        return {**state, **await architect_node(state)}
+    
+    result_state = asyncio.run(run_analysis(test_state))
     
     print("\nResult State:")
     print(state_summary(result_state))
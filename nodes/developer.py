@@ -12,19 +12,28 @@ This is the core coding agent that implements changes.
 """
 
 import json
-import re
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache
+from itertools import chain
+from json.decoder import scanstring
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
+
+import msgspec
 
 from langchain_groq import ChatGroq
 from langchain_core.messages import HumanMessage, SystemMessage
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from state.schema import AgentState
+from state.schema import AgentState, COWState, append_error
 from tools.file_tools import read_file, write_file
 from config import config
+from logging_config import get_logger, flush_logs
+from nodes._llm_runtime import LLM_BREAKER, CircuitOpenError, with_retry
+
+
+logger = get_logger(__name__)
 
 
 DEVELOPER_SYSTEM_PROMPT = """You are a Senior Python Developer implementing changes to a codebase.
@@ -54,6 +63,27 @@ Guidelines:
 - Follow PEP 8 style guidelines
 - Make tests specific and meaningful"""
 
+# Built once and reused for every call (identical prefix for prompt caching)
+_SYSTEM_MESSAGE = SystemMessage(content=DEVELOPER_SYSTEM_PROMPT)
+
+# Stable parts first, the per-attempt error context last, so retries
+# share the longest possible prompt prefix (provider prompt caching)
+USER_MESSAGE_TEMPLATE = """
+## Current Files
+{files}
+
+## User Request
+{user_request}
+
+## Implementation Plan
+{plan}
+
+{errors}
+
+Implement the changes according to the plan. Output valid JSON with 'changes', 'test_file', and 'explanation'.
+Make sure to include COMPLETE file contents in your response.
+"""
+
 
 def get_llm():
     """Get configured Groq LLM instance (LLaMA 3)."""
@@ -64,6 +94,390 @@ def get_llm():
     )
 
 
+# Worker threads for writing changed files (I/O-bound)
+WRITE_WORKERS = 16
+_WRITE_POOL = ThreadPoolExecutor(max_workers=WRITE_WORKERS, thread_name_prefix="developer-write")
+
+
+def _write_if_changed(path: str, content: str, backup: bool = False) -> dict:
+    """
+    write_file, skipped when the file already holds exactly `content`.
+    
+    The comparison goes through the (path, mtime, size, inode)-keyed read_file
+    cache, so it also notices edits made outside the agent. Regenerated
+    but unchanged files cost no write and leave no extra backup.
+    
+    Returns:
+        write_file's result, or {"path": ..., "bytes_written": 0, "skipped": True}
+    """
+    try:
+        unchanged = read_file(path, with_line_numbers=False) == content
+    except (OSError, ValueError):
+        unchanged = False  # Missing or unreadable - just write it
+    if unchanged:
+        return {"path": path, "bytes_written": 0, "skipped": True}
+    return write_file(path, content, create_dirs=True, backup=backup)
+
+# strict=False accepts raw newlines/tabs inside strings, which LLMs often emit
+_JSON_DECODER = json.JSONDecoder(strict=False)
+
+# Control characters that can't appear in JSON at all (\t, \n and \r are kept)
+_CONTROL_CHARS = dict.fromkeys(chain(
+    range(0x00, 0x09), (0x0b, 0x0c), range(0x0e, 0x20), range(0x7f, 0xa0)
+))
+
+_JSON_WHITESPACE = " \t\r\n"
+
+
+class Change(msgspec.Struct):
+    """One file change in the Developer's response."""
+    action: str = "modify"
+    file_path: str = ""
+    content: str = ""
+    description: str = ""
+
+
+class TestFile(msgspec.Struct):
+    """The test file in the Developer's response."""
+    file_path: str = ""
+    content: str = ""
+
+
+class DevResponse(msgspec.Struct):
+    """The Developer's full JSON response."""
+    changes: List[Change] = []
+    test_file: Optional[TestFile] = None
+    explanation: str = ""
+
+
+def _decode(text: str, type):
+    """
+    Decode the JSON object at the start of `text` into `type`.
+    
+    msgspec validates and builds the structs in one pass; if it rejects
+    the text (raw newlines inside strings are common in LLM output) the
+    stdlib decoder with strict=False is used and the result converted.
+    Text after the object (e.g. a closing markdown fence) is ignored.
+    
+    Raises:
+        json.JSONDecodeError: If the text isn't JSON even leniently
+        ValueError: If the JSON doesn't match the expected shape
+    """
+    try:
+        return msgspec.json.decode(text[:text.rfind("}") + 1], type=type)
+    except msgspec.ValidationError as e:
+        raise ValueError(f"Unexpected response shape: {e}") from e
+    except msgspec.DecodeError:
+        pass
+    try:
+        return msgspec.convert(_JSON_DECODER.raw_decode(text)[0], type)
+    except msgspec.ValidationError as e:
+        raise ValueError(f"Unexpected response shape: {e}") from e
+
+
+def _string_values(text: str, key: str) -> List[str]:
+    """
+    Decode every string value of `key` in `text`, in order.
+    
+    A linear scan for malformed JSON: each value is decoded with the json
+    module's string scanner, so there is no regex backtracking on long
+    escaped strings.
+    """
+    values = []
+    marker = f'"{key}"'
+    pos = text.find(marker)
+    while pos != -1:
+        i = pos + len(marker)
+        while i < len(text) and text[i] in _JSON_WHITESPACE:
+            i += 1
+        if i < len(text) and text[i] == ":":
+            i += 1
+            while i < len(text) and text[i] in _JSON_WHITESPACE:
+                i += 1
+            if i < len(text) and text[i] == '"':
+                try:
+                    value, i = scanstring(text, i + 1, False)
+                except json.JSONDecodeError:
+                    break  # Unterminated string - nothing more to recover
+                values.append(value)
+        pos = text.find(marker, i)
+    return values
+
+
+def _parse_llm_json(text: str) -> DevResponse:
+    """
+    Parse the Developer's JSON response, tolerating common LLM damage.
+    
+    1. Decode from the first "{" into DevResponse (trailing text such as
+       a closing markdown fence is ignored; raw newlines are allowed)
+    2. Retry with stray control characters stripped
+    3. Last resort: pull out file_path/content pairs one by one
+    
+    Raises:
+        ValueError: If no JSON or no changes could be recovered
+    """
+    start = text.find("{")
+    if start == -1:
+        raise ValueError("No JSON found in response")
+    
+    try:
+        return _decode(text[start:], DevResponse)
+    except json.JSONDecodeError:
+        pass
+    
+    # Single pass over the text, dropping characters JSON can't contain
+    cleaned = text[start:].translate(_CONTROL_CHARS)
+    try:
+        return _decode(cleaned, DevResponse)
+    except json.JSONDecodeError:
+        pass
+    
+    # Last resort: extract just the essential parts manually
+    logger.info("   Attempting manual extraction...")
+    paths = _string_values(cleaned, "file_path")
+    contents = _string_values(cleaned, "content")
+    changes = [
+        Change(file_path=path, content=content, description="Auto-extracted change")
+        for path, content in zip(paths, contents)
+    ]
+    if not changes:
+        raise ValueError("Could not extract any changes from response")
+    return DevResponse(changes=changes, explanation="Extracted from malformed JSON")
+
+
+class _ChangeStream:
+    """
+    Pull complete `changes[i]` objects out of a streamed JSON response.
+    
+    Each chunk is scanned once, tracking string/escape state and brace
+    depth inside the "changes" array; as soon as an element's closing
+    brace arrives it is decoded and returned, so its write can start
+    while the model is still generating the rest of the response.
+    """
+    
+    # Give up on incremental parsing if "changes" isn't near the start
+    MAX_HEAD_CHARS = 4096
+    
+    def __init__(self):
+        self._chunks: List[str] = []
+        self._head = ""          # Text before the changes array
+        self._active = True      # False once the array ends (or can't be found)
+        self._in_array = False
+        self._in_string = False
+        self._escape = False
+        self._depth = 0
+        self._parts: List[str] = []  # Pieces of the element being received
+    
+    @property
+    def text(self) -> str:
+        """Everything received so far."""
+        return "".join(self._chunks)
+    
+    def feed(self, chunk: str) -> List[Change]:
+        """
+        Add a chunk and return the change objects it completed.
+        
+        Raises:
+            ValueError: If a complete element isn't a valid JSON object
+        """
+        self._chunks.append(chunk)
+        if not self._active:
+            return []
+        
+        if not self._in_array:
+            self._head += chunk
+            start = self._array_start(self._head)
+            if start is None:
+                if len(self._head) > self.MAX_HEAD_CHARS:
+                    self._active = False
+                return []
+            self._in_array = True
+            chunk, self._head = self._head[start:], ""
+        
+        return self._scan(chunk)
+    
+    @staticmethod
+    def _array_start(text: str):
+        """Index just past the '[' of the "changes" array, or None if not received yet."""
+        marker = '"changes"'
+        pos = text.find(marker)
+        while pos != -1:
+            i = pos + len(marker)
+            while i < len(text) and text[i] in _JSON_WHITESPACE:
+                i += 1
+            if i < len(text) and text[i] == ":":
+                i += 1
+                while i < len(text) and text[i] in _JSON_WHITESPACE:
+                    i += 1
+                if i < len(text) and text[i] == "[":
+                    return i + 1
+            if i >= len(text):
+                return None  # Rest of the key/value hasn't arrived yet
+            pos = text.find(marker, i)
+        return None
+    
+    def _scan(self, chunk: str) -> List[Change]:
+        completed = []
+        element_start = 0 if self._depth else None
+        i, n = 0, len(chunk)
+        
+        while i < n:
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                    i += 1
+                    continue
+                quote = chunk.find('"', i)
+                backslash = chunk.find("\\", i, quote if quote != -1 else n)
+                if backslash != -1:
+                    self._escape = True
+                    i = backslash + 1
+                elif quote == -1:
+                    i = n
+                else:
+                    self._in_string = False
+                    i = quote + 1
+                continue
+            
+            char = chunk[i]
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                if self._depth == 0:
+                    element_start = i
+                self._depth += 1
+            elif char in "}]":
+                if self._depth == 0:
+                    self._active = False  # End of the changes array
+                    return completed
+                self._depth -= 1
+                if self._depth == 0:
+                    self._parts.append(chunk[element_start:i + 1])
+                    element = "".join(self._parts)
+                    self._parts = []
+                    element_start = None
+                    try:
+                        change = _decode(element, Change)
+                    except (json.JSONDecodeError, ValueError) as e:
+                        self._active = False
+                        raise ValueError(f"Malformed change object: {e}") from e
+                    completed.append(change)
+            i += 1
+        
+        if element_start is not None:
+            self._parts.append(chunk[element_start:])
+        return completed
+
+
+def _stream_response(llm, messages: list, on_change) -> Tuple[str, bool]:
+    """
+    Stream the Developer's response, calling `on_change` per completed change.
+    
+    Args:
+        llm: Chat model to stream from
+        messages: Prompt messages
+        on_change: Called with each Change as soon as it is complete
+    
+    Returns:
+        Tuple of (response text, aborted). If a change can't be parsed the
+        stream is closed early and aborted is True.
+    """
+    parser = _ChangeStream()
+    stream = llm.stream(messages)
+    try:
+        for chunk in stream:
+            try:
+                changes = parser.feed(chunk.content)
+            except ValueError as e:
+                logger.warning("   ⚠ %s - stopping generation early", e)
+                return parser.text, True
+            for change in changes:
+                on_change(change)
+    finally:
+        stream.close()
+    return parser.text, False
+
+
+# error_history entries the Developer records when an attempt fails
+FAILURE_PREFIXES = ("Developer ", "Write failed ")
+
+
+def developer_failed(state: AgentState) -> bool:
+    """
+    Whether the Developer's latest attempt recorded a failure.
+    
+    Looks at the error_history entries since the Reviewer's last
+    "Attempt N: ..." line, i.e. those added during the current attempt.
+    
+    Args:
+        state: Current agent state
+    
+    Returns:
+        True if the current attempt logged a Developer error
+    """
+    for entry in reversed(state.get("error_history", [])):
+        if entry.startswith("Attempt "):
+            return False
+        if entry.startswith(FAILURE_PREFIXES):
+            return True
+    return False
+
+
+def _snapshot(path: Path) -> Optional[bytes]:
+    """A file's bytes, or None if it doesn't exist (see _restore)."""
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def _restore(path: Path, original: Optional[bytes]) -> None:
+    """Put back a _snapshot: rewrite the old bytes, or remove a file that didn't exist."""
+    if original is None:
+        path.unlink(missing_ok=True)
+        return
+    
+    # Replace the file (a new inode, like write_file) rather than rewriting
+    # it in place, so read_file's cache can't serve the rolled-back content
+    tmp_path = path.with_name(f".{path.name}.restore")
+    tmp_path.write_bytes(original)
+    if path.exists():
+        shutil.copymode(path, tmp_path)
+    os.replace(tmp_path, path)
+
+
+def _current_file_contents(local_path: Path, file_contents: Dict[str, str]) -> Dict[str, str]:
+    """
+    Re-read each tracked file from disk so the prompt matches the repo.
+    
+    read_file is cached on (path, mtime, size, inode), so files that haven't
+    changed since the last attempt come straight from memory. Files that
+    can't be read keep their state copy.
+    """
+    current = {}
+    for file_path, content in file_contents.items():
+        try:
+            current[file_path] = read_file(str(local_path / file_path), with_line_numbers=True)
+        except OSError:
+            current[file_path] = content
+    return current
+
+
+@lru_cache(maxsize=8)
+def _files_block(files: Tuple[Tuple[str, str], ...]) -> str:
+    """
+    Format file contents for the prompt, sorted by path.
+    
+    Cached so retries with unchanged files reuse the same string, and
+    sorted so the prompt prefix is byte-identical between attempts.
+    """
+    if not files:
+        return "No files loaded."
+    return "\n\n".join(
+        f"### {file_path}\n```python\n{content}\n```" for file_path, content in files
+    )
+
+
 def developer_node(state: AgentState) -> AgentState:
     """
     The Developer node: Implements code changes based on the plan.
@@ -80,22 +494,21 @@ def developer_node(state: AgentState) -> AgentState:
         - file_contents: Updated with new content
         - status: Remains "developing" until done
     """
-    print("\n💻 DEVELOPER: Implementing changes...")
+    logger.info("\n💻 DEVELOPER: Implementing changes...")
     
-    state = dict(state)  # Make mutable copy
+    state = COWState(state)  # Copy-on-write view: only written keys are returned
     attempt = state.get("attempt_count", 0)
     
-    print(f"   Attempt: {attempt + 1}/{config.MAX_RETRY_ATTEMPTS}")
+    logger.info("   Attempt: %s/%s", attempt + 1, config.MAX_RETRY_ATTEMPTS)
     
     # Build context for the LLM
     llm = get_llm()
     
-    # Prepare file contents for prompt
-    files_context = []
-    for file_path, content in state.get("file_contents", {}).items():
-        files_context.append(f"### {file_path}\n```python\n{content}\n```")
-    
-    files_str = "\n\n".join(files_context) if files_context else "No files loaded."
+    # Prepare file contents for prompt (line-numbered, as the Architect loaded them)
+    file_contents = state.get("file_contents", {})
+    if attempt > 0:
+        file_contents = _current_file_contents(Path(state.get("local_path", ".")), file_contents)
+    files_str = _files_block(tuple(sorted(file_contents.items())))
     
     # Prepare plan
     plan_str = "\n".join(f"{i+1}. {step}" for i, step in enumerate(state.get("plan", [])))
@@ -116,192 +529,180 @@ Please fix the issue and try again. Analyze the error carefully and correct the
     # Prepare error history for additional context
     error_history = state.get("error_history", [])
     if error_history:
+        if len(error_history) > 3:
+            logger.debug("   Prompt shows the last 3 of %s recorded errors", len(error_history))
         error_context += f"\n\nError history:\n" + "\n".join(f"- {e}" for e in error_history[-3:])
     
-    user_message = f"""
-## User Request
-{state.get("user_request", "No user request provided")}
-
-## Implementation Plan
-{plan_str}
-
-## Current Files
-{files_str}
-
-{error_context}
-
-Implement the changes according to the plan. Output valid JSON with 'changes', 'test_file', and 'explanation'.
-Make sure to include COMPLETE file contents in your response.
-"""
+    user_message = USER_MESSAGE_TEMPLATE.format_map({
+        "files": files_str,
+        "user_request": state.get("user_request", "No user request provided"),
+        "plan": plan_str,
+        "errors": error_context
+    })
 
+    local_path = Path(state.get("local_path", "."))
+    
+    # path -> (content, action, description, backup) and path -> future
+    # of its latest write; a later change to the same path replaces an
+    # earlier one once that write has finished
+    writes = {}
+    futures = {}
+    
+    # What each written path (and its .backup) held before this node
+    # first touched it, for rolling back a failed generation
+    originals = {}
+    
+    def dispatch(file_path, content, action, description, backup):
+        if not (file_path and content) or writes.get(file_path, (None,))[0] == content:
+            return
+        previous = futures.get(file_path)
+        if previous is not None:
+            wait([previous])  # Never let two writes to one file race
+        target = local_path / file_path
+        for path in (target, Path(f"{target}.backup")) if backup else (target,):
+            if path not in originals:
+                originals[path] = _snapshot(path)
+        writes[file_path] = (content, action, description, backup)
+        futures[file_path] = _WRITE_POOL.submit(
+            _write_if_changed,
+            str(target),
+            content,
+            backup
+        )
+    
+    def dispatch_change(change):
+        dispatch(
+            change.file_path,
+            change.content,
+            change.action,
+            change.description,
+            True
+        )
+    
+    def rollback():
+        """Undo every write dispatched so far (a failed or abandoned generation)."""
+        wait(futures.values())
+        for path, original in originals.items():
+            try:
+                _restore(path, original)
+            except OSError as e:
+                logger.warning("   ⚠ Could not restore %s: %s", path, e)
+        writes.clear()
+        futures.clear()
+        originals.clear()
+    
     try:
-        print("   Generating code with AI...")
-        response = llm.invoke([
-            SystemMessage(content=DEVELOPER_SYSTEM_PROMPT),
-            HumanMessage(content=user_message)
-        ])
+        logger.info("   Generating code with AI...")
+        
+        # Writes start as each changes[i] completes, overlapping generation
+        streamed = []
+        
+        def on_change(change):
+            streamed.append(change)
+            dispatch_change(change)
         
-        response_text = response.content
+        def generate():
+            # A retried stream starts over: drop what the failed one wrote
+            rollback()
+            streamed.clear()
+            return LLM_BREAKER.call(_stream_response, llm, messages, on_change)
+        
+        messages = [_SYSTEM_MESSAGE, HumanMessage(content=user_message)]
+        response_text, aborted = with_retry(generate)
         
         # Parse JSON from response - robust parsing
         try:
-            json_match = re.search(r'\{[\s\S]*\}', response_text)
-            if json_match:
-                json_str = json_match.group()
-                
-                # Step 1: Remove markdown code blocks if present
-                json_str = re.sub(r'^```json\s*', '', json_str)
-                json_str = re.sub(r'^```\s*', '', json_str)
-                json_str = re.sub(r'\s*```$', '', json_str)
-                
-                # Step 2: Replace all actual newlines/tabs with escaped versions
-                # But preserve the JSON structure
-                lines = json_str.split('\n')
-                cleaned_lines = []
-                in_string = False
-                for line in lines:
-                    cleaned_lines.append(line)
-                json_str = '\n'.join(cleaned_lines)
-                
-                # Step 3: Remove control characters (except newline, tab for now)
-                json_str = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]', '', json_str)
-                
-                # Step 4: Try to parse
-                try:
-                    result = json.loads(json_str)
-                except json.JSONDecodeError:
-                    # Try a more aggressive cleanup
-                    # Replace literal newlines in string values with \n
-                    # This is a simplified approach
-                    json_str = json_str.replace('\r\n', '\\n').replace('\r', '\\n')
-                    
-                    # Try again
-                    try:
-                        result = json.loads(json_str)
-                    except json.JSONDecodeError:
-                        # Last resort: extract just the essential parts manually
-                        print("   Attempting manual extraction...")
-                        changes = []
-                        
-                        # Look for file paths and content patterns
-                        path_matches = re.findall(r'"file_path"\s*:\s*"([^"]+)"', json_str)
-                        content_matches = re.findall(r'"content"\s*:\s*"((?:[^"\\]|\\.)*)"', json_str, re.DOTALL)
-                        
-                        for i, path in enumerate(path_matches):
-                            if i < len(content_matches):
-                                content = content_matches[i].replace('\\n', '\n').replace('\\t', '\t')
-                                changes.append({
-                                    "action": "modify",
-                                    "file_path": path,
-                                    "content": content,
-                                    "description": "Auto-extracted change"
-                                })
-                        
-                        if changes:
-                            result = {"changes": changes, "explanation": "Extracted from malformed JSON"}
-                        else:
-                            raise ValueError("Could not extract any changes from response")
-            else:
-                raise ValueError("No JSON found in response")
+            if aborted:
+                raise ValueError("Response contained a malformed change object")
+            try:
+                result = _parse_llm_json(response_text)
+            except ValueError:
+                if not streamed:
+                    raise
+                result = DevResponse(changes=list(streamed))  # Keep what already parsed cleanly
             
-            changes = result.get("changes", [])
-            test_file = result.get("test_file")
-            explanation = result.get("explanation", "")
+            changes = result.changes
+            test_file = result.test_file
+            explanation = result.explanation
             
-            print(f"   ✓ Generated {len(changes)} file changes")
+            logger.info("   ✓ Generated %s file changes", len(changes))
             if test_file:
-                print(f"   ✓ Generated test file: {test_file.get('file_path', 'unknown')}")
+                logger.info("   ✓ Generated test file: %s", test_file.file_path or 'unknown')
             
         except (json.JSONDecodeError, ValueError) as e:
-            print(f"   ⚠ JSON parse error: {e}")
-            print("   Retrying with simplified request...")
-            state["error_history"] = state.get("error_history", []) + [
-                f"Developer JSON parse failed: {str(e)}"
-            ]
+            rollback()  # Nothing from this response is recorded in changes_made
+            logger.warning("   ⚠ JSON parse error: %s", e)
+            logger.info("   Retrying with simplified request...")
+            append_error(state, f"Developer JSON parse failed: {str(e)}")
             state["attempt_count"] = attempt + 1
-            return state
+            flush_logs()
+            return state.changes()
+        
+        # Anything the stream didn't hand over (already-written content is skipped)
+        for change in changes:
+            dispatch_change(change)
+        if test_file:
+            dispatch(
+                test_file.file_path,
+                test_file.content,
+                "create",
+                "Test file for verification",
+                False
+            )
         
-        # Apply changes to files
         changes_made = []
-        local_path = Path(state.get("local_path", "."))
+        file_contents = dict(state.get("file_contents", {}))  # Copy before updating
         
-        for change in changes:
-            action = change.get("action", "modify")
-            file_path = change.get("file_path", "")
-            content = change.get("content", "")
-            description = change.get("description", "")
+        # Collect in submission order so output and changes_made stay deterministic
+        for file_path, future in futures.items():
+            content, action, description, _ = writes[file_path]
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.warning("   ⚠ Failed to write %s: %s", file_path, e)
+                append_error(state, f"Write failed for {file_path}: {str(e)}")
+                continue
             
-            if not file_path or not content:
+            if result.get("skipped"):
+                logger.debug("   = UNCHANGED: %s", file_path)
+                file_contents[file_path] = content
                 continue
             
-            full_path = local_path / file_path
+            changes_made.append({
+                "file": file_path,
+                "action": action,
+                "description": description,
+                "bytes": result.get("bytes_written", 0)
+            })
+            logger.debug("   ✓ %s: %s", action.upper(), file_path)
             
-            try:
-                result = write_file(
-                    str(full_path),
-                    content,
-                    create_dirs=True,
-                    backup=True
-                )
-                
-                changes_made.append({
-                    "file": file_path,
-                    "action": action,
-                    "description": description,
-                    "bytes": result.get("bytes_written", 0)
-                })
-                
-                print(f"   ✓ {action.upper()}: {file_path}")
-                
-                # Update file_contents cache
-                state["file_contents"][file_path] = content
-                
-            except Exception as e:
-                print(f"   ⚠ Failed to write {file_path}: {e}")
-                state["error_history"] = state.get("error_history", []) + [
-                    f"Write failed for {file_path}: {str(e)}"
-                ]
-        
-        # Write test file
-        if test_file and test_file.get("file_path") and test_file.get("content"):
-            test_path = local_path / test_file["file_path"]
-            try:
-                # Make sure tests directory exists
-                test_path.parent.mkdir(parents=True, exist_ok=True)
-                
-                write_file(
-                    str(test_path),
-                    test_file["content"],
-                    create_dirs=True
-                )
-                
-                changes_made.append({
-                    "file": test_file["file_path"],
-                    "action": "create",
-                    "description": "Test file for verification"
-                })
-                
-                print(f"   ✓ CREATE: {test_file['file_path']}")
-                
-            except Exception as e:
-                print(f"   ⚠ Failed to write test file: {e}")
+            # Update file_contents cache
+            file_contents[file_path] = content
         
+        state["file_contents"] = file_contents
         state["changes_made"] = state.get("changes_made", []) + changes_made
         state["status"] = "testing"
         
         if explanation:
-            print(f"   Summary: {explanation[:100]}...")
+            logger.info("   Summary: %s...", explanation[:100])
         
-        print("   ✓ Development phase complete!")
+        logger.info("   ✓ Development phase complete!")
+        
+    except CircuitOpenError as e:
+        rollback()
+        logger.error("   ✗ Skipping LLM call: %s", e)
+        append_error(state, f"Developer LLM unavailable: {str(e)}")
+        state["attempt_count"] = attempt + 1
         
     except Exception as e:
-        print(f"   ✗ LLM error: {e}")
-        state["error_history"] = state.get("error_history", []) + [
-            f"Developer LLM failed: {str(e)}"
-        ]
+        rollback()
+        logger.error("   ✗ LLM error: %s", e)
+        append_error(state, f"Developer LLM failed: {str(e)}")
         state["attempt_count"] = attempt + 1
     
-    return state
+    flush_logs()  # Keep our lines ahead of the next node's output
+    
+    return state.changes()
 
 
 def apply_code_fix(state: AgentState, specific_fix: str) -> AgentState:
@@ -316,13 +717,36 @@ def apply_code_fix(state: AgentState, specific_fix: str) -> AgentState:
     Returns:
         Updated state
     """
-    print(f"\n🔧 DEVELOPER: Applying quick fix...")
-    print(f"   Fix: {specific_fix[:80]}...")
+    return apply_code_fixes(state, [specific_fix])
+
+
+def apply_code_fixes(state: AgentState, fixes: List[str]) -> AgentState:
+    """
+    Apply several fixes with a single LLM call (batch prompting).
+    
+    The error output and instructions are sent once for the whole batch
+    instead of once per fix, and the model returns one change per file
+    covering every fix that touches it.
+    
+    Args:
+        state: Current agent state
+        fixes: Descriptions of the specific fixes needed
+    
+    Returns:
+        Updated state
+    """
+    if not fixes:
+        return state
+    
+    logger.info("\n🔧 DEVELOPER: Applying %s quick fix(es)...", len(fixes))
+    for fix in fixes:
+        logger.info("   Fix: %s...", fix[:80])
     
     llm = get_llm()
     
     # Get the last error and relevant code
     last_error = state.get("test_output", "")
+    fix_list = "\n".join(f"{i}. {fix}" for i, fix in enumerate(fixes, 1))
     
     fix_prompt = f"""
 A test failed with this error:
@@ -330,9 +754,11 @@ A test failed with this error:
 {last_error}
 ```
 
-The fix needed is: {specific_fix}
+Apply ALL of these {len(fixes)} fixes:
+{fix_list}
 
 Provide ONLY the corrected code as JSON with the file changes.
+Include each file at most once, with every fix that touches it applied.
 Output format:
 {{
     "changes": [
@@ -345,30 +771,39 @@ Output format:
 """
     
     try:
-        response = llm.invoke([
+        messages = [
             SystemMessage(content="You are a Python developer fixing a bug. Output only JSON."),
             HumanMessage(content=fix_prompt)
-        ])
+        ]
+        response = with_retry(lambda: LLM_BREAKER.call(llm.invoke, messages))
         
-        json_match = re.search(r'\{[\s\S]*\}', response.content)
-        if json_match:
-            result = json.loads(json_match.group())
-            
-            local_path = Path(state.get("local_path", "."))
-            for change in result.get("changes", []):
-                file_path = change.get("file_path")
-                content = change.get("content")
-                if file_path and content:
-                    write_file(str(local_path / file_path), content)
-                    print(f"   ✓ Fixed: {file_path}")
+        result = _parse_llm_json(response.content)
+        
+        # Last entry wins if the model repeats a file anyway
+        writes = {
+            change.file_path: change.content
+            for change in result.changes
+            if change.file_path and change.content
+        }
+        
+        local_path = Path(state.get("local_path", "."))
+        futures = {
+            file_path: _WRITE_POOL.submit(_write_if_changed, str(local_path / file_path), content)
+            for file_path, content in writes.items()
+        }
+        for file_path, future in futures.items():
+            if future.result().get("skipped"):
+                logger.debug("   = Unchanged: %s", file_path)
+            else:
+                logger.info("   ✓ Fixed: %s", file_path)
                     
     except Exception as e:
-        print(f"   ⚠ Quick fix failed: {e}")
+        logger.warning("   ⚠ Quick fix failed: %s", e)
     
     return state
 
 
-# For testing the node directly
+# For testing the node directly (from the repo root: python -m nodes.developer)
 if __name__ == "__main__":
     from state.schema import create_initial_state, state_summary
     
@@ -397,6 +832,6 @@ if __name__ == "__main__":
     print(state_summary(test_state))
     
     # Note: This will fail without valid API key
-    # result_state = developer_node(test_state)
+    # result_state = {**test_state, **developer_node(test_state)}
     # print("\nResult State:")
     # print(state_summary(result_state))
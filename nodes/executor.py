@@ -11,21 +11,83 @@ This is the validation node that determines if the Developer's
 work is correct.
 """
 
+import hashlib
+import shlex
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from state.schema import AgentState
+from state.schema import AgentState, COWState, set_test_output
 from tools.docker_sandbox import DockerSandbox, ExecutionResult
 from config import config
+from logging_config import get_logger, flush_logs
+
+
+logger = get_logger(__name__)
+
+
+# Spread tests over all cores when pytest-xdist is importable, and skip the
+# cache plugin so no .pytest_cache is written into the repo being committed
+PYTEST_ARGS = (
+    '--tb=short -q -p no:cacheprovider '
+    '$(python -c "import xdist" 2>/dev/null && echo "-n auto")'
+)
+
+# Installs the repo's requirements plus pytest/xdist/flake8 when missing
+# (the tests and linter run offline, so nothing can be installed later)
+INSTALL_COMMAND = """
+if [ -f requirements.txt ]; then 
+    pip install -q -r requirements.txt 2>/dev/null
+fi
+python -c "import pytest" 2>/dev/null || pip install -q pytest 2>/dev/null
+python -c "import xdist" 2>/dev/null || pip install -q pytest-xdist 2>/dev/null
+python -c "import flake8" 2>/dev/null || pip install -q flake8 2>/dev/null
+"""
+
+# Runs sandbox steps that don't depend on each other as concurrent execs
+# into the same container (install alongside the syntax check, lint
+# alongside pytest)
+_SANDBOX_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="executor-sandbox")
+
+# Execution errors kept in test_output (the head of a traceback says what broke)
+MAX_ERROR_CHARS = 8192
+
+
+# Changes to these alone can't affect the tests
+DOC_EXTENSIONS = (".md", ".rst")
+
+
+def _changed_files(changes_made: List[dict]) -> List[str]:
+    """Every file the Developer changed (including deleted ones), sorted and deduplicated."""
+    return sorted({change["file"] for change in changes_made if change.get("file")})
+
+
+def _changed_python_files(local_path: Path, files: List[str]) -> List[str]:
+    """The changed Python files that still exist."""
+    return [f for f in files if f.endswith(".py") and (local_path / f).is_file()]
+
+
+def _test_input_hash(local_path: Path, files: List[str]) -> str:
+    """Hash of the changed files' paths and contents (identical inputs -> identical results)."""
+    digest = hashlib.sha256()
+    for file_path in files:
+        digest.update(file_path.encode("utf-8") + b"\0")
+        try:
+            digest.update(b"+" + (local_path / file_path).read_bytes() + b"\0")
+        except OSError:
+            digest.update(b"-\0")  # Deleted (or unreadable)
+    return digest.hexdigest()
 
 
 def executor_node(state: AgentState) -> AgentState:
     """
     The Executor node: Runs tests in Docker sandbox.
     
+    Only the Python files the Developer changed are syntax-checked and
+    linted; pytest runs whenever anything but documentation changed. If
+    only docs changed, or the changed files are identical to the previous
+    run, the sandbox is skipped. No changes at all is a failed attempt.
+    
     Input state:
         - local_path: Path to the cloned repository
         - changes_made: Changes from Developer
@@ -33,24 +95,55 @@ def executor_node(state: AgentState) -> AgentState:
     Output state updates:
         - test_output: Combined stdout/stderr from tests
         - test_exit_code: Exit code (0 = success)
+        - test_input_hash: Hash of the files that were tested
         - status: "testing" -> (determined by Reviewer)
     """
-    print("\n🧪 EXECUTOR: Running tests...")
+    logger.info("\n🧪 EXECUTOR: Running tests...")
     
-    state = dict(state)  # Make mutable copy
+    state = COWState(state)  # Copy-on-write view: only written keys are returned
     state["status"] = "testing"
     
     local_path = state.get("local_path")
     if not local_path:
         state["test_output"] = "Error: No local path in state"
         state["test_exit_code"] = 1
-        return state
+        flush_logs()
+        return state.changes()
     
     local_path = Path(local_path)
     if not local_path.exists():
         state["test_output"] = f"Error: Path does not exist: {local_path}"
         state["test_exit_code"] = 1
-        return state
+        flush_logs()
+        return state.changes()
+    
+    # Only the files the Developer touched need checking; any of them
+    # (requirements, fixtures, config) can break the tests, except docs
+    changed = _changed_files(state.get("changes_made", []))
+    if not changed:
+        # The Developer wrote nothing (LLM error, open breaker, bad JSON):
+        # a failed attempt, not a pass - the Reviewer sends it back
+        logger.error("   ✗ No changes from the Developer - nothing to test")
+        state["test_output"] = "Error: The Developer made no changes (see error_history)."
+        state["test_exit_code"] = 1
+        flush_logs()
+        return state.changes()
+    if all(f.lower().endswith(DOC_EXTENSIONS) for f in changed):
+        logger.info("   ✓ No code changed - skipping syntax check, tests and lint")
+        state["test_output"] = "Nothing but documentation changed - skipped syntax check, tests and lint."
+        state["test_exit_code"] = 0
+        flush_logs()
+        return state.changes()
+    changed_py = _changed_python_files(local_path, changed)
+    
+    # Byte-identical inputs to the previous run give the same results
+    input_hash = _test_input_hash(local_path, changed)
+    if input_hash == state.get("test_input_hash") and state.get("test_output"):
+        logger.info("   ✓ Changed files identical to the previous run - reusing its results")
+        flush_logs()
+        return state.changes()
+    state["test_input_hash"] = input_hash
+    changed_args = " ".join(shlex.quote(f) for f in changed_py)
     
     # Initialize Docker sandbox
     try:
@@ -58,102 +151,110 @@ def executor_node(state: AgentState) -> AgentState:
         available, message = sandbox.check_docker_available()
         
         if not available:
-            print(f"   ⚠ Docker not available: {message}")
+            logger.warning("   ⚠ Docker not available: %s", message)
             # Skip Docker testing - allow workflow to continue
             state["test_output"] = f"Docker unavailable: {message}. Skipping tests - proceeding to publish."
             state["test_exit_code"] = 0  # Mark as success to proceed
-            print("   ✓ Skipping Docker tests - proceeding to publish")
-            return state
+            logger.info("   ✓ Skipping Docker tests - proceeding to publish")
+            flush_logs()
+            return state.changes()
             
     except Exception as e:
-        print(f"   ⚠ Docker init failed: {e}")
+        logger.warning("   ⚠ Docker init failed: %s", e)
         state["test_output"] = f"Docker initialization failed: {str(e)}. Skipping tests."
         state["test_exit_code"] = 0  # Mark as success to proceed
-        print("   ✓ Skipping Docker tests - proceeding to publish")
-        return state
+        logger.info("   ✓ Skipping Docker tests - proceeding to publish")
+        flush_logs()
+        return state.changes()
     
     all_outputs = []
     final_exit_code = 0
     
     try:
-        # Step 1: Check for syntax errors first
-        print("   Checking syntax...")
-        syntax_result = sandbox.execute(
-            "find . -name '*.py' -exec python -m py_compile {} \\; && echo 'Syntax OK'",
-            mount_path=str(local_path),
-            timeout=30
-        )
-        
-        if syntax_result.exit_code != 0:
-            print("   ✗ Syntax errors found")
-            all_outputs.append("=== SYNTAX CHECK ===")
-            all_outputs.append(syntax_result.stderr or syntax_result.stdout)
-            final_exit_code = 1
-        else:
-            print("   ✓ Syntax OK")
-            all_outputs.append("=== SYNTAX CHECK ===")
-            all_outputs.append("✓ All Python files have valid syntax")
-        
-        # Step 2: Run pytest if tests exist
-        print("   Running pytest...")
-        
-        # First, install dependencies if requirements.txt exists
-        install_cmd = """
-if [ -f requirements.txt ]; then 
-    pip install -q -r requirements.txt 2>/dev/null
-fi
-pip install -q pytest 2>/dev/null
-"""
-        sandbox.execute(install_cmd, mount_path=str(local_path), timeout=60)
-        
-        # Run pytest
-        pytest_result = sandbox.run_pytest(
-            test_path=".",
-            mount_path=str(local_path),
-            extra_args="--tb=short"
-        )
-        
-        all_outputs.append("\n=== PYTEST RESULTS ===")
-        all_outputs.append(pytest_result.stdout)
-        if pytest_result.stderr:
-            all_outputs.append(pytest_result.stderr)
-        
-        if pytest_result.exit_code != 0:
-            print(f"   ✗ Tests failed (exit code: {pytest_result.exit_code})")
-            final_exit_code = pytest_result.exit_code
-        else:
-            print("   ✓ Tests passed")
-        
-        # Step 3: Run linter (optional, don't fail on lint issues)
-        print("   Running linter...")
-        lint_result = sandbox.run_linter(
-            file_path=".",
-            mount_path=str(local_path)
-        )
-        
-        all_outputs.append("\n=== LINTER RESULTS ===")
-        if lint_result.stdout:
-            all_outputs.append(lint_result.stdout)
-        else:
-            all_outputs.append("✓ No linting issues found")
-        
-        # Don't fail on lint issues, just report them
-        if lint_result.exit_code != 0:
-            print(f"   ⚠ Linting issues found (non-blocking)")
-        else:
-            print("   ✓ Lint OK")
+        # One offline container for syntax, pytest and lint. Dependencies
+        # are installed by a separate networked container (the only one
+        # that mounts the shared pip cache) into the session's volume.
+        with sandbox.session(str(local_path)) as session:
+            # Install dependencies in the background while the syntax check runs
+            install_future = _SANDBOX_POOL.submit(session.install, INSTALL_COMMAND, timeout=60)
+            
+            # Step 1: Check for syntax errors first
+            if changed_py:
+                logger.info("   Checking syntax...")
+                # One interpreter for all changed files (-j 0: all cores)
+                syntax_result = session.execute(
+                    f'python -m compileall -q -j 0 {changed_args} && echo "Syntax OK"',
+                    timeout=30
+                )
+                
+                if syntax_result.exit_code != 0:
+                    logger.error("   ✗ Syntax errors found")
+                    all_outputs.append("=== SYNTAX CHECK ===")
+                    all_outputs.append(syntax_result.stderr or syntax_result.stdout)
+                    final_exit_code = 1
+                else:
+                    logger.info("   ✓ Syntax OK")
+                    all_outputs.append("=== SYNTAX CHECK ===")
+                    all_outputs.append(f"✓ All {len(changed_py)} changed Python files have valid syntax")
+            
+            # Step 2: Run pytest if tests exist
+            logger.info("   Running pytest...")
+            install_future.result()  # Dependencies must be in place first
+            
+            # The linter doesn't need pytest's results, so it runs meanwhile
+            lint_future = None
+            if changed_py:
+                lint_future = _SANDBOX_POOL.submit(session.run_linter, file_path=changed_args)
+            
+            # Run pytest
+            pytest_result = session.run_pytest(
+                test_path=".",
+                extra_args=PYTEST_ARGS
+            )
+            
+            all_outputs.append("\n=== PYTEST RESULTS ===")
+            all_outputs.append(pytest_result.stdout)
+            if pytest_result.stderr:
+                all_outputs.append(pytest_result.stderr)
+            
+            if pytest_result.exit_code != 0:
+                logger.error("   ✗ Tests failed (exit code: %s)", pytest_result.exit_code)
+                final_exit_code = pytest_result.exit_code
+            else:
+                logger.info("   ✓ Tests passed")
+            
+            # Step 3: Run linter (optional, don't fail on lint issues)
+            if lint_future is not None:
+                logger.info("   Running linter...")
+                lint_result = lint_future.result()
+                
+                all_outputs.append("\n=== LINTER RESULTS ===")
+                # Don't fail on lint issues, just report them
+                if lint_result.exit_code != 0 and not lint_result.stdout:
+                    # flake8 reports issues on stdout; none means it never ran
+                    # (e.g. not installed, and pip can't reach the network)
+                    logger.warning("   ⚠ Linter could not run (non-blocking)")
+                    all_outputs.append(f"⚠ Linter not run: {lint_result.stderr or 'flake8 unavailable'}")
+                elif lint_result.exit_code != 0:
+                    logger.warning("   ⚠ Linting issues found (non-blocking)")
+                    all_outputs.append(lint_result.stdout)
+                else:
+                    logger.info("   ✓ Lint OK")
+                    all_outputs.append("✓ No linting issues found")
         
     except Exception as e:
-        error_str = str(e)
-        print(f"   ✗ Execution error: {e}")
+        error_str = str(e)[:MAX_ERROR_CHARS]
+        logger.error("   ✗ Execution error: %s", e)
         
         # Check if it's a Docker credentials error - skip testing if so
-        if "credential" in error_str.lower() or "credsStore" in error_str:
-            print("   ⚠ Docker credentials issue detected - skipping tests")
+        folded = error_str.casefold()
+        if "credential" in folded or "credsstore" in folded:
+            logger.warning("   ⚠ Docker credentials issue detected - skipping tests")
             state["test_output"] = "Docker credentials error - skipping tests. Code changes are ready."
             state["test_exit_code"] = 0  # Mark as success to proceed to publish
             sandbox.cleanup()
-            return state
+            flush_logs()
+            return state.changes()
         
         all_outputs.append(f"\n=== EXECUTION ERROR ===\n{error_str}")
         final_exit_code = 1
@@ -162,13 +263,15 @@ pip install -q pytest 2>/dev/null
         sandbox.cleanup()
     
     # Combine all outputs
-    state["test_output"] = "\n".join(all_outputs)
+    set_test_output(state, "\n".join(all_outputs))
     state["test_exit_code"] = final_exit_code
     
-    print(f"   Final exit code: {final_exit_code}")
-    print("   ✓ Execution phase complete!")
+    logger.info("   Final exit code: %s", final_exit_code)
+    logger.info("   ✓ Execution phase complete!")
+    
+    flush_logs()  # Keep our lines ahead of the next node's output
     
-    return state
+    return state.changes()
 
 
 def run_specific_test(
@@ -229,7 +332,7 @@ def run_script(
         sandbox.cleanup()
 
 
-# For testing the node directly
+# For testing the node directly (from the repo root: python -m nodes.executor)
 if __name__ == "__main__":
     print("=== Executor Node Test ===\n")
     
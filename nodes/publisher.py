@@ -9,18 +9,32 @@ The Publisher is responsible for:
 This is the final node in the success path.
 """
 
-from pathlib import Path
+import re
+from functools import lru_cache
 from typing import Optional
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from state.schema import AgentState
-from tools.github_tools import commit_changes, push_branch, push_pr, PRResult
+from state.schema import AgentState, COWState, append_error
+from nodes.developer import developer_failed
+from tools.github_tools import acommit_and_push, apush_pr, PRResult
 from config import config
+from logging_config import get_logger, flush_logs
+
+
+logger = get_logger(__name__)
+
+
+# Request phrasing stripped from the start of PR titles (first match only)
+_PREFIX_RE = re.compile(
+    r"^(?:please |can you |could you |i want to |i need to |"
+    r"implement |add |create |fix |update )",
+    re.IGNORECASE
+)
+
+# Change action -> marker used in the PR body
+_ACTION_EMOJI = {"create": "➕", "modify": "✏️", "delete": "🗑️"}
 
 
-def publisher_node(state: AgentState) -> AgentState:
+async def publisher_node(state: AgentState) -> AgentState:
     """
     The Publisher node: Commits changes and creates a Pull Request.
     
@@ -35,121 +49,134 @@ def publisher_node(state: AgentState) -> AgentState:
         - pr_url: URL of the created PR
         - status: "publishing" -> "completed" or "failed"
     """
-    print("\n📤 PUBLISHER: Creating Pull Request...")
+    logger.info("\n📤 PUBLISHER: Creating Pull Request...")
     
-    state = dict(state)  # Make mutable copy
+    state = COWState(state)  # Copy-on-write view: only written keys are returned
     
     local_path = state.get("local_path")
     if not local_path:
         state["status"] = "failed"
-        state["error_history"] = state.get("error_history", []) + [
-            "Publisher: No local path in state"
-        ]
-        return state
+        append_error(state, "Publisher: No local path in state")
+        flush_logs()
+        return state.changes()
+    
+    # Nothing was written - no commit, push or PR to make. That is only a
+    # success if the Developer didn't fail to produce anything.
+    if not state.get("changes_made"):
+        if developer_failed(state):
+            logger.error("   ✗ No changes - the Developer failed")
+            state["status"] = "failed"
+            append_error(state, "Publisher: No changes to publish (the Developer failed)")
+            flush_logs()
+            return state.changes()
+        logger.warning("   ⚠ No changes - skipping publish")
+        state["pr_url"] = None
+        state["status"] = "completed"
+        flush_logs()
+        return state.changes()
     
     branch_name = state.get("branch_name", "auto-dev-feature")
     user_request = state.get("user_request", "Auto-generated changes")
     
     # Create PR title from user request
     pr_title = _create_pr_title(user_request)
-    print(f"   PR Title: {pr_title}")
+    logger.info("   PR Title: %s", pr_title)
     
     # Create PR body from plan and changes
     pr_body = _create_pr_body(state)
     
-    # Step 1: Commit all changes
-    print("   Committing changes...")
+    # Steps 1-2: Commit all changes and push the branch (one git pipeline)
+    logger.info("   Committing and pushing branch: %s...", branch_name)
     commit_message = _create_commit_message(state)
-    
-    success, commit_result = commit_changes(
-        local_path=local_path,
-        message=commit_message,
-        add_all=True
-    )
-    
-    if not success:
-        if "No changes" in commit_result:
-            print("   ⚠ No changes to commit")
-        else:
-            print(f"   ⚠ Commit issue: {commit_result}")
-    else:
-        print(f"   ✓ Committed: {commit_result}")
-    
-    # Step 2: Push branch
-    print(f"   Pushing branch: {branch_name}...")
-    push_success, push_msg = push_branch(
-        local_path=local_path,
-        branch_name=branch_name,
-        force=False
-    )
-    
-    if not push_success:
-        print(f"   ✗ Push failed: {push_msg}")
-        state["status"] = "failed"
-        state["error_history"] = state.get("error_history", []) + [
-            f"Push failed: {push_msg}"
-        ]
-        return state
-    
-    print(f"   ✓ Pushed: {push_msg}")
-    
-    # Step 3: Create Pull Request
-    print("   Creating Pull Request...")
-    pr_result: PRResult = push_pr(
+    push_outcome = {}
+    
+    async def commit_and_push():
+        push_success, push_msg = await acommit_and_push(
+            local_path=local_path,
+            message=commit_message,
+            branch_name=branch_name
+        )
+        push_outcome["success"] = push_success
+        if push_success:
+            for line in push_msg.splitlines():
+                if line.startswith("No changes"):
+                    logger.warning("   ⚠ %s", line)
+                else:
+                    logger.info("   ✓ %s", line)
+            logger.info("   Creating Pull Request...")
+        return push_success, push_msg
+    
+    # Step 3: Create Pull Request (the existing-PR lookup overlaps the push)
+    pr_result: PRResult = await apush_pr(
         local_path=local_path,
         title=pr_title,
         body=pr_body,
         branch_name=branch_name,
-        base_branch="main"  # Could be configurable
+        base_branch="main",  # Could be configurable
+        push=commit_and_push()
     )
     
     if pr_result.success:
-        print(f"   ✓ {pr_result.message}")
-        print(f"   🔗 {pr_result.pr_url}")
+        logger.info("   ✓ %s", pr_result.message)
+        logger.info("   🔗 %s", pr_result.pr_url)
         state["pr_url"] = pr_result.pr_url
         state["status"] = "completed"
+    elif not push_outcome.get("success"):
+        logger.error("   ✗ %s", pr_result.message)
+        state["status"] = "failed"
+        append_error(state, pr_result.message)
+        flush_logs()
+        return state.changes()
     else:
-        print(f"   ✗ PR creation failed: {pr_result.message}")
+        logger.error("   ✗ PR creation failed: %s", pr_result.message)
         state["status"] = "failed"
-        state["error_history"] = state.get("error_history", []) + [
-            f"PR creation failed: {pr_result.message}"
-        ]
+        append_error(state, f"PR creation failed: {pr_result.message}")
     
-    print("   ✓ Publishing phase complete!")
-    return state
+    logger.info("   ✓ Publishing phase complete!")
+    flush_logs()  # Keep our lines ahead of the next node's output
+    
+    return state.changes()
 
 
-def _create_pr_title(user_request: str) -> str:
+@lru_cache(maxsize=256)
+def _title_without_prefix(user_request: str) -> str:
     """
-    Create a PR title from the user request.
+    Turn the user request into a title, without the "[Auto-Dev]" tag.
+    
+    Shared (and cached) by the PR title and the commit message.
     
     Args:
         user_request: Original user request
     
     Returns:
-        Formatted PR title (max 72 chars)
+        Request with common phrasing removed and the first letter capitalized
     """
     # Clean up the request
     title = user_request.strip()
     
     # Remove common prefixes
-    prefixes_to_remove = [
-        "please ", "can you ", "could you ", "i want to ", "i need to ",
-        "implement ", "add ", "create ", "fix ", "update "
-    ]
-    
-    title_lower = title.lower()
-    for prefix in prefixes_to_remove:
-        if title_lower.startswith(prefix):
-            title = title[len(prefix):]
-            break
+    title = _PREFIX_RE.sub("", title, count=1)
     
     # Capitalize first letter
     if title:
         title = title[0].upper() + title[1:]
     
+    return title
+
+
+@lru_cache(maxsize=256)
+def _create_pr_title(user_request: str) -> str:
+    """
+    Create a PR title from the user request.
+    
+    Args:
+        user_request: Original user request
+    
+    Returns:
+        Formatted PR title (max 72 chars)
+    """
     # Add prefix
-    title = f"[Auto-Dev] {title}"
+    title = f"[Auto-Dev] {_title_without_prefix(user_request)}"
     
     # Truncate if too long
     if len(title) > 72:
@@ -172,7 +199,7 @@ def _create_commit_message(state: AgentState) -> str:
     changes_made = state.get("changes_made", [])
     
     # Title
-    title = _create_pr_title(user_request).replace("[Auto-Dev] ", "")
+    title = _title_without_prefix(user_request)
     if len(title) > 50:
         title = title[:47] + "..."
     
@@ -214,7 +241,7 @@ def _create_pr_body(state: AgentState) -> str:
     changes_made = state.get("changes_made", [])
     attempt_count = state.get("attempt_count", 0)
     
-    body = f"""## 🤖 Auto-Generated Pull Request
+    parts = [f"""## 🤖 Auto-Generated Pull Request
 
 This PR was created automatically by the Self-Healing Agent System.
 
@@ -222,34 +249,33 @@ This PR was created automatically by the Self-Healing Agent System.
 {user_request}
 
 ### 🎯 Implementation Plan
-"""
+"""]
     
-    for i, step in enumerate(plan, 1):
-        body += f"{i}. {step}\n"
+    parts.extend(f"{i}. {step}\n" for i, step in enumerate(plan, 1))
     
-    body += "\n### 📝 Changes Made\n"
+    parts.append("\n### 📝 Changes Made\n")
     
     for change in changes_made:
         action = change.get("action", "modify")
         file = change.get("file", "unknown")
         desc = change.get("description", "No description")
         
-        emoji = {"create": "➕", "modify": "✏️", "delete": "🗑️"}.get(action, "📄")
-        body += f"- {emoji} **{file}**: {desc}\n"
+        emoji = _ACTION_EMOJI.get(action, "📄")
+        parts.append(f"- {emoji} **{file}**: {desc}\n")
     
-    body += f"""
+    parts.append(f"""
 ### 🔄 Execution Summary
 - **Attempts**: {attempt_count + 1}
 - **Status**: ✅ All tests passed
 
 ---
 *Generated by [Auto-Dev Agent](https://github.com/your-org/auto-dev)*
-"""
+""")
     
-    return body
+    return "".join(parts)
 
 
-def create_draft_pr(state: AgentState) -> AgentState:
+async def create_draft_pr(state: AgentState) -> AgentState:
     """
     Create a draft PR (for manual review before merging).
     
@@ -262,11 +288,11 @@ def create_draft_pr(state: AgentState) -> AgentState:
         Updated state
     """
     # For now, use the same logic
-    # In the future, PyGithub supports draft=True parameter
-    return publisher_node(state)
+    # In the future, the pulls API supports a draft=true field
+    return await publisher_node(state)
 
 
-# For testing the node directly
+# For testing the node directly (from the repo root: python -m nodes.publisher)
 if __name__ == "__main__":
     from state.schema import create_initial_state
     
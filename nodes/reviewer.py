@@ -11,19 +11,35 @@ It makes deterministic decisions based on the test results:
 This prevents infinite loops and ensures the system fails gracefully.
 """
 
-from pathlib import Path
+import re
 from typing import Literal
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from state.schema import AgentState
+from state.schema import AgentState, COWState, append_error
 from config import config
+from logging_config import get_logger, flush_logs
+
+
+logger = get_logger(__name__)
 
 
 # Routing outcomes
 NextNode = Literal["developer", "publisher", "human_intervention"]
 
+# Error-shaped lines in test output (matched case-insensitively):
+# - pytest's "E   ..." detail lines (case-sensitive)
+# - Python exceptions and assertion errors
+# - assertion failures ("assert" and "failed" on one line)
+# - failed tests ("failed" with "test" or "::" on one line)
+_ERROR_LINE_RE = re.compile(
+    r"^[ \t]*("
+    r"(?-i:E )[^\n]*"
+    r"|[^\n]*(?:error:|exception:|assertionerror)[^\n]*"
+    r"|[^\n]*(?:assert[^\n]*failed|failed[^\n]*assert)[^\n]*"
+    r"|[^\n]*(?:failed[^\n]*(?:test|::)|(?:test|::)[^\n]*failed)[^\n]*"
+    r")$",
+    re.MULTILINE | re.IGNORECASE
+)
+
 
 def reviewer_node(state: AgentState) -> AgentState:
     """
@@ -43,55 +59,53 @@ def reviewer_node(state: AgentState) -> AgentState:
     
     Returns the state with routing info implicit in status.
     """
-    print("\n📋 REVIEWER: Analyzing test results...")
+    logger.info("\n📋 REVIEWER: Analyzing test results...")
     
-    state = dict(state)  # Make mutable copy
+    state = COWState(state)  # Copy-on-write view: only written keys are returned
     
     exit_code = state.get("test_exit_code", -1)
     attempt_count = state.get("attempt_count", 0)
     max_attempts = config.MAX_RETRY_ATTEMPTS
     
-    print(f"   Exit Code: {exit_code}")
-    print(f"   Attempt: {attempt_count + 1}/{max_attempts}")
+    logger.info("   Exit Code: %s", exit_code)
+    logger.info("   Attempt: %s/%s", attempt_count + 1, max_attempts)
     
     # Decision logic
     if exit_code == 0:
         # SUCCESS PATH
-        print("   ✓ Decision: PUBLISH - Tests passed!")
+        logger.info("   ✓ Decision: PUBLISH - Tests passed!")
         state["status"] = "publishing"
         # Don't increment attempt_count on success
         
     elif attempt_count < max_attempts - 1:  # -1 because we're about to increment
         # RETRY PATH
-        print("   ↻ Decision: RETRY - Tests failed, attempting fix...")
+        logger.info("   ↻ Decision: RETRY - Tests failed, attempting fix...")
         
         # Extract key error info for Developer
         test_output = state.get("test_output", "")
         error_summary = _extract_error_summary(test_output)
         
         # Add to error history for context
-        state["error_history"] = state.get("error_history", []) + [
-            f"Attempt {attempt_count + 1}: {error_summary}"
-        ]
+        append_error(state, f"Attempt {attempt_count + 1}: {error_summary}")
         
         # Increment attempt count
         state["attempt_count"] = attempt_count + 1
         state["status"] = "developing"  # Go back to Developer
         
-        print(f"   Error: {error_summary[:80]}...")
+        logger.info("   Error: %s...", error_summary[:80])
         
     else:
         # FAILURE PATH - Max retries exceeded
-        print("   ✗ Decision: HUMAN INTERVENTION - Max retries exceeded")
+        logger.error("   ✗ Decision: HUMAN INTERVENTION - Max retries exceeded")
         
-        state["error_history"] = state.get("error_history", []) + [
-            f"Attempt {attempt_count + 1}: Max retries exceeded"
-        ]
+        append_error(state, f"Attempt {attempt_count + 1}: Max retries exceeded")
         state["attempt_count"] = attempt_count + 1
         state["status"] = "failed"
     
-    print("   ✓ Review phase complete!")
-    return state
+    logger.info("   ✓ Review phase complete!")
+    flush_logs()  # Keep our lines ahead of the next node's output
+    
+    return state.changes()
 
 
 def get_next_node(state: AgentState) -> NextNode:
@@ -146,43 +160,40 @@ def _extract_error_summary(test_output: str) -> str:
     if not test_output:
         return "Unknown error (no output)"
     
-    lines = test_output.split("\n")
-    
-    # Look for common error patterns
-    error_lines = []
-    
-    for i, line in enumerate(lines):
-        line_lower = line.lower()
-        
-        # Python exceptions
-        if "error:" in line_lower or "exception:" in line_lower:
-            error_lines.append(line.strip())
-        
-        # Assertion failures
-        if "assertionerror" in line_lower or "assert" in line_lower and "failed" in line_lower:
-            error_lines.append(line.strip())
-        
-        # Test failures
-        if "failed" in line_lower and ("test" in line_lower or "::" in line):
-            error_lines.append(line.strip())
-        
-        # Tracebacks (get the last few lines)
-        if line.strip().startswith("E "):
-            error_lines.append(line.strip())
+    # One C-level scan over the whole output, in line order
+    error_lines = [line.strip() for line in _ERROR_LINE_RE.findall(test_output)]
     
     if error_lines:
         # Return first few unique errors
         unique_errors = list(dict.fromkeys(error_lines))[:3]
         return " | ".join(unique_errors)
     
-    # Fallback: return last non-empty lines
-    non_empty = [l.strip() for l in lines if l.strip()]
-    if non_empty:
-        return " | ".join(non_empty[-3:])
+    # Fallback: return last non-empty lines (scanned from the end)
+    tail = []
+    end = len(test_output)
+    while end > 0 and len(tail) < 3:
+        start = test_output.rfind("\n", 0, end) + 1
+        line = test_output[start:end].strip()
+        if line:
+            tail.append(line)
+        end = start - 1
+    if tail:
+        return " | ".join(reversed(tail))
     
     return "Tests failed (see full output)"
 
 
+_REPORT_TEMPLATE = """
+╔══════════════════════════════════════════════════════════════╗
+║                    REVIEWER DECISION REPORT                  ║
+╠══════════════════════════════════════════════════════════════╣
+║  Test Exit Code: {exit_code:<43} ║
+║  Attempt Number: {attempts}/{max_attempts:<41} ║
+║  Decision: {decision:<49} ║
+╚══════════════════════════════════════════════════════════════╝
+"""
+
+
 def format_decision_report(state: AgentState) -> str:
     """
     Format a human-readable decision report.
@@ -197,25 +208,23 @@ def format_decision_report(state: AgentState) -> str:
     exit_code = state.get("test_exit_code", -1)
     attempts = state.get("attempt_count", 0)
     
-    report = f"""
-╔══════════════════════════════════════════════════════════════╗
-║                    REVIEWER DECISION REPORT                  ║
-╠══════════════════════════════════════════════════════════════╣
-║  Test Exit Code: {exit_code:<43} ║
-║  Attempt Number: {attempts}/{config.MAX_RETRY_ATTEMPTS:<41} ║
-║  Decision: {status.upper():<49} ║
-╚══════════════════════════════════════════════════════════════╝
-"""
+    report = _REPORT_TEMPLATE.format_map({
+        "exit_code": exit_code,
+        "attempts": attempts,
+        "max_attempts": config.MAX_RETRY_ATTEMPTS,
+        "decision": status.upper()
+    })
     
     if state.get("error_history"):
-        report += "\nError History:\n"
-        for error in state["error_history"][-5:]:
-            report += f"  • {error[:60]}...\n" if len(error) > 60 else f"  • {error}\n"
+        report += "\nError History:\n" + "".join(
+            f"  • {error[:60]}{'...' * (len(error) > 60)}\n"
+            for error in state["error_history"][-5:]
+        )
     
     return report
 
 
-# For testing the node directly
+# For testing the node directly (from the repo root: python -m nodes.reviewer)
 if __name__ == "__main__":
     from state.schema import create_initial_state, state_summary
     
@@ -231,7 +240,7 @@ if __name__ == "__main__":
     state1["test_output"] = "All tests passed!"
     state1["attempt_count"] = 0
     
-    result1 = reviewer_node(state1)
+    result1 = {**state1, **reviewer_node(state1)}
     print(f"Status: {result1['status']}")
     print(f"Next: {get_next_node(result1)}")
     
@@ -245,7 +254,7 @@ if __name__ == "__main__":
     state2["test_output"] = "AssertionError: Expected 5, got 3"
     state2["attempt_count"] = 1
     
-    result2 = reviewer_node(state2)
+    result2 = {**state2, **reviewer_node(state2)}
     print(f"Status: {result2['status']}")
     print(f"Next: {get_next_node(result2)}")
     print(f"Attempts: {result2['attempt_count']}")
@@ -260,7 +269,7 @@ if __name__ == "__main__":
     state3["test_output"] = "Still failing"
     state3["attempt_count"] = 2  # Already at max - 1
     
-    result3 = reviewer_node(state3)
+    result3 = {**state3, **reviewer_node(state3)}
     print(f"Status: {result3['status']}")
     print(f"Next: {get_next_node(result3)}")
     print(format_decision_report(result3))
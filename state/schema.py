@@ -5,7 +5,10 @@ This is the "brain" that is passed between all agents in the LangGraph.
 It maintains all context needed for the autonomous coding workflow.
 """
 
-from typing import TypedDict, List, Optional, Literal
+from collections import ChainMap
+from collections.abc import Iterator, Mapping, MutableMapping
+from types import MappingProxyType
+from typing import Any, TypedDict, List, Optional, Literal
 
 
 class AgentState(TypedDict, total=False):
@@ -22,12 +25,14 @@ class AgentState(TypedDict, total=False):
         local_path: Local filesystem path where repo is cloned
         file_map: Complete list of all files in the repository
         relevant_files: Subset of files specifically needed for this task
+        context_files: Formatted README/config file contents for the Architect
         file_contents: Dict mapping file paths to their contents
         plan: Step-by-step implementation plan created by Architect
         current_step: Index of the current step being executed
         changes_made: List of changes made by Developer
         test_output: The most recent output from Docker test execution
         test_exit_code: Exit code from the last test run
+        test_input_hash: Hash of the changed files the last test run checked
         attempt_count: Number of retry attempts (max 3 to prevent infinite loops)
         error_history: History of errors encountered during retries
         status: Current overall status of the workflow
@@ -46,6 +51,7 @@ class AgentState(TypedDict, total=False):
     # File Analysis (from Architect)
     file_map: List[str]
     relevant_files: List[str]
+    context_files: List[str]
     file_contents: dict[str, str]
     
     # Implementation Plan (from Architect)
@@ -58,6 +64,7 @@ class AgentState(TypedDict, total=False):
     # Test Results (from Executor)
     test_output: str
     test_exit_code: int
+    test_input_hash: str
     
     # Retry Management
     attempt_count: int
@@ -96,12 +103,14 @@ def create_initial_state(
         user_request=user_request,
         file_map=[],
         relevant_files=[],
+        context_files=[],
         file_contents={},
         plan=[],
         current_step=0,
         changes_made=[],
         test_output="",
         test_exit_code=-1,
+        test_input_hash="",
         attempt_count=0,
         error_history=[],
         status="initialized",
@@ -110,6 +119,116 @@ def create_initial_state(
     )
 
 
+class COWState(MutableMapping):
+    """
+    Copy-on-write view over an AgentState.
+    
+    Reads fall through to the base state; writes land in a small overlay,
+    so a node never copies the whole state (file_contents can hold
+    megabytes of source). Nodes return `changes()` and LangGraph merges
+    the written keys into the graph state.
+    
+    Mutable values read from the base (lists, dicts) are shared, so
+    nodes must replace them rather than mutate them in place.
+    
+    Example:
+        state = COWState(state)
+        state["status"] = "testing"
+        return state.changes()  # {"status": "testing"}
+    """
+    
+    __slots__ = ("_base", "_overlay")
+    
+    def __init__(self, base: Mapping[str, Any]):
+        self._base = base
+        self._overlay: dict[str, Any] = {}
+    
+    def __getitem__(self, key: str) -> Any:
+        if key in self._overlay:
+            return self._overlay[key]
+        return self._base[key]
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._overlay[key] = value
+    
+    def __delitem__(self, key: str) -> None:
+        # Only overlay writes can be undone; the base state is read-only
+        del self._overlay[key]
+    
+    def __iter__(self) -> Iterator[str]:
+        yield from self._overlay
+        yield from (key for key in self._base if key not in self._overlay)
+    
+    def __len__(self) -> int:
+        return len(self._base.keys() | self._overlay.keys())
+    
+    def __contains__(self, key: object) -> bool:
+        return key in self._overlay or key in self._base
+    
+    def mutable_copy(self) -> "COWState":
+        """Return a new COWState layered over this one (constant time)."""
+        return COWState(ChainMap(self._overlay, self._base))
+    
+    def freeze(self) -> Mapping[str, Any]:
+        """Return a read-only view of the current state."""
+        return MappingProxyType(ChainMap(self._overlay, self._base))
+    
+    def changes(self) -> dict[str, Any]:
+        """Return only the keys written through this view."""
+        return dict(self._overlay)
+
+
+# Oldest entries are dropped past this; prompts only use the last few
+MAX_ERROR_HISTORY = 32
+
+
+def with_error(history: List[str], message: str) -> List[str]:
+    """
+    Return a new error history with `message` added, at most MAX_ERROR_HISTORY long.
+    
+    For nodes that return a partial update dict rather than a COWState.
+    """
+    return [*history[-(MAX_ERROR_HISTORY - 1):], message]
+
+
+def append_error(state: MutableMapping, message: str) -> None:
+    """
+    Record an error in state["error_history"], keeping it bounded.
+    
+    Builds a new list (the base state's list is shared, see COWState)
+    holding at most the newest MAX_ERROR_HISTORY entries, so the state
+    passed between nodes on every step stays a constant size.
+    
+    Args:
+        state: State (or COWState view) to update
+        message: Error description
+    """
+    state["error_history"] = with_error(state.get("error_history", []), message)
+
+
+# Test output kept in state (the end of a pytest run has the failures and summary)
+TEST_OUTPUT_TAIL_KB = 64
+
+
+def set_test_output(state: MutableMapping, output: str, tail_kb: int = TEST_OUTPUT_TAIL_KB) -> None:
+    """
+    Store test output in state["test_output"], keeping only its tail.
+    
+    Test runs can print megabytes; the Reviewer scans this text and the
+    Developer's retry prompt includes it, so only the last `tail_kb` KB
+    are kept.
+    
+    Args:
+        state: State (or COWState view) to update
+        output: Combined test output
+        tail_kb: Kilobytes (characters / 1024) to keep from the end
+    """
+    limit = tail_kb * 1024
+    if len(output) > limit:
+        output = f"... [{len(output) - limit} characters truncated]\n" + output[-limit:]
+    state["test_output"] = output
+
+
 def state_summary(state: AgentState) -> str:
     """
     Generate a human-readable summary of the current state.
@@ -0,0 +1,121 @@
+// Number of log lines shown so far (matches the server's log cursor)
+let logCursor = 0;
+
+function setExample(text) {
+    document.getElementById('request').value = text;
+}
+
+document.getElementById('agentForm').addEventListener('submit', async (e) => {
+    e.preventDefault();
+
+    const repo = document.getElementById('repo').value;
+    const request = document.getElementById('request').value;
+    const branch = document.getElementById('branch').value;
+
+    if (!repo || !request) {
+        alert('Please fill in the repository URL and task description');
+        return;
+    }
+
+    // Update UI
+    document.getElementById('submitBtn').disabled = true;
+    document.getElementById('submitBtn').textContent = '⏳ Running...';
+    document.getElementById('statusBar').className = 'status-bar status-running';
+    document.getElementById('statusIcon').innerHTML = '<div class="spinner"></div>';
+    document.getElementById('statusText').textContent = 'Agent is working...';
+    document.getElementById('logContainer').innerHTML = '';
+    document.getElementById('prResult').style.display = 'none';
+    logCursor = 0;
+
+    try {
+        const response = await fetch('/run', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({repo, request, branch})
+        });
+
+        const result = await response.json();
+
+        // Start streaming logs
+        streamLogs(result.job_id);
+
+    } catch (error) {
+        showError('Failed to start agent: ' + error.message);
+    }
+});
+
+function appendLog(text) {
+    const logContainer = document.getElementById('logContainer');
+    const line = document.createElement('div');
+    line.textContent = text;
+    logContainer.appendChild(line);
+    logContainer.scrollTop = logContainer.scrollHeight;
+}
+
+function streamLogs(jobId) {
+    const source = new EventSource(`/stream/${jobId}`);
+
+    source.onmessage = (e) => {
+        // Skip lines already shown from /status
+        const cursor = Number(e.lastEventId);
+        if (cursor <= logCursor) return;
+        logCursor = cursor;
+        appendLog(e.data);
+    };
+
+    source.addEventListener('done', (e) => {
+        source.close();
+        finishRun(JSON.parse(e.data));
+    });
+}
+
+function finishRun(data) {
+    document.getElementById('submitBtn').disabled = false;
+    document.getElementById('submitBtn').textContent = '🚀 Run Agent';
+
+    if (data.pr_url) {
+        document.getElementById('statusBar').className = 'status-bar status-success';
+        document.getElementById('statusIcon').textContent = '✅';
+        document.getElementById('statusText').textContent = 'Success! PR created.';
+        document.getElementById('prLink').href = data.pr_url;
+        document.getElementById('prResult').style.display = 'block';
+    } else if (data.status === 'failed') {
+        document.getElementById('statusBar').className = 'status-bar status-error';
+        document.getElementById('statusIcon').textContent = '❌';
+        document.getElementById('statusText').textContent = 'Failed. Check logs below.';
+    } else {
+        document.getElementById('statusBar').className = 'status-bar status-idle';
+        document.getElementById('statusIcon').textContent = '⏸️';
+        document.getElementById('statusText').textContent = 'Ready';
+    }
+}
+
+// Reattach to a job that is already running (e.g. after a page reload)
+window.addEventListener('load', async () => {
+    try {
+        const response = await fetch('/status');
+        const data = await response.json();
+
+        if (data.running) {
+            document.getElementById('submitBtn').disabled = true;
+            document.getElementById('submitBtn').textContent = '⏳ Running...';
+            document.getElementById('statusBar').className = 'status-bar status-running';
+            document.getElementById('statusIcon').innerHTML = '<div class="spinner"></div>';
+            document.getElementById('statusText').textContent = 'Agent is working...';
+            document.getElementById('logContainer').innerHTML = '';
+            data.logs.forEach(appendLog);
+            logCursor = data.cursor;
+            streamLogs(data.job_id);
+        }
+    } catch (error) {
+        console.error('Status error:', error);
+    }
+});
+
+function showError(message) {
+    document.getElementById('submitBtn').disabled = false;
+    document.getElementById('submitBtn').textContent = '🚀 Run Agent';
+    document.getElementById('statusBar').className = 'status-bar status-error';
+    document.getElementById('statusIcon').textContent = '❌';
+    document.getElementById('statusText').textContent = message;
+}
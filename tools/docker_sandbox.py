@@ -3,24 +3,35 @@ Docker Sandbox for the Self-Healing Agent System.
 
 Provides isolated code execution in Docker containers:
 - Safe execution of untrusted code
-- Persistent container management
+- Persistent container management (one warm container per mount,
+  commands are exec'd into it)
 - Captures stdout, stderr, and exit codes
 
 This is the critical "Safety Net" that prevents the AI from
 accidentally damaging the host system.
 """
 
+import atexit
 import docker
+import docker.utils.socket
 import tempfile
 import os
+import socket
+import subprocess
+import sys
+import threading
 import time
-from typing import Optional, Tuple
+import uuid
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
 from config import config
+from logging_config import get_logger
+
+
+logger = get_logger(__name__)
 
 
 @dataclass
@@ -51,6 +62,299 @@ class ExecutionResult:
         return output.strip()
 
 
+# Memory cap for trusted-mode processes (matches the container mem_limit)
+TRUSTED_MEMORY_LIMIT = 512 * 1024 * 1024
+
+
+def _limit_trusted_process(cpu_seconds: int):
+    """preexec_fn for trusted-mode processes: cap CPU time and address space."""
+    import resource  # POSIX only; trusted mode skips limits elsewhere
+    
+    def apply():
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds))
+        resource.setrlimit(resource.RLIMIT_AS, (TRUSTED_MEMORY_LIMIT, TRUSTED_MEMORY_LIMIT))
+    return apply
+
+
+# Named volume holding pip's download/wheel cache, shared by all sandboxes.
+# Only install containers mount it (read-write); the containers that run a
+# repo's tests and linter never see it, so they can't poison it.
+PIP_CACHE_VOLUME = "autodev-pip-cache"
+PIP_CACHE_DIR = "/root/.cache/pip"
+
+# Where SandboxSession.install() puts packages: pip's user base, on a
+# per-session volume (read-write for the install, read-only in the session)
+DEPS_DIR = "/opt/autodev-deps"
+
+# Background image pulls started by prefetch_image(), by image name
+_PREFETCHES: dict[str, threading.Thread] = {}
+_PREFETCH_LOCK = threading.Lock()
+
+# Network for commands that pip-install packages: docker's default bridge
+# (never "host", which would expose the host's loopback services). Anything
+# that runs the repo's code stays on "none": use SandboxSession.install(),
+# or call disconnect_network() on a networked session before running it.
+INSTALL_NETWORK = "bridge"
+
+
+def _ensure_installed(module: str, package: str) -> str:
+    """Shell snippet that pip-installs `package` only if `module` can't be imported."""
+    return f'{{ python -c "import {module}" 2>/dev/null || pip install -q {package}; }}'
+
+
+def _pytest_command(test_path: str = ".", extra_args: str = "") -> str:
+    """Shell command that installs (if needed) and runs pytest."""
+    # First install pytest if not in image
+    return f"{_ensure_installed('pytest', 'pytest')} && python -m pytest {test_path} -v {extra_args}"
+
+
+def _linter_command(file_path: str = ".") -> str:
+    """Shell command that installs (if needed) and runs flake8."""
+    return f"{_ensure_installed('flake8', 'flake8')} && python -m flake8 {file_path} --max-line-length=100"
+
+
+def _remove(container) -> None:
+    """Force-remove a sandbox container, ignoring one that is already gone."""
+    try:
+        container.remove(force=True)
+    except docker.errors.APIError:
+        pass  # Already removed (auto_remove) or removal in progress
+
+
+class SandboxSession:
+    """
+    A running sandbox container that commands are exec'd into.
+    
+    Created by DockerSandbox.session() (and internally by execute());
+    every command shares the same container, so its startup cost is
+    paid once.
+    """
+    
+    # Exit status of coreutils `timeout` when the command ran too long
+    TIMEOUT_EXIT_CODE = 124
+    
+    def __init__(
+        self,
+        container,
+        workdir: str,
+        timeout: int,
+        network: str = "none",
+        installer: Optional[Callable[[str, Optional[int]], ExecutionResult]] = None
+    ):
+        self._container = container
+        self.workdir = workdir
+        self.timeout = timeout
+        self.network = network
+        self._installer = installer
+    
+    def install(self, command: str, timeout: Optional[int] = None) -> ExecutionResult:
+        """
+        Run a pip-installing command in a separate, networked container.
+        
+        That container has the shared pip cache (read-write) and this
+        session's dependency volume; what it installs (pip installs go to
+        the user base, DEPS_DIR) is importable here, while this container
+        stays offline and never mounts the cache.
+        
+        Args:
+            command: Shell command that installs packages
+            timeout: Override default timeout
+        
+        Returns:
+            ExecutionResult of the install command
+        """
+        if self._installer is None:
+            raise RuntimeError("This session has no install container (use DockerSandbox.session())")
+        return self._installer(command, timeout)
+    
+    def disconnect_network(self) -> None:
+        """
+        Cut the container off from its network (e.g. after installing).
+        
+        Later commands only have loopback, as in a "none" container.
+        Raises RuntimeError if the container couldn't be disconnected, so
+        untrusted code never runs with network access by mistake.
+        """
+        if self.network == "none":
+            return
+        
+        try:
+            self._container.client.networks.get(self.network).disconnect(self._container)
+        except docker.errors.APIError as e:
+            raise RuntimeError(f"Could not disconnect the sandbox from '{self.network}': {e}")
+        self.network = "none"
+    
+    def execute(
+        self,
+        command: str,
+        env: Optional[dict] = None,
+        timeout: Optional[int] = None
+    ) -> ExecutionResult:
+        """
+        Execute a shell command in the session's container.
+        
+        Args:
+            command: The command to execute
+            env: Optional environment variables
+            timeout: Override default timeout
+        
+        Returns:
+            ExecutionResult with stdout, stderr, exit_code
+        """
+        timeout = timeout or self.timeout
+        start_time = time.time()
+        
+        try:
+            # exec_run has no timeout of its own, so enforce it in the container
+            exit_code, (stdout, stderr) = self._container.exec_run(
+                ["timeout", str(timeout), "sh", "-c", command],
+                workdir=self.workdir,
+                environment=env or {},
+                demux=True
+            )
+        except docker.errors.APIError as e:
+            raise RuntimeError(f"Docker API error: {e}")
+        
+        return self._result(exit_code, stdout, stderr, start_time)
+    
+    def execute_python(
+        self,
+        code: str,
+        env: Optional[dict] = None,
+        timeout: Optional[int] = None
+    ) -> ExecutionResult:
+        """
+        Execute Python code in the session's container.
+        
+        The code is piped to `python -` on stdin, so it is never parsed
+        by a shell (no quoting, no argv length limit).
+        
+        Args:
+            code: Python code to execute
+            env: Optional environment variables
+            timeout: Override default timeout
+        
+        Returns:
+            ExecutionResult with stdout, stderr, exit_code
+        """
+        timeout = timeout or self.timeout
+        start_time = time.time()
+        api = self._container.client.api
+        
+        try:
+            exec_id = api.exec_create(
+                self._container.id,
+                ["timeout", str(timeout), "python", "-"],
+                stdin=True,
+                workdir=self.workdir,
+                environment=env or {}
+            )["Id"]
+            stream = api.exec_start(exec_id, socket=True)
+            try:
+                raw = getattr(stream, "_sock", stream)
+                raw.sendall(code.encode("utf-8"))
+                raw.shutdown(socket.SHUT_WR)  # EOF on python's stdin
+                stdout, stderr = docker.utils.socket.consume_socket_output(
+                    docker.utils.socket.frames_iter(stream, tty=False), demux=True
+                )
+            finally:
+                stream.close()
+            exit_code = api.exec_inspect(exec_id)["ExitCode"]
+        except docker.errors.APIError as e:
+            raise RuntimeError(f"Docker API error: {e}")
+        
+        return self._result(exit_code, stdout, stderr, start_time)
+    
+    def _result(
+        self,
+        exit_code: int,
+        stdout: Optional[bytes],
+        stderr: Optional[bytes],
+        start_time: float
+    ) -> ExecutionResult:
+        """Build an ExecutionResult from an exec's exit code and raw output."""
+        return ExecutionResult(
+            stdout=(stdout or b"").decode("utf-8", errors="replace").strip(),
+            stderr=(stderr or b"").decode("utf-8", errors="replace").strip(),
+            exit_code=exit_code,
+            duration_seconds=time.time() - start_time,
+            timed_out=exit_code == self.TIMEOUT_EXIT_CODE
+        )
+    
+    def execute_batch(
+        self,
+        commands: List[str],
+        env: Optional[dict] = None,
+        timeout: Optional[int] = None
+    ) -> List[ExecutionResult]:
+        """
+        Execute several shell commands with a single exec.
+        
+        Each command runs in its own subshell (so an `exit` or a failure
+        doesn't stop the rest) and is followed by a marker line on stdout
+        and stderr; the combined output is split on those markers.
+        
+        Args:
+            commands: Commands to run, in order
+            env: Optional environment variables
+            timeout: Timeout for the whole batch (default: per-command
+                timeout times the number of commands)
+        
+        Returns:
+            One ExecutionResult per command. If the batch stops early
+            (e.g. times out), the command that was running and those
+            after it get the batch's exit code.
+        """
+        if not commands:
+            return []
+        
+        marker = f"===AUTODEV_{uuid.uuid4().hex}==="
+        stamp = f"printf '\\n%s %s %s\\n' '{marker}' \"$rc\" \"$(date +%s.%N)\""
+        script = [f"rc=start; {stamp}"]
+        for command in commands:
+            script.append(f"( {command}\n)")
+            script.append(f"rc=$?; {stamp}; printf '\\n%s\\n' '{marker}' >&2")
+        
+        batch = self.execute("\n".join(script), env=env, timeout=timeout or self.timeout * len(commands))
+        
+        # stdout: "<marker> start T", then per command its output and "<marker> rc T"
+        stamps = ("\n" + batch.stdout).split(f"\n{marker} ")[1:]
+        headers = [part.partition("\n")[0].split() for part in stamps]
+        outputs = [part.partition("\n")[2] for part in stamps]
+        errors = ("\n" + batch.stderr).split(f"\n{marker}")
+        
+        results = []
+        for i in range(len(commands)):
+            if i + 1 < len(headers):
+                rc, end = headers[i + 1]
+                results.append(ExecutionResult(
+                    stdout=outputs[i].strip(),
+                    stderr=errors[i].strip(),
+                    exit_code=int(rc),
+                    duration_seconds=float(end) - float(headers[i][1]),
+                    timed_out=int(rc) == self.TIMEOUT_EXIT_CODE
+                ))
+            else:
+                # The batch stopped before this command finished
+                ran = i + 1 == len(headers)
+                results.append(ExecutionResult(
+                    stdout=outputs[i].strip() if ran else "",
+                    stderr=errors[i].strip() if ran and i < len(errors) else "Not run: the batch stopped early",
+                    exit_code=batch.exit_code,
+                    duration_seconds=0.0,
+                    timed_out=batch.timed_out
+                ))
+        return results
+    
+    def run_pytest(self, test_path: str = ".", extra_args: str = "") -> ExecutionResult:
+        """Run pytest in the session (see DockerSandbox.run_pytest)."""
+        return self.execute(_pytest_command(test_path, extra_args))
+    
+    def run_linter(self, file_path: str = ".") -> ExecutionResult:
+        """Run flake8 in the session (see DockerSandbox.run_linter)."""
+        return self.execute(_linter_command(file_path))
+
+
 class DockerSandbox:
     """
     Docker-based sandbox for safe code execution.
@@ -65,6 +369,12 @@ class DockerSandbox:
         # Execute with mounted directory
         result = sandbox.execute("pytest", mount_path="./my_project")
         
+        # Run several commands in one container
+        with sandbox.session("./my_project") as session:
+            session.install("pip install -q -r requirements.txt")
+            session.execute("python -m compileall -q .")
+            session.run_pytest()
+        
         # Clean up
         sandbox.cleanup()
     """
@@ -73,7 +383,9 @@ class DockerSandbox:
         self,
         image: str = None,
         timeout: int = None,
-        auto_pull: bool = True
+        auto_pull: bool = True,
+        network: str = "none",
+        trusted: bool = False
     ):
         """
         Initialize the Docker sandbox.
@@ -82,13 +394,27 @@ class DockerSandbox:
             image: Docker image to use (default: from config)
             timeout: Command timeout in seconds (default: from config)
             auto_pull: Automatically pull image if not available
+            network: Default container network mode ("none": no network access)
+            trusted: Run execute_python on the host instead of in Docker.
+                Only for code you trust (local development): the process
+                gets CPU/memory limits but no isolation.
         """
         self.image = image or config.DOCKER_IMAGE
         self.timeout = timeout or config.DOCKER_TIMEOUT
         self.auto_pull = auto_pull
+        self.network = network
+        self.trusted = trusted
+        
+        # Resource limits for new containers (see set_limits)
+        self.mem_limit = "512m"
+        self.cpu_quota = 50000  # 50% CPU (per 100000us cpu_period)
         
         self._client: Optional[docker.DockerClient] = None
-        self._container = None
+        self._image_ready = False  # Set once _ensure_image has seen the image
+        
+        # Warm container reused by execute(), keyed by (mount path, workdir, network)
+        self._session: Optional[SandboxSession] = None
+        self._session_key: Optional[Tuple[Optional[str], str, str]] = None
     
     @property
     def client(self) -> docker.DockerClient:
@@ -106,15 +432,24 @@ class DockerSandbox:
         return self._client
     
     def _ensure_image(self):
-        """Ensure the Docker image is available."""
+        """Ensure the Docker image is available (checked once per sandbox)."""
+        if self._image_ready:
+            return
+        
+        # Let a prefetch already pulling this image finish instead of pulling twice
+        prefetch = _PREFETCHES.get(self.image)
+        if prefetch is not None and prefetch is not threading.current_thread():
+            prefetch.join()
+        
         try:
             self.client.images.get(self.image)
         except docker.errors.ImageNotFound:
             if self.auto_pull:
-                print(f"Pulling Docker image: {self.image}...")
+                logger.info("Pulling Docker image: %s...", self.image)
                 self.client.images.pull(self.image)
             else:
                 raise RuntimeError(f"Docker image not found: {self.image}")
+        self._image_ready = True
     
     def execute(
         self,
@@ -122,87 +457,242 @@ class DockerSandbox:
         mount_path: Optional[str] = None,
         workdir: str = "/workspace",
         env: Optional[dict] = None,
-        timeout: Optional[int] = None
+        timeout: Optional[int] = None,
+        network: Optional[str] = None
     ) -> ExecutionResult:
         """
         Execute a command in an isolated Docker container.
         
+        The first call starts a long-lived container that later calls with
+        the same mount exec into, so only the first command pays for
+        container startup. State left behind by one command (e.g. files
+        in /tmp) is visible to the next; cleanup() removes the container.
+        
         Args:
             command: The command to execute
             mount_path: Optional local path to mount into container
             workdir: Working directory inside container
             env: Optional environment variables
             timeout: Override default timeout
+            network: Override the network mode (e.g. INSTALL_NETWORK for pip)
         
         Returns:
             ExecutionResult with stdout, stderr, exit_code
         """
+        session = self._ensure_container(mount_path, workdir, network or self.network)
+        try:
+            return session.execute(command, env=env, timeout=timeout)
+        except RuntimeError:
+            # The container may have died; start a fresh one next time
+            self._remove_container()
+            raise
+    
+    def _ensure_container(self, mount_path: Optional[str], workdir: str, network: str) -> SandboxSession:
+        """Return the warm container for this mount, starting (or replacing) it if needed."""
+        key = (str(Path(mount_path).resolve()) if mount_path else None, workdir, network)
+        if self._session is not None and self._session_key == key:
+            return self._session
+        
+        self._remove_container()
+        container = self._start_container(mount_path, workdir, None, network)
+        self._session = SandboxSession(container, workdir, self.timeout, network)
+        self._session_key = key
+        return self._session
+    
+    def _remove_container(self):
+        """Remove the warm container started by execute(), if any."""
+        if self._session is not None:
+            session, self._session, self._session_key = self._session, None, None
+            _remove(session._container)
+    
+    def _start_container(
+        self,
+        mount_path: Optional[str],
+        workdir: str,
+        env: Optional[dict],
+        network: str,
+        deps_volume: Optional[str] = None,
+        installing: bool = False
+    ):
+        """Start an idle container that commands can be exec'd into."""
         self._ensure_image()
         
-        timeout = timeout or self.timeout
+        try:
+            return self.client.containers.run(
+                self.image,
+                command=["sleep", "infinity"],
+                **self._container_options(mount_path, workdir, env, network, deps_volume, installing)
+            )
+        except docker.errors.ImageNotFound:
+            self._image_ready = False  # Removed since we checked; look again next time
+            raise RuntimeError(f"Docker image not found: {self.image}")
+        except docker.errors.APIError as e:
+            raise RuntimeError(f"Docker API error: {e}")
+    
+    def _container_options(
+        self,
+        mount_path: Optional[str],
+        workdir: str,
+        env: Optional[dict],
+        network: str,
+        deps_volume: Optional[str] = None,
+        installing: bool = False
+    ) -> dict:
+        """
+        Keyword arguments shared by every sandbox container we start.
+        
+        Args:
+            mount_path: Optional local path to mount at `workdir`
+            workdir: Working directory inside the container
+            env: Extra environment variables
+            network: Network mode
+            deps_volume: Session dependency volume to mount at DEPS_DIR
+            installing: An install container: mount the pip cache and the
+                dependency volume read-write, and pip-install into DEPS_DIR
+        """
         volumes = {}
+        environment = {}
+        
+        if installing:
+            # Persistent pip cache, so repeated installs reuse downloaded wheels
+            volumes[PIP_CACHE_VOLUME] = {"bind": PIP_CACHE_DIR, "mode": "rw"}
+            environment.update(PIP_CACHE_DIR=PIP_CACHE_DIR, PIP_USER="1")
+        
+        if deps_volume:
+            volumes[deps_volume] = {"bind": DEPS_DIR, "mode": "rw" if installing else "ro"}
+            environment["PYTHONUSERBASE"] = DEPS_DIR  # Its site-packages go on sys.path
         
         # Mount local directory if specified
         if mount_path:
             mount_path = str(Path(mount_path).resolve())
             volumes[mount_path] = {"bind": workdir, "mode": "rw"}
         
-        start_time = time.time()
-        timed_out = False
+        return dict(
+            volumes=volumes,
+            working_dir=workdir,
+            environment={**environment, **(env or {})},
+            detach=True,
+            auto_remove=True,  # The daemon removes it if it ever exits (e.g. OOM-killed)
+            network_mode=network,  # "none" (no network access) unless installing
+            mem_limit=self.mem_limit,  # Limit memory
+            cpu_period=100000,
+            cpu_quota=self.cpu_quota,  # CPU limit
+        )
+    
+    @contextmanager
+    def session(
+        self,
+        mount_path: Optional[str] = None,
+        workdir: str = "/workspace",
+        env: Optional[dict] = None,
+        network: Optional[str] = None
+    ) -> Iterator[SandboxSession]:
+        """
+        Start one long-lived container and exec commands into it.
         
+        Use this when running several commands against the same mount:
+        the container is created once instead of once per command, and
+        removed when the block exits.
+        
+        Dependencies are installed with session.install(), which runs in
+        a separate networked container sharing a per-session volume with
+        this one (removed with the session).
+        
+        Args:
+            mount_path: Optional local path to mount into container
+            workdir: Working directory inside container
+            env: Optional environment variables for the container
+            network: Override the network mode (to run commands that need
+                the network in this container; call disconnect_network()
+                on the session before running untrusted code)
+        
+        Yields:
+            SandboxSession for executing commands
+        """
+        network = network or self.network
         try:
-            # Run the container
-            container = self.client.containers.run(
-                self.image,
-                command=f"sh -c '{command}'",
-                volumes=volumes,
-                working_dir=workdir,
-                environment=env or {},
-                detach=True,
-                remove=False,  # We'll remove manually after getting logs
-                network_mode="none",  # No network access for security
-                mem_limit="512m",  # Limit memory
-                cpu_period=100000,
-                cpu_quota=50000,  # 50% CPU limit
-            )
-            
-            # Wait for completion with timeout
-            try:
-                result = container.wait(timeout=timeout)
-                exit_code = result.get("StatusCode", -1)
-            except Exception:
-                # Timeout - kill the container
-                timed_out = True
-                container.kill()
-                exit_code = -1
-            
-            # Get logs
-            stdout = container.logs(stdout=True, stderr=False).decode("utf-8", errors="replace")
-            stderr = container.logs(stdout=False, stderr=True).decode("utf-8", errors="replace")
-            
-            # Clean up container
-            container.remove(force=True)
-            
-        except docker.errors.ContainerError as e:
-            stdout = ""
-            stderr = str(e)
-            exit_code = e.exit_status
-            
-        except docker.errors.ImageNotFound:
-            raise RuntimeError(f"Docker image not found: {self.image}")
-            
+            deps_volume = self.client.volumes.create(f"autodev-deps-{uuid.uuid4().hex[:12]}")
         except docker.errors.APIError as e:
             raise RuntimeError(f"Docker API error: {e}")
         
-        duration = time.time() - start_time
+        def installer(command: str, timeout: Optional[int]) -> ExecutionResult:
+            installing = self._start_container(
+                mount_path, workdir, env, INSTALL_NETWORK, deps_volume.name, installing=True
+            )
+            try:
+                return SandboxSession(installing, workdir, self.timeout, INSTALL_NETWORK).execute(
+                    command, timeout=timeout
+                )
+            finally:
+                _remove(installing)
+        
+        try:
+            container = self._start_container(mount_path, workdir, env, network, deps_volume.name)
+            try:
+                yield SandboxSession(container, workdir, self.timeout, network, installer)
+            finally:
+                _remove(container)
+        finally:
+            try:
+                deps_volume.remove(force=True)
+            except docker.errors.APIError:
+                pass  # Still in use by a container being removed; left for `docker volume prune`
+    
+    def set_limits(self, mem_limit: Optional[str] = None, cpu_quota: Optional[int] = None) -> None:
+        """
+        Change the memory/CPU limits for this sandbox's containers.
         
-        return ExecutionResult(
-            stdout=stdout.strip(),
-            stderr=stderr.strip(),
-            exit_code=exit_code,
-            duration_seconds=duration,
-            timed_out=timed_out
-        )
+        The warm container used by execute() is updated in place (its
+        cgroup is reconfigured, no restart); containers started later get
+        the new limits at creation. Unchanged limits cost nothing.
+        
+        Args:
+            mem_limit: Memory limit, e.g. "1g" (None = keep)
+            cpu_quota: CPU quota per 100000us period, e.g. 100000 for one
+                full core (None = keep)
+        """
+        mem_limit = mem_limit or self.mem_limit
+        cpu_quota = cpu_quota or self.cpu_quota
+        if (mem_limit, cpu_quota) == (self.mem_limit, self.cpu_quota):
+            return
+        
+        if self._session is not None:
+            # Keep swap at docker's default of twice the memory limit
+            memswap = docker.utils.parse_bytes(mem_limit) * 2
+            try:
+                self._session._container.update(
+                    mem_limit=mem_limit, memswap_limit=memswap, cpu_quota=cpu_quota
+                )
+            except docker.errors.APIError:
+                self._remove_container()  # Recreated with the new limits next time
+        
+        self.mem_limit, self.cpu_quota = mem_limit, cpu_quota
+    
+    def execute_batch(
+        self,
+        commands: List[str],
+        mount_path: Optional[str] = None,
+        workdir: str = "/workspace",
+        env: Optional[dict] = None,
+        timeout: Optional[int] = None,
+        network: Optional[str] = None
+    ) -> List[ExecutionResult]:
+        """
+        Execute several commands with a single exec into the warm container.
+        
+        See SandboxSession.execute_batch; the other arguments are as for
+        execute().
+        
+        Returns:
+            One ExecutionResult per command
+        """
+        session = self._ensure_container(mount_path, workdir, network or self.network)
+        try:
+            return session.execute_batch(commands, env=env, timeout=timeout)
+        except RuntimeError:
+            # The container may have died; start a fresh one next time
+            self._remove_container()
+            raise
     
     def execute_python(
         self,
@@ -219,49 +709,92 @@ class DockerSandbox:
         Returns:
             ExecutionResult
         """
-        # Escape single quotes in the code
-        escaped_code = code.replace("'", "'\\''")
-        command = f"python -c '{escaped_code}'"
-        return self.execute(command, mount_path)
+        if self.trusted:
+            return self._execute_python_on_host(code, mount_path)
+        
+        session = self._ensure_container(mount_path, "/workspace", self.network)
+        try:
+            return session.execute_python(code)
+        except RuntimeError:
+            # The container may have died; start a fresh one next time
+            self._remove_container()
+            raise
+    
+    def _execute_python_on_host(self, code: str, mount_path: Optional[str]) -> ExecutionResult:
+        """Trusted mode: run code with this interpreter, skipping Docker entirely."""
+        start_time = time.time()
+        try:
+            completed = subprocess.run(
+                [sys.executable, "-"],
+                input=code.encode("utf-8"),
+                capture_output=True,
+                cwd=mount_path or None,
+                timeout=self.timeout,
+                preexec_fn=_limit_trusted_process(self.timeout) if os.name == "posix" else None
+            )
+        except subprocess.TimeoutExpired as e:
+            return ExecutionResult(
+                stdout=(e.stdout or b"").decode("utf-8", errors="replace").strip(),
+                stderr=(e.stderr or b"").decode("utf-8", errors="replace").strip(),
+                exit_code=SandboxSession.TIMEOUT_EXIT_CODE,
+                duration_seconds=time.time() - start_time,
+                timed_out=True
+            )
+        
+        return ExecutionResult(
+            stdout=completed.stdout.decode("utf-8", errors="replace").strip(),
+            stderr=completed.stderr.decode("utf-8", errors="replace").strip(),
+            exit_code=completed.returncode,
+            duration_seconds=time.time() - start_time
+        )
     
     def run_pytest(
         self,
         test_path: str = ".",
         mount_path: Optional[str] = None,
-        extra_args: str = ""
+        extra_args: str = "",
+        network: Optional[str] = None
     ) -> ExecutionResult:
         """
         Run pytest in the sandbox.
         
+        Without network access (the tests are untrusted code), so the image
+        needs pytest installed (see sandbox.Dockerfile).
+        
         Args:
             test_path: Path to tests (relative to mounted workspace)
             mount_path: Local path to mount
             extra_args: Additional pytest arguments
+            network: Override the network mode (INSTALL_NETWORK lets a
+                missing pytest be pip-installed)
         
         Returns:
             ExecutionResult
         """
-        # First install pytest if not in image
-        command = f"pip install -q pytest && python -m pytest {test_path} -v {extra_args}"
-        return self.execute(command, mount_path)
+        return self.execute(_pytest_command(test_path, extra_args), mount_path, network=network)
     
     def run_linter(
         self,
         file_path: str = ".",
-        mount_path: Optional[str] = None
+        mount_path: Optional[str] = None,
+        network: Optional[str] = None
     ) -> ExecutionResult:
         """
         Run flake8 linter in the sandbox.
         
+        Without network access by default, so the image needs flake8
+        installed (see sandbox.Dockerfile).
+        
         Args:
             file_path: Path to lint (relative to mounted workspace)
             mount_path: Local path to mount
+            network: Override the network mode (INSTALL_NETWORK lets a
+                missing flake8 be pip-installed)
         
         Returns:
             ExecutionResult
         """
-        command = f"pip install -q flake8 && python -m flake8 {file_path} --max-line-length=100"
-        return self.execute(command, mount_path)
+        return self.execute(_linter_command(file_path), mount_path, network=network)
     
     def check_docker_available(self) -> Tuple[bool, str]:
         """
@@ -278,12 +811,60 @@ class DockerSandbox:
             return False, f"Docker is not available: {e}"
     
     def cleanup(self):
-        """Clean up Docker client resources."""
+        """Remove the warm container and clean up Docker client resources."""
+        self._remove_container()
         if self._client:
             self._client.close()
             self._client = None
 
 
+def prefetch_image(image: Optional[str] = None) -> None:
+    """
+    Pull the sandbox image in a background thread if it isn't present.
+    
+    Call this when a run starts: on a fresh machine the pull then overlaps
+    cloning and LLM calls instead of blocking the first test run.
+    DockerSandbox waits for an in-flight prefetch of its image. Errors
+    (e.g. Docker not running) are ignored; the sandbox reports them when
+    it is actually used.
+    
+    Args:
+        image: Docker image to pull (default: from config)
+    """
+    image = image or config.DOCKER_IMAGE
+    
+    def pull():
+        sandbox = DockerSandbox(image=image)
+        try:
+            sandbox._ensure_image()
+        except Exception:
+            pass
+        finally:
+            sandbox.cleanup()
+    
+    with _PREFETCH_LOCK:
+        running = _PREFETCHES.get(image)
+        if running is not None and running.is_alive():
+            return
+        thread = threading.Thread(target=pull, name=f"prefetch-{image}", daemon=True)
+        _PREFETCHES[image] = thread
+        thread.start()
+
+
+# Sandboxes reused by execute_command, keyed by (image, timeout); each has
+# a lock because a sandbox's warm container is swapped when the mount changes
+_POOL: Dict[Tuple[str, int], Tuple[DockerSandbox, threading.Lock]] = {}
+_POOL_LOCK = threading.Lock()
+
+
+def _cleanup_pool():
+    """Remove the pooled sandboxes' containers (registered with atexit)."""
+    with _POOL_LOCK:
+        for sandbox, _ in _POOL.values():
+            sandbox.cleanup()
+        _POOL.clear()
+
+
 # Convenience function for simple one-off execution
 def execute_command(
     command: str,
@@ -293,6 +874,10 @@ def execute_command(
     """
     Execute a command in a Docker sandbox (convenience function).
     
+    Repeated calls share one DockerSandbox per (image, timeout), so they
+    reuse its Docker client and warm container instead of starting a new
+    one each time. The containers are removed at exit.
+    
     Args:
         command: Command to execute
         mount_path: Optional path to mount
@@ -301,14 +886,19 @@ def execute_command(
     Returns:
         ExecutionResult
     """
-    sandbox = DockerSandbox(timeout=timeout)
-    try:
+    key = (config.DOCKER_IMAGE, timeout)
+    with _POOL_LOCK:
+        if key not in _POOL:
+            if not _POOL:
+                atexit.register(_cleanup_pool)
+            _POOL[key] = (DockerSandbox(timeout=timeout), threading.Lock())
+        sandbox, lock = _POOL[key]
+    
+    with lock:
         return sandbox.execute(command, mount_path)
-    finally:
-        sandbox.cleanup()
 
 
-# Test script
+# Test script (from the repo root: python -m tools.docker_sandbox)
 if __name__ == "__main__":
     print("=== Docker Sandbox Test ===\n")
     
@@ -3,13 +3,21 @@ File System Tools for the Self-Healing Agent System.
 
 Provides controlled file operations for the AI agents:
 - list_files: Recursive directory listing with smart filtering
-- read_file: Read file content with line numbers
-- write_file: Safe file writing with backup
+- read_file: Read file content with line numbers (cached until the file changes)
+- write_file: Atomic file writing with backup
 """
 
+import fnmatch
+import io
 import os
+import re
+import shutil
+import stat
+import uuid
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 
 # Directories to ignore when scanning
@@ -39,21 +47,41 @@ IGNORE_FILES = {
     "*.dylib",
 }
 
+# The ignore lists as anchored regexes, so glob entries like "*.pyc" match
+# (a plain `name in IGNORE_FILES` only matches the literal names)
+_IGNORE_DIRS_RE = re.compile("|".join(fnmatch.translate(p) for p in sorted(IGNORE_DIRS)))
+_IGNORE_FILES_RE = re.compile("|".join(fnmatch.translate(p) for p in sorted(IGNORE_FILES)))
+
+
+# Recent list_files results: key -> ((directory, mtime_ns) pairs read, files)
+SCAN_CACHE_SIZE = 16
+_SCAN_CACHE: Dict[tuple, Tuple[List[Tuple[str, int]], List[str]]] = {}
+
 
 def list_files(
     path: str,
-    extensions: Optional[List[str]] = None,
+    extensions: Optional[Iterable[str]] = None,
     max_depth: Optional[int] = None,
-    include_hidden: bool = False
+    include_hidden: bool = False,
+    limit: Optional[int] = None
 ) -> List[str]:
     """
     Recursively list all files in a directory with smart filtering.
     
+    The tree is walked breadth-first with os.scandir, which gets the file
+    type from the directory listing instead of a stat() per entry.
+    Symlinked directories are not followed (no extra stat(), and no
+    symlink loops). With a limit, the walk stops as soon as enough files
+    are found, and the shallowest files are kept. Repeat calls are served
+    from a cache, checked with one stat() per directory.
+    
     Args:
         path: Root directory path to scan
-        extensions: Optional list of file extensions to include (e.g., ['.py', '.js'])
+        extensions: Optional file extensions to include (e.g., ['.py', '.js']);
+            pass a frozenset to skip re-normalizing on every call
         max_depth: Maximum recursion depth (None = unlimited)
         include_hidden: Whether to include hidden files/directories
+        limit: Stop after this many files (None = unlimited)
     
     Returns:
         List of relative file paths from the root directory
@@ -71,49 +99,97 @@ def list_files(
     if not root.is_dir():
         raise NotADirectoryError(f"Not a directory: {path}")
     
+    # Normalize once so each file is a single set lookup
+    if extensions and not isinstance(extensions, frozenset):
+        extensions = frozenset(ext.lower() for ext in extensions)
+    
+    # A repeat scan is reused while no directory it read has changed
+    # (adding, removing or renaming an entry updates the directory's mtime)
+    key = (str(root), extensions or None, max_depth, include_hidden, limit)
+    cached = _SCAN_CACHE.get(key)
+    if cached is not None and _dirs_unchanged(cached[0]):
+        return list(cached[1])
+    
+    dir_mtimes, files = _walk(root, extensions, max_depth, include_hidden, limit)
+    
+    _SCAN_CACHE.pop(key, None)
+    if len(_SCAN_CACHE) >= SCAN_CACHE_SIZE:
+        _SCAN_CACHE.pop(next(iter(_SCAN_CACHE)))  # Drop the oldest scan
+    _SCAN_CACHE[key] = (dir_mtimes, files)
+    return list(files)
+
+
+def _dirs_unchanged(dir_mtimes: List[Tuple[str, int]]) -> bool:
+    """Check that each directory still has the mtime it had when it was scanned."""
+    try:
+        return all(os.stat(dir_path).st_mtime_ns == mtime_ns for dir_path, mtime_ns in dir_mtimes)
+    except OSError:
+        return False  # Removed or no longer accessible
+
+
+def _walk(
+    root: Path,
+    extensions: Optional[frozenset],
+    max_depth: Optional[int],
+    include_hidden: bool,
+    limit: Optional[int]
+) -> Tuple[List[Tuple[str, int]], List[str]]:
+    """
+    The list_files walk.
+    
+    Returns:
+        ((directory, mtime_ns) for every directory read, sorted relative file paths)
+    """
     files: List[str] = []
+    dir_mtimes: List[Tuple[str, int]] = []
+    
+    # Locals for the per-entry checks below
+    skip_hidden = not include_hidden
+    ignore_dir = _IGNORE_DIRS_RE.match
+    ignore_file = _IGNORE_FILES_RE.match
     
-    def should_ignore_dir(dir_name: str) -> bool:
-        """Check if directory should be ignored."""
-        if not include_hidden and dir_name.startswith("."):
-            return True
-        return dir_name in IGNORE_DIRS
-    
-    def should_ignore_file(file_name: str) -> bool:
-        """Check if file should be ignored."""
-        if not include_hidden and file_name.startswith("."):
-            return True
-        return file_name in IGNORE_FILES
-    
-    def scan_directory(current_path: Path, depth: int = 0):
-        """Recursively scan directory."""
-        if max_depth is not None and depth > max_depth:
-            return
+    # Directories still to scan: (absolute path, relative prefix, depth)
+    pending = deque([(str(root), "", 0)])
+    
+    while pending:
+        dir_path, prefix, depth = pending.popleft()
+        descend = max_depth is None or depth < max_depth
         
         try:
-            for entry in current_path.iterdir():
-                if entry.is_dir():
-                    if not should_ignore_dir(entry.name):
-                        scan_directory(entry, depth + 1)
-                elif entry.is_file():
-                    if should_ignore_file(entry.name):
-                        continue
-                    
-                    # Filter by extension if specified
-                    if extensions:
-                        if entry.suffix.lower() not in [ext.lower() for ext in extensions]:
-                            continue
-                    
-                    # Store relative path
-                    rel_path = entry.relative_to(root)
-                    files.append(str(rel_path).replace("\\", "/"))
-                    
+            # mtime first, so a change made during the scan invalidates it
+            dir_mtimes.append((dir_path, os.stat(dir_path).st_mtime_ns))
+            with os.scandir(dir_path) as it:
+                entries = list(it)
         except PermissionError:
             # Skip directories we can't access
-            pass
-    
-    scan_directory(root)
-    return sorted(files)
+            continue
+        
+        if limit is not None:
+            # Make the truncated result deterministic
+            entries.sort(key=lambda e: e.name)
+        
+        for entry in entries:
+            name = entry.name
+            if skip_hidden and name[0] == ".":
+                continue
+            
+            if entry.is_dir(follow_symlinks=False):
+                if descend and not ignore_dir(name):
+                    pending.append((entry.path, f"{prefix}{name}/", depth + 1))
+            elif entry.is_file():
+                if ignore_file(name):
+                    continue
+                
+                # Filter by extension if specified
+                if extensions and os.path.splitext(name)[1].lower() not in extensions:
+                    continue
+                
+                # Store relative path
+                files.append(prefix + name)
+                if limit is not None and len(files) >= limit:
+                    return dir_mtimes, sorted(files)
+    
+    return dir_mtimes, sorted(files)
 
 
 def read_file(path: str, with_line_numbers: bool = True) -> str:
@@ -141,30 +217,51 @@ def read_file(path: str, with_line_numbers: bool = True) -> str:
     """
     file_path = Path(path).resolve()
     
-    if not file_path.exists():
+    try:
+        st = file_path.stat()
+    except FileNotFoundError:
         raise FileNotFoundError(f"File not found: {path}")
     
-    if not file_path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         raise IsADirectoryError(f"Not a file: {path}")
     
-    try:
-        content = file_path.read_text(encoding="utf-8")
-    except UnicodeDecodeError:
-        # Try with latin-1 as fallback
-        content = file_path.read_text(encoding="latin-1")
-    
+    # mtime/size/inode in the key: a file changed on disk misses the cache.
+    # The inode catches a same-size rewrite within one coarse mtime tick,
+    # since write_file replaces the file (a new inode every write).
+    return _read_file_cached(str(file_path), st.st_mtime_ns, st.st_size, st.st_ino, with_line_numbers)
+
+
+@lru_cache(maxsize=256)
+def _read_file_cached(path: str, mtime_ns: int, size: int, inode: int, with_line_numbers: bool) -> str:
+    """Read and format a file; cached by read_file on (path, mtime, size, inode)."""
     if not with_line_numbers:
-        return content
-    
-    # Add line numbers
-    lines = content.split("\n")
-    width = len(str(len(lines)))  # Calculate padding width
-    numbered_lines = [
-        f"{i+1:>{width}}: {line}"
-        for i, line in enumerate(lines)
-    ]
-    
-    return "\n".join(numbered_lines)
+        file_path = Path(path)
+        try:
+            return file_path.read_text(encoding="utf-8")
+        except UnicodeDecodeError:
+            # Try with latin-1 as fallback
+            return file_path.read_text(encoding="latin-1")
+    
+    # Number the cached plain text rather than reading and decoding the
+    # file again (the Developer asks for both forms of the same files)
+    content = _read_file_cached(path, mtime_ns, size, inode, False)
+    
+    # Add line numbers, streaming lines into one buffer (no list of lines)
+    width = len(str(content.count("\n") + 1))  # Calculate padding width
+    buf = io.StringIO()
+    write = buf.write
+    number = 0
+    for number, line in enumerate(io.StringIO(content), 1):  # Lines keep their "\n"
+        write(str(number).rjust(width))
+        write(": ")
+        write(line)
+    
+    # A trailing newline (or an empty file) leaves one more, empty line
+    if not content or content.endswith("\n"):
+        write(str(number + 1).rjust(width))
+        write(": ")
+    
+    return buf.getvalue()
 
 
 def write_file(
@@ -176,6 +273,10 @@ def write_file(
     """
     Write content to a file with optional backup.
     
+    The content goes to a temporary file in the same directory, which
+    then replaces the target, so a failed write (disk full, crash)
+    never leaves a half-written file behind.
+    
     Args:
         path: Path to the file to write
         content: Content to write to the file
@@ -209,15 +310,30 @@ def write_file(
     # Create backup if requested and file exists
     if backup and file_existed:
         backup_path = str(file_path) + ".backup"
-        import shutil
         shutil.copy2(file_path, backup_path)
     
-    # Write the content
-    bytes_written = file_path.write_text(content, encoding="utf-8")
+    # Encode once (same newline translation as text mode), for the write and the byte count
+    if os.linesep != "\n":
+        content = content.replace("\n", os.linesep)
+    encoded = content.encode("utf-8")
+    
+    # Write the content to a temporary sibling, then swap it in
+    # (os.open's 0o666 is subject to the umask, like a normal file creation)
+    tmp_path = file_path.with_name(f".{file_path.name}.{uuid.uuid4().hex[:8]}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(encoded)
+        if file_existed:
+            shutil.copymode(file_path, tmp_path)  # Keep e.g. the executable bit
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
     
     return {
         "path": str(file_path),
-        "bytes_written": len(content.encode("utf-8")),
+        "bytes_written": len(encoded),
         "backup_path": backup_path,
         "created": not file_existed
     }
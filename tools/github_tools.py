@@ -2,29 +2,100 @@
 GitHub Tools for the Self-Healing Agent System.
 
 Provides Git and GitHub operations:
-- clone_repo: Clone a repository locally
+- clone_repo: Clone a repository locally (aclone_repo: async version)
 - checkout_branch: Create or switch branches
+- commit_and_push: Commit and push in a single git subprocess pipeline
 - push_pr: Push changes and create a Pull Request
+- apush_pr: Create or update a Pull Request without blocking the event loop
 
-Uses GitPython for local Git operations and PyGithub for API calls.
+Uses GitPython for local Git operations and PyGithub for API calls
+(gidgethub over httpx for the async PR path).
 """
 
+import asyncio
+import getpass
 import os
 import re
 import shutil
+import socket
+import subprocess
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple
 from dataclasses import dataclass
 
-from git import Repo, GitCommandError
-from github import Github, GithubException
+import httpx
+from gidgethub import BadRequest, RateLimitExceeded, GitHubException as AsyncGitHubException
+from gidgethub.httpx import GitHubAPI
+from git import Repo, GitCommandError, Head, RemoteReference
+from github import Github, GithubException, GithubRetry
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
 from config import config
+from tools.rate_limiter import PR_WRITE_LIMITER
 
 
-@dataclass
+@lru_cache(maxsize=None)
+def _get_client(token: str) -> Github:
+    """
+    Shared PyGithub client for a token.
+    
+    Reusing one client keeps its HTTP session (and pooled, already
+    authenticated TLS connections) across calls and nodes. Requests that
+    hit a gateway error (502/503/504) are retried with backoff; GithubRetry
+    is urllib3's Retry plus waiting out GitHub's 403 rate-limit replies.
+    """
+    retry = GithubRetry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+    return Github(token, per_page=100, pool_size=10, retry=retry)
+
+
+@lru_cache(maxsize=32)
+def _get_repo(token: str, full_name: str):
+    """
+    Shared PyGithub Repository for "owner/name".
+    
+    get_repo() costs a GET /repos/{owner}/{name} round-trip; PR calls
+    only need the object to address the repo, so it is fetched once.
+    Call .update() on it for current metadata (a conditional request).
+    """
+    return _get_client(token).get_repo(full_name)
+
+
+# One async client per event loop: httpx connections can't move between
+# loops, and each asyncio.run() (CLI runs, web jobs) has its own
+_ASYNC_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _async_client() -> httpx.AsyncClient:
+    """Shared httpx client for the running event loop (keeps connections alive)."""
+    loop = asyncio.get_running_loop()
+    client = _ASYNC_CLIENTS.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=30,
+            limits=httpx.Limits(max_keepalive_connections=20)
+        )
+        _ASYNC_CLIENTS[loop] = client
+    return client
+
+
+async def aclose_async_client() -> None:
+    """
+    Close the running event loop's shared httpx client, if it has one.
+    
+    Call it before the loop ends (e.g. at the end of the coroutine passed
+    to asyncio.run), so its connections are released rather than left
+    for the garbage collector.
+    """
+    client = _ASYNC_CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+@dataclass(frozen=True, slots=True)
 class CloneResult:
     """Result of cloning a repository."""
     success: bool
@@ -37,7 +108,7 @@ class CloneResult:
         return f"{status} {self.message}\n  Path: {self.local_path}\n  Branch: {self.branch}"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PRResult:
     """Result of creating a Pull Request."""
     success: bool
@@ -52,10 +123,20 @@ class PRResult:
         return f"{status} {self.message}"
 
 
+# parse_github_url patterns, compiled once
+_TOKEN_RE = re.compile(r'https://[^@]+@github\.com/')
+_HTTPS_RE = re.compile(r"https?://github\.com/([^/]+)/([^/]+?)(?:\.git)?$")
+_SSH_RE = re.compile(r"git@github\.com:([^/]+)/([^/]+?)(?:\.git)?$")
+
+
+@lru_cache(maxsize=256)
 def parse_github_url(url: str) -> Tuple[str, str]:
     """
     Parse a GitHub URL to extract owner and repo name.
     
+    Results are cached: the same origin URL is parsed on every push and
+    PR. Invalid URLs aren't cached (the ValueError is raised each time).
+    
     Args:
         url: GitHub repository URL (HTTPS or SSH format, with or without token)
     
@@ -70,27 +151,36 @@ def parse_github_url(url: str) -> Tuple[str, str]:
         >>> parse_github_url("https://token@github.com/owner/repo.git")
         ('owner', 'repo')
     """
+    # Fast path for the common https://github.com/owner/repo[.git] form
+    if url.startswith("https://github.com/"):
+        owner, _, repo_name = url[19:].removesuffix(".git").partition("/")
+        if owner and repo_name and "/" not in repo_name:
+            return owner, repo_name
+    
     # First, strip any embedded token from the URL
     # Handle: https://TOKEN@github.com/owner/repo
-    url_cleaned = re.sub(r'https://[^@]+@github\.com/', 'https://github.com/', url)
+    url_cleaned = _TOKEN_RE.sub('https://github.com/', url)
     
     # HTTPS format: https://github.com/owner/repo.git
-    https_match = re.match(r"https?://github\.com/([^/]+)/([^/]+?)(?:\.git)?$", url_cleaned)
+    https_match = _HTTPS_RE.match(url_cleaned)
     if https_match:
         return https_match.group(1), https_match.group(2)
     
     # SSH format: git@github.com:owner/repo.git
-    ssh_match = re.match(r"git@github\.com:([^/]+)/([^/]+?)(?:\.git)?$", url_cleaned)
+    ssh_match = _SSH_RE.match(url_cleaned)
     if ssh_match:
         return ssh_match.group(1), ssh_match.group(2)
     
     raise ValueError(f"Invalid GitHub URL format: {url_cleaned}")
 
 
+@lru_cache(maxsize=64)
 def get_auth_url(url: str, token: str) -> str:
     """
     Add authentication token to GitHub URL for cloning.
     
+    Cached, as the same origin URL is rewritten on every push.
+    
     Args:
         url: Original GitHub URL
         token: GitHub Personal Access Token
@@ -100,10 +190,54 @@ def get_auth_url(url: str, token: str) -> str:
     """
     # Only modify HTTPS URLs
     if url.startswith("https://github.com/"):
-        return url.replace("https://github.com/", f"https://{token}@github.com/")
+        return f"https://{token}@{url[8:]}"  # After "https://"
     return url
 
 
+# Config for new clones (`git clone -c` also saves it in the clone, so
+# later fetches and pushes use it too):
+# - protocol v2: the server only advertises the refs asked for (older
+#   git defaults to v0, which lists every ref first)
+# - skipping negotiation: fewer round-trips on refreshing fetches
+# - low-speed limit: give up on a connection stalled below 1 KB/s for 60s
+#   instead of hanging the run
+# - no file:// transport: a cloned repo (or its submodules) can't pull in
+#   paths from this machine (the route of clone-time exploits such as
+#   CVE-2024-32002)
+CLONE_CONFIG = [
+    "-c", "protocol.version=2",
+    "-c", "fetch.negotiationAlgorithm=skipping",
+    "-c", "http.lowSpeedLimit=1000",
+    "-c", "http.lowSpeedTime=60",
+    "-c", "protocol.file.allow=never",
+]
+
+
+# Submodules fetched in parallel when cloning (with config.CLONE_SUBMODULES)
+SUBMODULE_JOBS = 8
+
+
+def _remote_default_branch(repo: Repo) -> str:
+    """
+    Name of origin's default branch (what HEAD points to on the remote).
+    
+    Raises:
+        GitCommandError: If the remote can't be queried or has no HEAD
+    """
+    # Output: "ref: refs/heads/main\tHEAD" followed by "<sha>\tHEAD"
+    for line in repo.git.ls_remote("--symref", "origin", "HEAD").splitlines():
+        if line.startswith("ref: "):
+            return line[len("ref: "):].split("\t", 1)[0].removeprefix("refs/heads/")
+    raise GitCommandError(["git", "ls-remote", "--symref", "origin", "HEAD"], 1,
+                          b"origin has no default branch")
+
+
+@lru_cache(maxsize=256)
+def _resolve(path: str) -> str:
+    """Absolute, symlink-free form of a path (cached: resolving stats every component)."""
+    return str(Path(path).resolve())
+
+
 def clone_repo(
     url: str,
     local_path: Optional[str] = None,
@@ -117,7 +251,8 @@ def clone_repo(
         url: GitHub repository URL
         local_path: Local path to clone to (default: ./workspace/repo_name)
         branch: Specific branch to clone (default: default branch)
-        force: If True, remove existing directory before cloning
+        force: If True, overwrite an existing directory (a clone of the
+            same repo is reset in place, anything else is removed)
     
     Returns:
         CloneResult with status and details
@@ -134,33 +269,56 @@ def clone_repo(
     
     # Determine local path
     if local_path is None:
-        workspace = Path(config.WORK_DIR)
-        workspace.mkdir(parents=True, exist_ok=True)
-        local_path = str(workspace / repo_name)
-    
-    local_path = str(Path(local_path).resolve())
+        workspace = _resolve(config.WORK_DIR)
+        Path(workspace).mkdir(parents=True, exist_ok=True)
+        local_path = os.path.join(workspace, repo_name)
+    else:
+        local_path = _resolve(local_path)
     
     # Handle existing directory
     if Path(local_path).exists():
-        if force:
-            shutil.rmtree(local_path)
-        else:
-            # Check if it's already the right repo
+        # Check if it's already the right repo
+        try:
+            existing_repo = Repo(local_path)
+            existing_remote = _origin_url(local_path)
+        except Exception:
+            existing_repo = None
+        
+        if existing_repo is not None and owner in existing_remote and repo_name in existing_remote:
+            # Same repo - fetch the latest commit and move the base branch
+            # onto it (a partial clone keeps its blob filter on fetch).
+            # Branches from previous runs (e.g. the auto-dev feature branch)
+            # are left where they were pushed, so later pushes still
+            # fast-forward. With force, ignored files go too, leaving a clean
+            # checkout without deleting the tree and cloning it all again.
             try:
-                existing_repo = Repo(local_path)
-                existing_remote = existing_repo.remotes.origin.url
-                if owner in existing_remote and repo_name in existing_remote:
-                    # Same repo - just pull latest
-                    existing_repo.remotes.origin.pull()
-                    return CloneResult(
-                        success=True,
-                        local_path=local_path,
-                        branch=existing_repo.active_branch.name,
-                        message=f"Repository already exists, pulled latest changes"
+                existing_repo.git.fetch("origin", branch or "HEAD")
+                base = branch or _remote_default_branch(existing_repo)
+                existing_repo.git.checkout("--force", "-B", base, "FETCH_HEAD")
+                existing_repo.git.clean("-xfd" if force else "-fd")
+                if config.CLONE_SUBMODULES and os.path.exists(os.path.join(local_path, ".gitmodules")):
+                    existing_repo.git.submodule(
+                        "update", "--init", "--recursive", "--depth=1", f"--jobs={SUBMODULE_JOBS}"
                     )
-            except Exception:
-                pass
+            except GitCommandError as e:
+                return CloneResult(
+                    success=False,
+                    local_path=local_path,
+                    branch="",
+                    message=f"Git refresh failed: {e.stderr}"
+                )
             
+            head = existing_repo.head
+            return CloneResult(
+                success=True,
+                local_path=local_path,
+                branch="" if head.is_detached else head.reference.name,
+                message=f"Repository already exists, fetched latest changes"
+            )
+        
+        if force:
+            shutil.rmtree(local_path)
+        else:
             return CloneResult(
                 success=False,
                 local_path=local_path,
@@ -173,11 +331,32 @@ def clone_repo(
         # Add token for authentication if available
         auth_url = get_auth_url(url, config.GITHUB_TOKEN) if config.GITHUB_TOKEN else url
         
-        clone_kwargs = {"depth": 1}  # Shallow clone for speed
+        # Blobless partial clone: full history of commits and trees, but
+        # file contents are only downloaded when checked out. Nearly as
+        # fast as depth=1, and new commits push without unshallowing.
+        clone_kwargs = {
+            "filter": "blob:none",
+            "single_branch": True,
+        }
+        if config.CLONE_SUBMODULES:
+            # Opt-in: submodule URLs come from the (untrusted) repo, and
+            # this runs on the host. Shallow, SUBMODULE_JOBS at a time.
+            clone_kwargs.update(
+                recurse_submodules=True,
+                shallow_submodules=True,
+                jobs=SUBMODULE_JOBS,
+            )
         if branch:
             clone_kwargs["branch"] = branch
         
-        repo = Repo.clone_from(auth_url, local_path, **clone_kwargs)
+        # The -c options are our constants, not user input
+        repo = Repo.clone_from(
+            auth_url,
+            local_path,
+            multi_options=CLONE_CONFIG,
+            allow_unsafe_options=True,
+            **clone_kwargs
+        )
         
         return CloneResult(
             success=True,
@@ -195,6 +374,30 @@ def clone_repo(
         )
 
 
+async def aclone_repo(
+    url: str,
+    local_path: Optional[str] = None,
+    branch: Optional[str] = None,
+    force: bool = False
+) -> CloneResult:
+    """
+    Async version of clone_repo (runs it in a worker thread).
+    
+    Several repos can be cloned at once with
+    asyncio.gather(*(aclone_repo(url) for url in urls)).
+    
+    Args:
+        url: GitHub repository URL
+        local_path: Local path to clone to (default: ./workspace/repo_name)
+        branch: Specific branch to clone (default: default branch)
+        force: If True, overwrite an existing directory (as clone_repo)
+    
+    Returns:
+        CloneResult with status and details
+    """
+    return await asyncio.to_thread(clone_repo, url, local_path, branch, force)
+
+
 def checkout_branch(
     local_path: str,
     branch_name: str,
@@ -222,10 +425,13 @@ def checkout_branch(
             repo.heads[branch_name].checkout()
             return True, f"Switched to existing branch: {branch_name}"
         
-        # Check if branch exists remotely
-        remote_ref = f"origin/{branch_name}"
-        if remote_ref in [ref.name for ref in repo.refs]:
-            repo.create_head(branch_name, remote_ref).checkout()
+        # Check if branch exists remotely (resolves just this ref, rather
+        # than listing every ref in the repo)
+        remote_ref = RemoteReference(repo, f"refs/remotes/origin/{branch_name}")
+        if remote_ref.is_valid():
+            head = repo.create_head(branch_name, remote_ref)
+            head.set_tracking_branch(remote_ref)  # Pushes need no -u
+            head.checkout()
             return True, f"Checked out remote branch: {branch_name}"
         
         # Create new branch
@@ -243,7 +449,8 @@ def checkout_branch(
 def commit_changes(
     local_path: str,
     message: str,
-    add_all: bool = True
+    add_all: bool = True,
+    repo: Optional[Repo] = None
 ) -> Tuple[bool, str]:
     """
     Stage and commit changes in a repository.
@@ -252,25 +459,31 @@ def commit_changes(
         local_path: Path to the local repository
         message: Commit message
         add_all: If True, stage all changes
+        repo: Already opened Repo for local_path (opened here if None)
     
     Returns:
         Tuple of (success, message/commit_hash)
     """
-    try:
-        repo = Repo(local_path)
-    except Exception as e:
-        return False, f"Not a valid Git repository: {e}"
+    if repo is None:
+        try:
+            repo = Repo(local_path)
+        except Exception as e:
+            return False, f"Not a valid Git repository: {e}"
     
     try:
         if add_all:
             repo.git.add(A=True)
         
-        # Check if there are changes to commit
-        if not repo.is_dirty() and not repo.untracked_files:
+        # Check if there are changes to commit (one git status run covers
+        # both modified and untracked files)
+        if not repo.git.status("--porcelain", "-z", "--untracked-files=normal"):
             return False, "No changes to commit"
         
-        commit = repo.index.commit(message)
-        return True, str(commit.hexsha)[:8]
+        # git itself rather than repo.index.commit(), which loads and
+        # rewrites the whole index in Python (hooks are skipped either way).
+        # Falls back to user@hostname when no identity is configured.
+        repo.git.commit("-m", message, "--quiet", "--no-verify", env=_identity_env(repo))
+        return True, repo.git.rev_parse("--short=8", "HEAD")
         
     except GitCommandError as e:
         return False, f"Commit failed: {e.stderr}"
@@ -279,7 +492,8 @@ def commit_changes(
 def push_branch(
     local_path: str,
     branch_name: str,
-    force: bool = False
+    force: bool = False,
+    repo: Optional[Repo] = None
 ) -> Tuple[bool, str]:
     """
     Push a branch to the remote repository.
@@ -287,36 +501,227 @@ def push_branch(
     Args:
         local_path: Path to the local repository
         branch_name: Branch to push
-        force: Force push if True
+        force: Force push if True (with lease: fails if the remote branch
+            moved since it was last fetched)
+        repo: Already opened Repo for local_path (opened here if None)
     
     Returns:
         Tuple of (success, message)
     """
-    try:
-        repo = Repo(local_path)
-    except Exception as e:
-        return False, f"Not a valid Git repository: {e}"
+    if repo is None:
+        try:
+            repo = Repo(local_path)
+        except Exception as e:
+            return False, f"Not a valid Git repository: {e}"
     
     try:
         origin = repo.remotes.origin
         
-        # Update remote URL with token for authentication
+        # Update remote URL with token for authentication (only once: an
+        # unchanged URL would still rewrite .git/config)
         if config.GITHUB_TOKEN:
             current_url = origin.url
             auth_url = get_auth_url(current_url, config.GITHUB_TOKEN)
-            origin.set_url(auth_url)
+            if auth_url != current_url:
+                origin.set_url(auth_url)
         
-        push_args = {"u": True}  # Set upstream
+        push_args = ["--atomic", "--no-verify"]  # No pre-push hooks, as in commit_changes
         if force:
-            push_args["force"] = True
+            # Only overwrite what we last saw on the remote
+            push_args.append("--force-with-lease")
+        
+        # Set upstream on the first push only (not a config write every time)
+        if Head(repo, f"refs/heads/{branch_name}").tracking_branch() is None:
+            push_args.append("--set-upstream")
         
-        origin.push(branch_name, **push_args)
+        repo.git.push(*push_args, "origin", branch_name)
         return True, f"Pushed {branch_name} to origin"
         
     except GitCommandError as e:
         return False, f"Push failed: {e.stderr}"
 
 
+# Stage, commit (if anything changed) and push in one bash process.
+# Arguments are passed positionally ($1 message, $2 branch, $3 auth URL),
+# so nothing user-supplied is ever interpolated into the script.
+@lru_cache(maxsize=1)
+def _fallback_identity() -> Tuple[str, str]:
+    """
+    (name, email) to commit as when git has no identity configured.
+    
+    Fresh containers and CI hosts usually have no user.name/user.email,
+    and the git CLI refuses to commit without them; this is the
+    user@hostname that GitPython's index.commit() falls back to.
+    """
+    try:
+        user = getpass.getuser()
+    except Exception:  # No passwd entry for the uid (common in containers)
+        user = "auto-dev"
+    return user, f"{user}@{socket.gethostname() or 'localhost'}"
+
+
+def _identity_env(repo: Repo) -> dict:
+    """
+    GIT_AUTHOR_*/GIT_COMMITTER_* for the identity parts git has no config for.
+    
+    The same fallback the commit/push script applies; variables already
+    set in the environment win.
+    """
+    name, email = _fallback_identity()
+    reader = repo.config_reader()
+    env = {}
+    for key, fallback in (("name", name), ("email", email)):
+        if not reader.has_option("user", key):
+            for role in ("AUTHOR", "COMMITTER"):
+                var = f"GIT_{role}_{key.upper()}"
+                env[var] = os.environ.get(var) or fallback
+    return env
+
+
+# --no-verify: never run hooks from the cloned (untrusted) repo on the host.
+# $4/$5 are the fallback name/email, used only where git (and the
+# environment) has none configured.
+_COMMIT_AND_PUSH_SCRIPT = """
+set -e
+if [ -n "$3" ]; then git remote set-url origin "$3"; fi
+if ! git config user.name >/dev/null; then
+    export GIT_AUTHOR_NAME="${GIT_AUTHOR_NAME:-$4}" GIT_COMMITTER_NAME="${GIT_COMMITTER_NAME:-$4}"
+fi
+if ! git config user.email >/dev/null; then
+    export GIT_AUTHOR_EMAIL="${GIT_AUTHOR_EMAIL:-$5}" GIT_COMMITTER_EMAIL="${GIT_COMMITTER_EMAIL:-$5}"
+fi
+git add -A
+if git diff --cached --quiet; then
+    echo "No changes to commit"
+else
+    git commit -q --no-verify -m "$1"
+    echo "Committed $(git rev-parse --short=8 HEAD)"
+fi
+git push -q --no-verify -u origin "$2"
+echo "Pushed $2 to origin"
+"""
+
+
+def commit_and_push(
+    local_path: str,
+    message: str,
+    branch_name: str
+) -> Tuple[bool, str]:
+    """
+    Stage all changes, commit them and push the branch in one subprocess.
+    
+    Equivalent to commit_changes() followed by push_branch(), but with a
+    single fork/exec instead of one per git command. Having nothing to
+    commit is not an error; the branch is still pushed.
+    
+    Args:
+        local_path: Path to the local repository
+        message: Commit message
+        branch_name: Branch to push (upstream is set to origin)
+    
+    Returns:
+        Tuple of (success, output) - output has one line per step, e.g.
+        "Committed 1a2b3c4d" / "No changes to commit" and "Pushed ... to origin"
+    """
+    try:
+        auth_url = _push_auth_url(local_path)
+    except Exception as e:
+        return False, f"Not a valid Git repository: {e}"
+    
+    try:
+        result = subprocess.run(
+            ["bash", "-c", _COMMIT_AND_PUSH_SCRIPT, "bash", message, branch_name, auth_url,
+             *_fallback_identity()],
+            cwd=local_path,
+            capture_output=True,
+            text=True
+        )
+    except OSError as e:
+        return False, f"Could not run git: {e}"
+    
+    return _commit_and_push_result(result.returncode, result.stdout, result.stderr)
+
+
+async def acommit_and_push(
+    local_path: str,
+    message: str,
+    branch_name: str
+) -> Tuple[bool, str]:
+    """
+    Async version of commit_and_push (runs git without blocking the event loop).
+    
+    Args:
+        local_path: Path to the local repository
+        message: Commit message
+        branch_name: Branch to push (upstream is set to origin)
+    
+    Returns:
+        Tuple of (success, output), as commit_and_push
+    """
+    try:
+        auth_url = _push_auth_url(local_path)
+    except Exception as e:
+        return False, f"Not a valid Git repository: {e}"
+    
+    try:
+        process = await asyncio.create_subprocess_exec(
+            "bash", "-c", _COMMIT_AND_PUSH_SCRIPT, "bash", message, branch_name, auth_url,
+            *_fallback_identity(),
+            cwd=local_path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await process.communicate()
+    except OSError as e:
+        return False, f"Could not run git: {e}"
+    
+    return _commit_and_push_result(process.returncode, stdout.decode(), stderr.decode())
+
+
+def _push_auth_url(local_path: str) -> str:
+    """
+    Token-authenticated origin URL to set before pushing, or "" if not needed.
+    
+    Read from .git/config (no subprocess), cached until it changes.
+    """
+    if not config.GITHUB_TOKEN:
+        return ""
+    origin_url = _origin_url(local_path)
+    if config.GITHUB_TOKEN in origin_url:
+        return ""
+    return get_auth_url(origin_url, config.GITHUB_TOKEN)
+
+
+def _origin_url(local_path: str) -> str:
+    """
+    URL of the repository's origin remote.
+    
+    Cached until .git/config changes (one stat() instead of opening the
+    repo and parsing its config files on every push and PR).
+    """
+    try:
+        st = os.stat(os.path.join(local_path, ".git", "config"))
+    except OSError:
+        # Not a plain clone (or not a repo at all): read it directly
+        return Repo(local_path).remotes.origin.url
+    return _origin_url_cached(local_path, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=64)
+def _origin_url_cached(local_path: str, mtime_ns: int, size: int) -> str:
+    """Read the origin URL; cached by _origin_url on .git/config's (mtime, size)."""
+    return Repo(local_path).remotes.origin.url
+
+
+def _commit_and_push_result(returncode: int, stdout: str, stderr: str) -> Tuple[bool, str]:
+    """Turn the commit/push script's exit status and output into (success, message)."""
+    output = stdout.strip()
+    if returncode != 0:
+        error = stderr.strip() or output
+        return False, f"Commit/push failed: {error}"
+    return True, output
+
+
 def push_pr(
     local_path: str,
     title: str,
@@ -341,8 +746,7 @@ def push_pr(
     """
     try:
         repo = Repo(local_path)
-        origin_url = repo.remotes.origin.url
-        owner, repo_name = parse_github_url(origin_url)
+        owner, repo_name = parse_github_url(_origin_url(local_path))
     except Exception as e:
         return PRResult(
             success=False,
@@ -354,10 +758,23 @@ def push_pr(
     if not branch_name:
         branch_name = repo.active_branch.name
     
+    # Look up an existing PR for this branch while committing and pushing
+    lookup = None
+    if config.GITHUB_TOKEN:
+        lookup = _LOOKUP_POOL.submit(
+            _find_open_pr,
+            config.GITHUB_TOKEN,
+            owner,
+            repo_name,
+            branch_name,
+            base_branch
+        )
+    
     # Commit any pending changes
     commit_success, commit_msg = commit_changes(
         local_path,
-        f"auto-dev: {title}"
+        f"auto-dev: {title}",
+        repo=repo
     )
     
     if not commit_success and "No changes" not in commit_msg:
@@ -369,7 +786,7 @@ def push_pr(
         )
     
     # Push the branch
-    push_success, push_msg = push_branch(local_path, branch_name)
+    push_success, push_msg = push_branch(local_path, branch_name, repo=repo)
     if not push_success:
         return PRResult(
             success=False,
@@ -379,7 +796,7 @@ def push_pr(
         )
     
     # Create Pull Request via GitHub API
-    if not config.GITHUB_TOKEN:
+    if lookup is None:
         return PRResult(
             success=False,
             pr_url=None,
@@ -388,17 +805,8 @@ def push_pr(
         )
     
     try:
-        g = Github(config.GITHUB_TOKEN)
-        gh_repo = g.get_repo(f"{owner}/{repo_name}")
-        
-        # Check if PR already exists for this branch
-        existing_prs = gh_repo.get_pulls(
-            state="open",
-            head=f"{owner}:{branch_name}",
-            base=base_branch
-        )
-        
-        for pr in existing_prs:
+        pr = lookup.result()
+        if pr is not None:
             # Update existing PR
             pr.edit(title=title, body=body)
             return PRResult(
@@ -409,6 +817,7 @@ def push_pr(
             )
         
         # Create new PR
+        gh_repo = _get_repo(config.GITHUB_TOKEN, f"{owner}/{repo_name}")
         pr = gh_repo.create_pull(
             title=title,
             body=body,
@@ -432,6 +841,224 @@ def push_pr(
         )
 
 
+# Runs push_pr's PR lookups alongside its commit and push
+_LOOKUP_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="pr-lookup")
+
+
+def _find_open_pr(token: str, owner: str, repo_name: str, branch_name: str, base_branch: str):
+    """First open PR from owner:branch_name into base_branch, or None."""
+    gh_repo = _get_repo(token, f"{owner}/{repo_name}")
+    existing_prs = gh_repo.get_pulls(
+        state="open",
+        head=f"{owner}:{branch_name}",
+        base=base_branch
+    )
+    for pr in existing_prs:
+        return pr
+    return None
+
+
+async def apush_pr(
+    local_path: str,
+    title: str,
+    body: str,
+    branch_name: str,
+    base_branch: str = "main",
+    push=None
+) -> PRResult:
+    """
+    Create (or update) a Pull Request without blocking the event loop.
+    
+    Unlike push_pr this doesn't commit or push itself. Pass the push as
+    `push` (e.g. acommit_and_push(...)): the lookup for an existing PR
+    runs while it does, and the PR is only created once it succeeded.
+    API calls reuse the event loop's shared HTTP client.
+    
+    Args:
+        local_path: Path to the local repository
+        title: PR title
+        body: PR description (use the plan here)
+        branch_name: Branch to create PR from
+        base_branch: Target branch for the PR
+        push: Optional awaitable returning (success, message)
+    
+    Returns:
+        PRResult with PR URL and details
+    """
+    try:
+        owner, repo_name = parse_github_url(_origin_url(local_path))
+    except Exception as e:
+        if push is not None:
+            await push  # Still run what the caller asked for
+        return PRResult(
+            success=False,
+            pr_url=None,
+            pr_number=None,
+            message=f"Repository error: {e}"
+        )
+    
+    if not config.GITHUB_TOKEN:
+        if push is not None:
+            await push
+        return PRResult(
+            success=False,
+            pr_url=None,
+            pr_number=None,
+            message="GitHub token not configured. Cannot create PR."
+        )
+    
+    pulls_url = f"/repos/{owner}/{repo_name}/pulls"
+    
+    gh = GitHubAPI(_async_client(), "auto-dev", oauth_token=config.GITHUB_TOKEN)
+    
+    # Check if PR already exists for this branch (overlaps the push)
+    lookup = asyncio.ensure_future(_afind_open_pr(gh, owner, repo_name, branch_name, base_branch))
+    
+    if push is not None:
+        push_success = False
+        try:
+            push_success, push_msg = await push
+        finally:
+            if not push_success:
+                # Failed or raised: no PR to make, so drop the lookup
+                _discard(lookup)
+        if not push_success:
+            return PRResult(
+                success=False,
+                pr_url=None,
+                pr_number=None,
+                message=push_msg
+            )
+    
+    try:
+        existing_number = await lookup
+        
+        if existing_number is not None:
+            # Update existing PR
+            pr = await _write_pr(
+                gh,
+                "patch",
+                f"{pulls_url}/{existing_number}",
+                {"title": title, "body": body}
+            )
+            message = f"Updated existing PR #{pr['number']}"
+        else:
+            # Create new PR
+            pr = await _write_pr(
+                gh,
+                "post",
+                pulls_url,
+                {"title": title, "body": body, "head": branch_name, "base": base_branch}
+            )
+            message = f"Created PR #{pr['number']}"
+        
+        return PRResult(
+            success=True,
+            pr_url=pr["html_url"],
+            pr_number=pr["number"],
+            message=message
+        )
+        
+    except (AsyncGitHubException, httpx.HTTPError) as e:
+        return PRResult(
+            success=False,
+            pr_url=None,
+            pr_number=None,
+            message=f"GitHub API error: {e}"
+        )
+
+
+def _discard(task: "asyncio.Future") -> None:
+    """Cancel a task nobody will await, without an "exception never retrieved" warning."""
+    task.cancel()
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+
+# Open PRs for a head/base branch pair. Only the numbers (and head owners,
+# as headRefName alone would also match same-named branches on forks)
+_OPEN_PR_QUERY = """
+query($owner: String!, $name: String!, $head: String!, $base: String!) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(headRefName: $head, baseRefName: $base, states: OPEN, first: 10) {
+      nodes { number headRepositoryOwner { login } }
+    }
+  }
+}
+"""
+
+
+async def _afind_open_pr(
+    gh: GitHubAPI,
+    owner: str,
+    repo_name: str,
+    branch_name: str,
+    base_branch: str
+) -> Optional[int]:
+    """
+    Number of the open PR from owner:branch_name into base_branch, or None.
+    
+    One GraphQL query returning just the PR numbers, instead of the REST
+    pulls list with every PR's full JSON.
+    """
+    data = await gh.graphql(
+        _OPEN_PR_QUERY,
+        owner=owner,
+        name=repo_name,
+        head=branch_name,
+        base=base_branch
+    )
+    repository = data.get("repository")
+    if repository is None:
+        raise AsyncGitHubException(f"Repository {owner}/{repo_name} not found or not accessible")
+    for node in repository["pullRequests"]["nodes"]:
+        head_owner = node["headRepositoryOwner"]
+        if head_owner and head_owner["login"].lower() == owner.lower():
+            return node["number"]
+    return None
+
+
+# GitHub doesn't always send Retry-After on secondary limits; it asks
+# clients to wait at least a minute before retrying
+SECONDARY_LIMIT_BACKOFF = 60
+
+
+async def _write_pr(gh: GitHubAPI, method: str, url: str, data: dict) -> dict:
+    """
+    Send a PR create/update through the PR write rate limiter.
+    
+    Pauses the limiter when GitHub says the primary limit is used up
+    (X-RateLimit-Remaining == 0, until X-RateLimit-Reset) and retries
+    once after a 403 rate-limit response.
+    
+    Args:
+        gh: gidgethub client
+        method: "post" or "patch"
+        url: API URL
+        data: Request body
+    
+    Returns:
+        Decoded response body
+    """
+    for attempt in range(2):
+        await PR_WRITE_LIMITER.acquire()
+        try:
+            result = await getattr(gh, method)(url, data=data)
+        except RateLimitExceeded as e:
+            PR_WRITE_LIMITER.block_until(e.rate_limit.reset_datetime.timestamp())
+            if attempt:
+                raise
+            continue
+        except BadRequest as e:
+            if e.status_code != 403 or "rate limit" not in str(e).lower() or attempt:
+                raise
+            PR_WRITE_LIMITER.block_for(SECONDARY_LIMIT_BACKOFF)
+            continue
+        
+        if gh.rate_limit is not None and gh.rate_limit.remaining == 0:
+            PR_WRITE_LIMITER.block_until(gh.rate_limit.reset_datetime.timestamp())
+        return result
+
+
 def get_repo_info(url: str) -> dict:
     """
     Get information about a GitHub repository.
@@ -447,8 +1074,11 @@ def get_repo_info(url: str) -> dict:
     
     try:
         owner, repo_name = parse_github_url(url)
-        g = Github(config.GITHUB_TOKEN)
-        repo = g.get_repo(f"{owner}/{repo_name}")
+        repo = _get_repo(config.GITHUB_TOKEN, f"{owner}/{repo_name}")
+        
+        # Conditional GET (If-None-Match with the cached ETag): an unchanged
+        # repo answers 304, which doesn't count against the rate limit
+        repo.update()
         
         return {
             "name": repo.name,
@@ -464,7 +1094,7 @@ def get_repo_info(url: str) -> dict:
         return {"error": str(e)}
 
 
-# Test script
+# Test script (from the repo root: python -m tools.github_tools)
 if __name__ == "__main__":
     print("=== GitHub Tools Test ===\n")
     
@@ -0,0 +1,79 @@
+"""
+Rate limiting for GitHub API writes.
+
+GitHub's secondary rate limits apply to content-creating requests
+(opening or editing PRs). Going over them costs a 403 and a cooldown of
+a minute or more, so PR writes wait on a token bucket instead, and the
+bucket is paused whenever GitHub reports the limit is exhausted.
+
+Usage:
+    from tools.rate_limiter import PR_WRITE_LIMITER
+    await PR_WRITE_LIMITER.acquire()
+"""
+
+import asyncio
+import threading
+import time
+
+from logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class TokenBucket:
+    """
+    Token bucket that refills at `rate_per_hour`, holding up to `burst` tokens.
+
+    Thread-safe and not tied to an event loop (runs started with separate
+    asyncio.run calls share it). Each acquire() reserves a token up front,
+    so concurrent callers queue up at the refill rate instead of all
+    waking at once.
+    """
+
+    def __init__(self, rate_per_hour: float, burst: int = 1):
+        self.rate = rate_per_hour / 3600.0  # Tokens per second
+        self.burst = burst
+
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0  # time.monotonic() before which nothing is allowed
+
+    def _reserve(self) -> float:
+        """Take a token (possibly borrowing from the future); return seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._blocked_until - now)
+
+    async def acquire(self) -> float:
+        """
+        Wait until a request is allowed.
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self._reserve()
+        if wait > 0:
+            logger.info("   ⏳ GitHub rate limit: waiting %.0fs...", wait)
+            await asyncio.sleep(wait)
+        return wait
+
+    def block_for(self, seconds: float) -> None:
+        """Allow no requests for the next `seconds` (e.g. from Retry-After)."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    def block_until(self, epoch_seconds: float) -> None:
+        """Allow no requests until a wall-clock time (e.g. from X-RateLimit-Reset)."""
+        self.block_for(epoch_seconds - time.time())
+
+
+# GitHub advises staying well under its content-creation limits
+# (~80/minute, 500/hour); PR writes are rare, so be conservative
+PR_WRITE_LIMITER = TokenBucket(rate_per_hour=30, burst=5)